@@ -0,0 +1,40 @@
+"""
+GAME OF LIFE - Conway's Game of Life
+Menggunakan ADT Array sesuai spesifikasi dokumen
+
+Paket ini hanya memuat engine, aturan, dan I/O file saat diimpor; GUI
+(tkinter), NumPy, dan process pool baru dimuat ketika benar-benar dipakai.
+Modul lain diimpor langsung: game_of_life.gui, .console, .cli, .bench,
+.ensemble, .worker, .service (asyncio).
+
+Menjalankan program: python -m game_of_life [argumen CLI headless]
+"""
+
+from .adt import Array, ArrayIterator, Grid
+from .rules import RULES, LifeRule, parse_rule
+from .engines import (BOUNDARIES, ActiveSetEngine, BitsetEngine, NumpyEngine, PythonEngine,
+                      SparseEngine)
+from .parallel import ParallelEngine
+from .stats import GenerationStats, StatsFileSink, StatsStream
+from .profiling import PROFILER, Profiler
+from .core import (ENGINES, CycleDetector, CycleInfo, GameOfLife, GenerationHistory,
+                   create_engine, describe_cycle)
+from .hashlife import HashLife
+from .patterns import PATTERNS, setup_pattern
+from .fileio import (AutoCheckpointer, load_checkpoint, load_pattern_file, save_checkpoint,
+                     save_pattern_file, write_plaintext, write_rle)
+
+__all__ = [
+    "Array", "ArrayIterator", "Grid",
+    "RULES", "LifeRule", "parse_rule",
+    "BOUNDARIES", "ActiveSetEngine", "BitsetEngine", "NumpyEngine", "PythonEngine",
+    "SparseEngine", "ParallelEngine",
+    "GenerationStats", "StatsFileSink", "StatsStream",
+    "PROFILER", "Profiler",
+    "ENGINES", "CycleDetector", "CycleInfo", "GameOfLife", "GenerationHistory",
+    "create_engine", "describe_cycle",
+    "HashLife",
+    "PATTERNS", "setup_pattern",
+    "AutoCheckpointer", "load_checkpoint", "load_pattern_file", "save_checkpoint",
+    "save_pattern_file", "write_plaintext", "write_rle",
+]
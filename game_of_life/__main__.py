@@ -0,0 +1,7 @@
+"""python -m game_of_life: menu interaktif, atau CLI headless jika diberi argumen"""
+
+import sys
+
+from .cli import run
+
+sys.exit(run())
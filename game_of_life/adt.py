@@ -0,0 +1,266 @@
+"""ADT Array dan Grid sesuai spesifikasi dokumen"""
+
+import array
+
+# ==================== ADT ARRAY ====================
+class Array:
+    """
+    Kelas untuk merepresentasikan array satu dimensi.
+    Tanpa typecode elemen disimpan di list Python (boleh bernilai apa saja);
+    dengan typecode (misalnya "B") elemen disimpan di array.array bertipe
+    sehingga iterasi, pengisian massal, dan slicing dikerjakan di C.
+    """
+    
+    __slots__ = ("_size", "_elements", "typecode")
+    
+    def __init__(self, size, typecode=None):
+        """
+        Membuat array dengan ukuran tertentu
+        Args:
+            size: ukuran array (harus > 0)
+            typecode: kode tipe array.array (None: list Python, elemen awal None)
+        """
+        if size <= 0:
+            raise ValueError("Ukuran array harus lebih besar dari 0")
+        self._size = size
+        self.typecode = typecode
+        if typecode is None:
+            self._elements = [None] * size
+        else:
+            self._elements = array.array(typecode, [0]) * size
+    
+    @classmethod
+    def _wrap(cls, elements, typecode):
+        """Membuat Array di atas penyimpanan yang sudah ada (list, array.array, atau memoryview)"""
+        result = cls.__new__(cls)
+        result._size = len(elements)
+        result._elements = elements
+        result.typecode = typecode
+        return result
+    
+    def length(self):
+        """Mengembalikan panjang array"""
+        return self._size
+    
+    def getitem(self, index):
+        """Mengembalikan nilai pada indeks tertentu"""
+        if index < 0 or index >= self._size:
+            raise IndexError("Indeks di luar rentang array")
+        return self._elements[index]
+    
+    def setitem(self, index, value):
+        """Mengubah nilai pada indeks tertentu"""
+        if index < 0 or index >= self._size:
+            raise IndexError("Indeks di luar rentang array")
+        self._elements[index] = value
+    
+    def clearing(self, value):
+        """Mengosongkan array dengan nilai tertentu (sekali salin blok, bukan per elemen)"""
+        if self.typecode is None:
+            self._elements[:] = [value] * self._size
+        else:
+            self._elements[:] = array.array(self.typecode, [value]) * self._size
+    
+    def _slice(self, index):
+        """Salinan potongan array sebagai Array baru"""
+        elements = self._elements[index]
+        if isinstance(elements, memoryview):
+            elements = array.array(self.typecode, elements.tobytes())
+        if not len(elements):
+            raise ValueError("Potongan array tidak boleh kosong")
+        return Array._wrap(elements, self.typecode)
+    
+    def __getitem__(self, index):
+        """Operator [] untuk mendapatkan nilai; slice menghasilkan Array baru"""
+        if index.__class__ is slice:
+            return self._slice(index)
+        if index < 0 or index >= self._size:
+            raise IndexError("Indeks di luar rentang array")
+        return self._elements[index]
+    
+    def __setitem__(self, index, value):
+        """Operator [] untuk mengubah nilai; slice mengganti isi tanpa mengubah panjang"""
+        if index.__class__ is not slice:
+            if index < 0 or index >= self._size:
+                raise IndexError("Indeks di luar rentang array")
+            self._elements[index] = value
+            return
+        if len(range(*index.indices(self._size))) != len(value):
+            raise ValueError("Panjang nilai tidak sesuai dengan potongan array")
+        if isinstance(value, Array):
+            value = value._elements
+        if self.typecode is not None:
+            if isinstance(value, memoryview) and isinstance(self._elements, array.array):
+                value = array.array(self.typecode, value.tobytes())
+            elif not isinstance(value, (array.array, memoryview)):
+                value = array.array(self.typecode, value)
+        self._elements[index] = value
+    
+    def __len__(self):
+        """Operator len() untuk mendapatkan panjang array"""
+        return self._size
+    
+    def __iter__(self):
+        """Membuat iterator untuk array (iterator bawaan penyimpanan, berjalan di C)"""
+        return iter(self._elements)
+    
+    def memoryview(self):
+        """
+        Memoryview tanpa salinan atas isi array bertipe, misalnya untuk
+        numpy.asarray(array.memoryview())
+        """
+        if self.typecode is None:
+            raise TypeError("Array tanpa typecode tidak memiliki buffer")
+        return memoryview(self._elements)
+    
+    def __buffer__(self, flags):
+        """Protokol buffer (Python 3.12+): memoryview(array) dan numpy.asarray(array)"""
+        return self.memoryview()
+
+
+class ArrayIterator:
+    """
+    Iterator untuk array. Array.__iter__ kini memakai iterator bawaan
+    penyimpanannya; kelas ini tetap tersedia untuk kode yang membuat
+    ArrayIterator(elements) secara langsung.
+    """
+    
+    def __init__(self, elements):
+        self._elements = elements
+        self._index = 0
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        if self._index < len(self._elements):
+            value = self._elements[self._index]
+            self._index += 1
+            return value
+        else:
+            raise StopIteration
+
+
+# ==================== ADT GRID ====================
+class Grid:
+    """
+    Kelas untuk merepresentasikan grid 2D menggunakan Array.
+    Dengan typecode seluruh grid disimpan di satu buffer array.array yang
+    bersambung; setiap baris adalah Array di atas potongan memoryview buffer
+    tersebut, sehingga grid dapat diserahkan ke NumPy tanpa salinan.
+    """
+    
+    __slots__ = ("_rows", "_cols", "_grid", "_buffer", "typecode")
+    
+    def __init__(self, rows, cols, typecode=None):
+        """
+        Membuat grid dengan jumlah baris dan kolom tertentu
+        Args:
+            rows: jumlah baris
+            cols: jumlah kolom
+            typecode: kode tipe array.array (None: baris berupa Array list Python)
+        """
+        self._rows = rows
+        self._cols = cols
+        self.typecode = typecode
+        self._grid = Array(rows)
+        if typecode is None:
+            self._buffer = None
+            for i in range(rows):
+                self._grid[i] = Array(cols)
+        else:
+            self._buffer = array.array(typecode, [0]) * (rows * cols)
+            view = memoryview(self._buffer)
+            for i in range(rows):
+                self._grid[i] = Array._wrap(view[i * cols:(i + 1) * cols], typecode)
+    
+    def rows(self):
+        """Mengembalikan jumlah baris"""
+        return self._rows
+    
+    def cols(self):
+        """Mengembalikan jumlah kolom"""
+        return self._cols
+    
+    def getitem(self, row, col):
+        """Mengembalikan nilai pada posisi (row, col)"""
+        if row < 0 or row >= self._rows or col < 0 or col >= self._cols:
+            raise IndexError("Posisi di luar rentang grid")
+        return self._grid[row][col]
+    
+    def setitem(self, row, col, value):
+        """Mengubah nilai pada posisi (row, col)"""
+        if row < 0 or row >= self._rows or col < 0 or col >= self._cols:
+            raise IndexError("Posisi di luar rentang grid")
+        self._grid[row][col] = value
+    
+    def clear(self, value):
+        """Mengosongkan grid dengan nilai tertentu"""
+        if self._buffer is not None:
+            self._buffer[:] = array.array(self.typecode, [value]) * len(self._buffer)
+        else:
+            for row in self._grid:
+                row.clearing(value)
+    
+    def __getitem__(self, row):
+        """Mengembalikan baris tertentu; slice baris menghasilkan Grid baru"""
+        if row.__class__ is slice:
+            rows = range(*row.indices(self._rows))
+            if not rows:
+                raise ValueError("Potongan grid tidak boleh kosong")
+            result = Grid(len(rows), self._cols, self.typecode)
+            for target, source in enumerate(rows):
+                result._grid[target][:] = self._grid[source]
+            return result
+        return self._grid[row]
+    
+    def __setitem__(self, row, value):
+        """
+        Mengubah seluruh baris (grid bertipe menyalin isi ke buffernya sendiri;
+        nilai selain Array pada grid tanpa typecode dibungkus menjadi Array)
+        """
+        if len(value) != self._cols:
+            raise ValueError("Jumlah kolom tidak sesuai")
+        if self._buffer is not None:
+            self._grid[row][:] = value
+        elif isinstance(value, Array):
+            self._grid[row] = value
+        else:
+            self._grid[row] = Array._wrap(list(value), None)
+    
+    def copy(self):
+        """Membuat salinan grid"""
+        result = Grid(self._rows, self._cols, self.typecode)
+        if self._buffer is not None:
+            result._buffer[:] = self._buffer
+            return result
+        for row in range(self._rows):
+            result._grid[row][:] = self._grid[row]
+        return result
+    
+    def copy_from(self, other):
+        """Menyalin seluruh isi grid lain yang berukuran sama (blok buffer jika keduanya bertipe)"""
+        if (self._buffer is not None and other._buffer is not None and
+                self.typecode == other.typecode):
+            self._buffer[:] = other._buffer
+        else:
+            for row in range(self._rows):
+                self._grid[row][:] = other._grid[row]
+    
+    def memoryview(self):
+        """
+        Memoryview 2D (rows x cols) tanpa salinan atas buffer grid bertipe,
+        misalnya numpy.asarray(grid.memoryview())
+        """
+        if self._buffer is None:
+            raise TypeError("Grid tanpa typecode tidak memiliki buffer")
+        return memoryview(self._buffer).cast("B").cast(self.typecode,
+                                                       [self._rows, self._cols])
+    
+    def __buffer__(self, flags):
+        """Protokol buffer (Python 3.12+): memoryview(grid) dan numpy.asarray(grid)"""
+        return self.memoryview()
+    
+    def __str__(self):
+        """Representasi string dari grid"""
+        return "".join(" ".join(map(str, row)) + " \n" for row in self._grid)
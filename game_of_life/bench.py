@@ -0,0 +1,271 @@
+"""Benchmark headless engine dan waktu impor paket"""
+
+import time
+import os
+import sys
+import gc
+import json
+import random
+import argparse
+import platform
+import subprocess
+import tracemalloc
+
+from .core import ENGINES, GameOfLife
+from .hashlife import HashLife
+from .patterns import PATTERNS, setup_pattern
+
+# ==================== BENCHMARK ====================
+def _benchmark_game(engine, rows, cols):
+    """Membuat objek simulasi untuk benchmark (engine GameOfLife atau HashLife)"""
+    if engine == "hashlife":
+        return HashLife(rows, cols)
+    return GameOfLife(rows, cols, engine=engine)
+
+
+def _release_game(game):
+    """Melepas sumber daya engine (HashLife tidak memilikinya)"""
+    if isinstance(game, GameOfLife):
+        game.close()
+
+
+def benchmark_case(engine, rows, cols, pattern, generations, seed=0):
+    """
+    Mengukur satu kombinasi engine, ukuran grid, dan pola tanpa tampilan apa pun
+    Returns:
+        dict hasil pengukuran
+    """
+    # Putaran 1: waktu murni, tanpa tracemalloc yang memperlambat alokasi. Satu
+    # langkah pemanasan tidak diukur: persiapan malas langkah pertama (misalnya
+    # process pool engine parallel) bukan bagian dari laju per generasi
+    game = setup_pattern(_benchmark_game(engine, rows, cols), pattern, random.Random(seed))
+    try:
+        game.next_generation()
+        gc.collect()
+        collections_before = sum(stat["collections"] for stat in gc.get_stats())
+        start = time.perf_counter()
+        for _ in range(generations):
+            game.next_generation()
+        elapsed = time.perf_counter() - start
+        collections = sum(stat["collections"] for stat in gc.get_stats()) - collections_before
+        population = game.get_population()
+    finally:
+        _release_game(game)
+    
+    # Putaran 2: memori puncak dan alokasi sementara terbesar dalam satu langkah
+    # (puncak selama langkah dikurangi memori terpakai sebelum langkah), sehingga
+    # alokasi yang sudah dibebaskan lagi sebelum langkah selesai tetap terukur.
+    # CPython tidak mencatat jumlah alokasi sementara, jadi alokasi dilaporkan
+    # dalam byte (tracemalloc) ditambah jumlah koleksi GC dari putaran 1.
+    game = setup_pattern(_benchmark_game(engine, rows, cols), pattern, random.Random(seed))
+    try:
+        game.next_generation()
+        tracemalloc.start()
+        peak = step_peak = 0
+        for _ in range(generations):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            game.next_generation()
+            _, step_max = tracemalloc.get_traced_memory()
+            peak = max(peak, step_max)
+            step_peak = max(step_peak, step_max - before)
+        tracemalloc.stop()
+    finally:
+        _release_game(game)
+    
+    elapsed = max(elapsed, 1e-9)
+    return {
+        "engine": engine,
+        "rows": rows,
+        "cols": cols,
+        "pattern": pattern,
+        "seed": seed,
+        "generations": generations,
+        "seconds": elapsed,
+        "generations_per_second": generations / elapsed,
+        "cell_updates_per_second": rows * cols * generations / elapsed,
+        "peak_memory_bytes": peak,
+        "step_allocation_bytes": step_peak,
+        "gc_collections": collections,
+        "final_population": population,
+    }
+
+
+# Modul mahal yang tidak boleh ikut termuat oleh `import game_of_life` (jalur engine saja)
+HEAVY_MODULES = ("tkinter", "numpy", "concurrent.futures", "multiprocessing", "cProfile")
+
+
+def measure_import_time(module="game_of_life", repeat=5):
+    """
+    Mengukur waktu `import module` di interpreter baru (cache modul kosong).
+    Rincian per modul bisa dilihat dengan python -X importtime -c "import game_of_life".
+    Args:
+        module: nama modul yang diimpor
+        repeat: jumlah pengukuran; yang tercepat yang diambil
+    Returns:
+        dict berisi waktu impor (detik) dan HEAVY_MODULES yang ikut termuat
+    """
+    code = ("import sys, time\n"
+            "start = time.perf_counter()\n"
+            f"import {module}\n"
+            "elapsed = time.perf_counter() - start\n"
+            f"print(elapsed, *[name for name in {HEAVY_MODULES!r} if name in sys.modules])")
+    # Paket diimpor dari direktori induknya, sama seperti python -m game_of_life
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    best, heavy = None, []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", code], cwd=root, check=True,
+                                capture_output=True, text=True).stdout.split()
+        if best is None or float(output[0]) < best:
+            best = float(output[0])
+        heavy = output[1:]
+    return {"module": module, "seconds": best, "heavy_modules": heavy}
+
+
+def run_benchmark(engines=None, sizes=((20, 40), (100, 100), (300, 300)),
+                  generations=50, seeds=(0,), output=None, parallel_workers=None):
+    """
+    Menjalankan benchmark headless untuk semua pola preset dan papan acak
+    Args:
+        engines: daftar nama engine (default: semua engine + "hashlife")
+        sizes: daftar ukuran grid (rows, cols)
+        generations: jumlah generasi per kasus
+        seeds: seed untuk papan acak (satu kasus per seed)
+        output: path file JSON hasil (opsional)
+        parallel_workers: daftar jumlah worker ParallelEngine yang dibandingkan
+                          pada ukuran grid terbesar (opsional, lihat
+                          parallel.measure_parallel_speedup)
+    Returns:
+        dict laporan benchmark
+    """
+    if engines is None:
+        engines = list(ENGINES) + ["hashlife"]
+    
+    results = []
+    for engine in engines:
+        for rows, cols in sizes:
+            for pattern in PATTERNS:
+                for seed in (seeds if pattern == "random" else (0,)):
+                    try:
+                        results.append(benchmark_case(engine, rows, cols, pattern,
+                                                      generations, seed))
+                    except ImportError as e:
+                        # Engine opsional yang dependensinya tidak terpasang
+                        print(f"Lewati engine {engine}: {e}")
+                        break
+    
+    report = {
+        "format": 1,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "import": measure_import_time(),
+        "results": results,
+    }
+    if parallel_workers:
+        # Modul parallel baru diimpor jika percepatan multi-core diminta
+        from .parallel import measure_parallel_speedup
+        rows, cols = max(sizes, key=lambda size: size[0] * size[1])
+        speedup = measure_parallel_speedup(rows, cols, generations, parallel_workers,
+                                           seeds[0])
+        report["parallel_speedup"] = {
+            "rows": rows,
+            "cols": cols,
+            "generations": generations,
+            "workers": {str(workers): result for workers, result in speedup.items()},
+        }
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+# Selisih alokasi per langkah (byte) yang masih dianggap derau pengukuran
+STEP_ALLOCATION_SLACK = 64 * 1024
+
+
+def compare_benchmarks(baseline, current, tolerance=0.10):
+    """
+    Membandingkan dua laporan benchmark (dict atau path JSON)
+    Returns:
+        daftar kasus yang generasi per detiknya (atau kecepatan impor paket)
+        turun lebih dari tolerance, atau yang alokasi sementara per langkahnya
+        naik lebih dari tolerance (dan lebih dari STEP_ALLOCATION_SLACK byte)
+    """
+    reports = []
+    for report in (baseline, current):
+        if isinstance(report, str):
+            with open(report, encoding="utf-8") as f:
+                report = json.load(f)
+        reports.append(report)
+    
+    def key(result):
+        return (result["engine"], result["rows"], result["cols"],
+                result["pattern"], result["seed"])
+    
+    old = {key(result): result for result in reports[0]["results"]}
+    regressions = []
+    for result in reports[1]["results"]:
+        before = old.get(key(result))
+        if before is None:
+            continue
+        ratio = result["generations_per_second"] / before["generations_per_second"]
+        if ratio < 1 - tolerance:
+            regressions.append({"case": key(result), "ratio": ratio})
+        # Laporan lama belum memuat alokasi per langkah
+        if "step_allocation_bytes" in before and "step_allocation_bytes" in result:
+            old_bytes, new_bytes = before["step_allocation_bytes"], result["step_allocation_bytes"]
+            if (new_bytes > old_bytes * (1 + tolerance) and
+                    new_bytes - old_bytes > STEP_ALLOCATION_SLACK):
+                regressions.append({"case": key(result) + ("step_allocation_bytes",),
+                                    "ratio": new_bytes / max(old_bytes, 1)})
+    
+    # Laporan format lama belum memuat waktu impor
+    if "import" in reports[0] and "import" in reports[1]:
+        ratio = reports[0]["import"]["seconds"] / reports[1]["import"]["seconds"]
+        if ratio < 1 - tolerance:
+            regressions.append({"case": ("import", reports[1]["import"]["module"]),
+                                "ratio": ratio})
+    return regressions
+
+
+def benchmark_main(argv=None):
+    """Entry point benchmark: python -m game_of_life --benchmark ..."""
+    parser = argparse.ArgumentParser(description="Benchmark headless Game of Life")
+    parser.add_argument("--benchmark", metavar="OUTPUT", default="benchmark.json",
+                        help="file JSON hasil benchmark")
+    parser.add_argument("--engines", nargs="+", help="engine yang diukur")
+    parser.add_argument("--sizes", nargs="+", default=["20x40", "100x100", "300x300"],
+                        help="ukuran grid, misalnya 100x100")
+    parser.add_argument("--generations", type=int, default=50)
+    parser.add_argument("--seeds", nargs="+", type=int, default=[0])
+    parser.add_argument("--baseline", help="laporan lama untuk dibandingkan")
+    parser.add_argument("--parallel-workers", nargs="+", type=int, metavar="N",
+                        help="ukur percepatan engine parallel untuk jumlah worker ini")
+    args = parser.parse_args(argv)
+    
+    sizes = [tuple(int(part) for part in size.lower().split("x")) for size in args.sizes]
+    report = run_benchmark(args.engines, sizes, args.generations, args.seeds, args.benchmark,
+                           args.parallel_workers)
+    for result in report["results"]:
+        size = f"{result['rows']}x{result['cols']}"
+        print(f"{result['engine']:>9} {size:<10} {result['pattern']:<17} "
+              f"{result['generations_per_second']:>10.1f} gen/s")
+    imported = report["import"]
+    print(f"\nImpor {imported['module']}: {imported['seconds'] * 1000:.1f} ms"
+          + (f" (ikut termuat: {', '.join(imported['heavy_modules'])})"
+             if imported["heavy_modules"] else ""))
+    if "parallel_speedup" in report:
+        speedup = report["parallel_speedup"]
+        print(f"\nEngine parallel {speedup['rows']}x{speedup['cols']}:")
+        for workers, result in speedup["workers"].items():
+            print(f"{workers:>4} worker {result['seconds']:>8.3f} s "
+                  f"(percepatan {result['speedup']:.2f}x)")
+    print(f"Hasil disimpan di {args.benchmark}")
+    
+    if args.baseline:
+        regressions = compare_benchmarks(args.baseline, report)
+        for regression in regressions:
+            print(f"Regresi: {regression['case']} ({regression['ratio']:.0%} dari sebelumnya)")
+        return 1 if regressions else 0
+    return 0
@@ -0,0 +1,264 @@
+"""Entry point: menu interaktif, CLI headless, dan benchmark"""
+
+import time
+import sys
+import json
+import random
+import argparse
+
+from .console import run_console_version
+from .core import ENGINES, GameOfLife, describe_cycle
+from .engines import BOUNDARIES
+from .fileio import load_pattern_file, save_checkpoint, save_pattern_file
+from .patterns import PATTERNS, setup_pattern
+from .profiling import PROFILER
+from .rules import RULES
+from .stats import StatsFileSink
+
+# ==================== HEADLESS CLI ====================
+def build_cli_parser():
+    """Membuat parser argumen untuk mode headless (tanpa tampilan, tanpa input())"""
+    parser = argparse.ArgumentParser(
+        description="Menjalankan Game of Life tanpa tampilan, misalnya dari cron atau pipeline",
+        epilog="Tanpa argumen program membuka menu interaktif; "
+               "--benchmark OUTPUT menjalankan benchmark.")
+    parser.add_argument("--rows", type=int, default=30, help="jumlah baris grid")
+    parser.add_argument("--cols", type=int, default=60, help="jumlah kolom grid")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--pattern", choices=PATTERNS, default="random", help="pola preset awal")
+    source.add_argument("--pattern-file", metavar="PATH", help="file pola awal (.rle/.cells)")
+    parser.add_argument("--rule", default="B3/S23",
+                        help="notasi B/S atau nama aturan (" + ", ".join(RULES) + ")")
+    parser.add_argument("--engine", choices=list(ENGINES), default="python")
+    parser.add_argument("--boundary", choices=BOUNDARIES + ("infinite",),
+                        help="mode batas (default: bawaan engine)")
+    parser.add_argument("--generations", type=int, default=100, help="jumlah generasi")
+    parser.add_argument("--seed", type=int, help="seed pola random (default: acak)")
+    parser.add_argument("--stop-on-cycle", action="store_true",
+                        help="berhenti jika pola punah, stabil, atau berulang")
+    parser.add_argument("--stats", metavar="PATH",
+                        help="tulis statistik setiap generasi ke file .csv atau .jsonl")
+    parser.add_argument("--output", metavar="PATH", help="simpan pola akhir (.rle/.cells)")
+    parser.add_argument("--checkpoint", metavar="PATH", help="simpan checkpoint biner akhir")
+    parser.add_argument("--checkpoint-every", type=int, metavar="N",
+                        help="simpan juga checkpoint ke --checkpoint setiap N generasi")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="aktifkan PROFILER dan simpan hasilnya (format pstats)")
+    parser.add_argument("--json", action="store_true", help="cetak ringkasan sebagai JSON")
+    parser.add_argument("--serve", metavar="[HOST:]PORT",
+                        help="bagikan simulasi lewat HTTP (GET /stream, /status; "
+                             "POST /pause, /resume, /stop) selama berjalan")
+    parser.add_argument("--interval", type=float, default=0.0,
+                        help="jeda minimum antar generasi saat --serve (detik)")
+    parser.add_argument("--cells", action="store_true",
+                        help="sertakan daftar sel hidup di setiap frame --serve")
+    return parser
+
+
+def run_headless(game, generations, stop_on_cycle=False):
+    """
+    Menjalankan simulasi secepat engine mampu, tanpa tampilan
+    Args:
+        game: GameOfLife yang sudah berisi pola awal
+        generations: jumlah maksimum generasi
+        stop_on_cycle: berhenti lebih awal jika pola stabil atau berulang
+    Returns:
+        dict ringkasan hasil simulasi
+    """
+    if stop_on_cycle and game.cycle_detector is None:
+        game.enable_cycle_detection()
+    initial = game.get_population()
+    steps = 0
+    start = time.perf_counter()
+    while steps < generations:
+        # Papan kosong juga terdeteksi sebagai still life
+        if stop_on_cycle and game.cycle is not None:
+            break
+        game.next_generation()
+        steps += 1
+    return _summary(game, initial, steps, time.perf_counter() - start)
+
+
+def serve_headless(game, generations, stop_on_cycle=False, address="8765", interval=0.0,
+                   cells=False):
+    """
+    Seperti run_headless, tetapi simulasi dijalankan sebagai SimulationSession
+    yang dibagikan ke klien HTTP (lihat game_of_life.service)
+    Args:
+        address: "PORT" atau "HOST:PORT" (host default 127.0.0.1)
+        interval: jeda minimum antar generasi (detik)
+        cells: sertakan daftar sel hidup di setiap frame
+    Returns:
+        dict ringkasan hasil simulasi
+    """
+    import asyncio
+    from .service import SimulationSession, serve_session
+    
+    host, _, port = address.rpartition(":")
+    session = SimulationSession(game, interval=interval, max_generations=generations,
+                                stop_on_cycle=stop_on_cycle, cells=cells)
+    initial = game.get_population()
+    start = time.perf_counter()
+    asyncio.run(serve_session(
+        session, host or "127.0.0.1", int(port),
+        ready=lambda server: print(f"Melayani http://{server.host}:{server.port}/stream",
+                                   file=sys.stderr)))
+    return _summary(game, initial, session.steps, time.perf_counter() - start)
+
+
+def _summary(game, initial, steps, elapsed):
+    """Ringkasan hasil simulasi headless"""
+    elapsed = max(elapsed, 1e-9)
+    population = game.get_population()
+    return {
+        "engine": game.engine.name,
+        "rule": game.rule.notation,
+        "boundary": game.boundary,
+        "rows": game.rows,
+        "cols": game.cols,
+        "generations": steps,
+        "generation": game.generation,
+        "initial_population": initial,
+        "population": population,
+        "bounding_box": game.bounding_box(),
+        "cycle": describe_cycle(game.cycle) if game.cycle is not None else None,
+        "extinct": population == 0,
+        "seconds": elapsed,
+        "generations_per_second": steps / elapsed,
+    }
+
+
+def _close_checkpointer(game):
+    """Menunggu checkpoint berkala terakhir ditulis lalu mematikannya"""
+    if game.checkpointer is not None:
+        game.checkpointer.close()
+        game.checkpointer = None
+
+
+def cli_main(argv=None):
+    """
+    Entry point headless: python -m game_of_life --rows 100 --generations 500 ...
+    Returns:
+        kode keluar (0 sukses, 1 gagal membaca/menulis file; argumen salah keluar dengan 2)
+    """
+    parser = build_cli_parser()
+    args = parser.parse_args(argv)
+    # kill -USR1 <pid> menyalakan/mematikan profiler saat simulasi berjalan
+    PROFILER.install_signal_toggle()
+    if args.rows <= 0 or args.cols <= 0 or args.generations < 0:
+        parser.error("--rows/--cols harus positif dan --generations tidak negatif")
+    if args.checkpoint_every is not None and (args.checkpoint_every <= 0 or not args.checkpoint):
+        parser.error("--checkpoint-every harus positif dan membutuhkan --checkpoint")
+    try:
+        game = GameOfLife(args.rows, args.cols, engine=args.engine, rule=args.rule,
+                          boundary=args.boundary)
+    except (ValueError, ImportError) as e:
+        parser.error(str(e))
+    
+    sink = None
+    try:
+        if args.pattern_file:
+            load_pattern_file(game, args.pattern_file)
+        else:
+            setup_pattern(game, args.pattern, random.Random(args.seed))
+        if args.stats:
+            sink = StatsFileSink(args.stats)
+            game.enable_stats().subscribe(sink)
+        if args.checkpoint_every:
+            game.enable_checkpoints(args.checkpoint, args.checkpoint_every)
+        if args.profile:
+            PROFILER.enable()
+        
+        if args.serve:
+            summary = serve_headless(game, args.generations, args.stop_on_cycle, args.serve,
+                                     args.interval, args.cells)
+        else:
+            summary = run_headless(game, args.generations, args.stop_on_cycle)
+        
+        if args.profile:
+            PROFILER.disable()
+            PROFILER.dump_stats(args.profile)
+        if args.output:
+            save_pattern_file(game, args.output)
+        if args.checkpoint:
+            # Checkpoint berkala ditutup dulu agar tidak menimpa checkpoint akhir
+            _close_checkpointer(game)
+            save_checkpoint(game, args.checkpoint)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if sink is not None:
+            sink.close()
+        _close_checkpointer(game)
+        game.close()
+    
+    if args.json:
+        print(json.dumps(summary))
+    else:
+        print(f"Engine {summary['engine']}, aturan {summary['rule']}, batas {summary['boundary']}, "
+              f"grid {summary['rows']}x{summary['cols']}")
+        print(f"Generasi: {summary['generation']} ({summary['generations']} dijalankan, "
+              f"{summary['generations_per_second']:.1f} gen/detik)")
+        print(f"Populasi: {summary['initial_population']} -> {summary['population']}")
+        if summary["bounding_box"] is not None:
+            print("Kotak pembatas: ({}, {}) - ({}, {})".format(*summary["bounding_box"]))
+        if summary["extinct"]:
+            print("Semua organisme telah punah!")
+        elif summary["cycle"] is not None:
+            print(summary["cycle"])
+    return 0
+
+
+# ==================== MAIN PROGRAM ====================
+def main():
+    """Fungsi utama untuk menjalankan program"""
+    # kill -USR1 <pid> menyalakan/mematikan profiler saat program berjalan
+    PROFILER.install_signal_toggle()
+    print("=" * 60)
+    print("               CONWAY'S GAME OF LIFE")
+    print("=" * 60)
+    print("\nPilih mode tampilan:")
+    print("1. Console Mode (teks sederhana)")
+    print("2. GUI Mode (antarmuka grafis)")
+    print("3. Keluar")
+    
+    choice = input("\nMasukkan pilihan (1-3): ").strip()
+    
+    if choice == '1':
+        run_console_version()
+    elif choice == '2':
+        print("\nMemulai GUI Mode...")
+        print("Pastikan Anda memiliki tkinter (biasanya sudah terinstall dengan Python)")
+        print("Klik pada grid untuk menempatkan organisme")
+        print("Tekan Start untuk memulai simulasi\n")
+        try:
+            # Modul GUI (dan tkinter) hanya dimuat jika mode GUI dipilih
+            from .gui import GameOfLifeGUI
+            gui = GameOfLifeGUI(rows=30, cols=60, cell_size=15)
+            gui.run()
+        except Exception as e:
+            print(f"Error saat menjalankan GUI: {e}")
+            print("\nMenggunakan console mode sebagai alternatif...")
+            run_console_version()
+    else:
+        print("\nTerima kasih telah menggunakan program Game of Life!")
+        return
+
+
+def run(argv=None):
+    """
+    Memilih mode dari argumen: tanpa argumen menu interaktif, --benchmark
+    menjalankan benchmark, selain itu CLI headless
+    Returns:
+        kode keluar proses
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["--benchmark"]:
+        # Modul benchmark (tracemalloc, subprocess) hanya dimuat untuk --benchmark
+        from .bench import benchmark_main
+        return benchmark_main(argv)
+    if argv:
+        return cli_main(argv)
+    main()
+    return 0
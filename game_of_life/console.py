@@ -0,0 +1,206 @@
+"""Renderer console, loop simulasi console, dan versi console interaktif"""
+
+import time
+import os
+import sys
+
+from .core import GameOfLife, describe_cycle
+from .engines import BOUNDARIES
+from .fileio import load_pattern_file, save_pattern_file
+from .patterns import setup_pattern
+from .profiling import PROFILER
+from .rules import RULES
+
+# ==================== RENDERER CONSOLE ====================
+class ConsoleRenderer:
+    """
+    Renderer console berbasis kode ANSI: setiap frame disusun dalam satu buffer
+    dan hanya baris yang berubah dari frame sebelumnya yang ditulis ulang,
+    tanpa memanggil proses 'clear'/'cls'
+    """
+    
+    ALIVE = "■ "  # Sel hidup
+    DEAD = "□ "  # Sel mati
+    
+    def __init__(self, stream=None):
+        """
+        Args:
+            stream: tujuan keluaran (default: sys.stdout)
+        """
+        self.stream = stream or sys.stdout
+        self._previous = None
+        if os.name == 'nt':
+            os.system('')  # Sekali saja: mengaktifkan kode ANSI di console Windows
+    
+    def reset(self):
+        """Memaksa frame berikutnya digambar penuh"""
+        self._previous = None
+    
+    def frame_lines(self, game):
+        """Menyusun baris-baris teks satu frame"""
+        top, left = game.view_origin()
+        cells = [[self.DEAD] * game.cols for _ in range(game.rows)]
+        for row, col in game.engine.live_cells():
+            if 0 <= row - top < game.rows and 0 <= col - left < game.cols:
+                cells[row - top][col - left] = self.ALIVE
+        
+        border = "=" * (game.cols * 2 + 10)
+        lines = [f"=== Game of Life - Generasi {game.generation} ===", border]
+        lines.extend("".join(line) for line in cells)
+        lines.append(border)
+        return lines
+    
+    def render(self, game):
+        """Menggambar frame: penuh pada frame pertama, selanjutnya hanya baris yang berubah"""
+        lines = self.frame_lines(game)
+        previous = self._previous
+        if previous is None or len(previous) != len(lines):
+            buffer = ["\x1b[2J\x1b[H", "\n".join(lines)]
+        else:
+            buffer = [f"\x1b[{index + 1};1H{line}\x1b[K"
+                      for index, (line, old) in enumerate(zip(lines, previous))
+                      if line != old]
+        # Letakkan kursor tepat di bawah frame
+        buffer.append(f"\x1b[{len(lines) + 1};1H")
+        self.stream.write("".join(buffer))
+        self.stream.flush()
+        self._previous = lines
+
+
+# ==================== SIMULASI CONSOLE ====================
+def display_console(game):
+    """Menampilkan grid di console (hanya baris yang berubah yang ditulis ulang)"""
+    if game.renderer is None:
+        game.renderer = ConsoleRenderer()
+    with PROFILER.phase("render"):
+        game.renderer.render(game)
+
+
+def run_console(game, max_generations=100, delay=0.5, stop_on_cycle=False,
+                render_every=1, profile=False):
+    """
+    Menjalankan simulasi Game of Life di console
+    Args:
+        game: GameOfLife yang sudah berisi pola awal
+        max_generations: maksimum generasi yang akan dijalankan
+        delay: jeda antar frame yang ditampilkan (detik)
+        stop_on_cycle: berhenti lebih awal jika pola stabil atau berulang
+        render_every: tampilkan satu frame setiap N generasi
+                      (generasi di antaranya dihitung tanpa ditampilkan)
+        profile: aktifkan PROFILER dan cetak ringkasan waktu per fase di akhir
+    """
+    if profile:
+        PROFILER.enable()
+    if stop_on_cycle and game.cycle_detector is None:
+        game.enable_cycle_detection()
+    
+    generation = 0
+    while generation < max_generations and not game.is_empty():
+        if stop_on_cycle and game.cycle is not None:
+            break
+        rendered = generation % render_every == 0
+        if rendered:
+            display_console(game)
+        game.next_generation()
+        generation += 1
+        if rendered:
+            time.sleep(delay)
+    
+    display_console(game)
+    if game.is_empty():
+        print("\nSemua organisme telah punah!")
+    elif game.cycle is not None:
+        print(f"\n{describe_cycle(game.cycle)}")
+        print(f"Simulasi selesai setelah {generation} generasi")
+    else:
+        print(f"\nSimulasi selesai setelah {generation} generasi")
+    if profile:
+        PROFILER.disable()
+        print(f"\n{PROFILER.summary()}")
+
+
+# ==================== CONSOLE VERSION ====================
+def run_console_version(engine="python"):
+    """
+    Menjalankan versi console
+    Args:
+        engine: nama engine simulasi yang digunakan
+    """
+    print("=" * 50)
+    print("      SELAMAT DATANG DI GAME OF LIFE (CONSOLE)")
+    print("=" * 50)
+    print("\nGame of Life adalah cellular automaton yang diciptakan")
+    print("oleh matematikawan John Horton Conway pada tahun 1970.")
+    print("\nAturan Permainan:")
+    print("1. Sel hidup dengan 2-3 tetangga hidup tetap hidup")
+    print("2. Sel hidup dengan < 2 tetangga mati (terisolasi)")
+    print("3. Sel hidup dengan > 3 tetangga mati (kelebihan populasi)")
+    print("4. Sel mati dengan tepat 3 tetangga menjadi hidup")
+    print("=" * 50)
+    
+    # Ukuran grid
+    rows, cols = 20, 40
+    
+    # Pilihan pola
+    print("\nPilih pola awal:")
+    print("1. Simple pattern (pola sederhana)")
+    print("2. Block (blok stabil 2x2)")
+    print("3. Oscillator (Blinker - periode 2)")
+    print("4. Glider (bergerak)")
+    print("5. Document example (contoh dari dokumen)")
+    print("6. Random pattern")
+    print("7. Muat dari file (RLE / .cells)")
+    
+    choice = input("\nMasukkan pilihan (1-7): ").strip()
+    
+    rule = input("Aturan B/S (Enter untuk B3/S23, atau: " + ", ".join(RULES) + "): ").strip()
+    boundary = input("Mode batas (Enter untuk bawaan, atau: " + ", ".join(BOUNDARIES) + "): ").strip()
+    
+    # Buat instance Game of Life
+    try:
+        game = GameOfLife(rows, cols, engine=engine, rule=rule or "B3/S23",
+                          boundary=boundary or None)
+    except ValueError as e:
+        print(f"{e}, menggunakan aturan B3/S23 dan batas bawaan")
+        game = GameOfLife(rows, cols, engine=engine)
+    
+    # Setup pola berdasarkan pilihan
+    patterns = {
+        '1': 'simple',
+        '2': 'block',
+        '3': 'oscillator',
+        '4': 'glider',
+        '5': 'document_example',
+        '6': 'random'
+    }
+    
+    if choice in patterns:
+        game = setup_pattern(game, patterns[choice])
+    elif choice == '7':
+        path = input("Path file pola: ").strip()
+        try:
+            load_pattern_file(game, path)
+        except (OSError, ValueError) as e:
+            print(f"Gagal memuat pola: {e}, menggunakan pola default (simple)")
+            game = setup_pattern(game, 'simple')
+    else:
+        print("Pilihan tidak valid, menggunakan pola default (simple)")
+        game = setup_pattern(game, 'simple')
+    
+    # Jalankan simulasi
+    print("\nMemulai simulasi...")
+    print("Tekan Ctrl+C untuk menghentikan simulasi")
+    input("Tekan Enter untuk melanjutkan...")
+    
+    try:
+        run_console(game, max_generations=100, delay=0.2, stop_on_cycle=True)
+    except KeyboardInterrupt:
+        print("\n\nSimulasi dihentikan oleh pengguna.")
+    
+    path = input("\nSimpan pola akhir ke file .rle/.cells (Enter untuk lewati): ").strip()
+    if path:
+        try:
+            save_pattern_file(game, path)
+            print(f"Pola disimpan di {path}")
+        except OSError as e:
+            print(f"Gagal menyimpan pola: {e}")
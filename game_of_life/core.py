@@ -0,0 +1,620 @@
+"""Kelas GameOfLife beserta registry engine, deteksi siklus, dan riwayat"""
+
+import array
+from collections import OrderedDict, deque, namedtuple
+
+from .engines import ActiveSetEngine, BitsetEngine, NumpyEngine, PythonEngine, SparseEngine
+from .parallel import ParallelEngine
+from .profiling import PROFILER
+from .rules import parse_rule
+from .stats import StatsStream
+
+# ==================== REGISTRY ENGINE ====================
+ENGINES = {
+    "python": PythonEngine,
+    "numpy": NumpyEngine,
+    "bitset": BitsetEngine,
+    "active": ActiveSetEngine,
+    "sparse": SparseEngine,
+    "parallel": ParallelEngine,
+}
+
+
+def create_engine(name, rows, cols, rule=None, boundary=None):
+    """
+    Membuat engine simulasi berdasarkan nama
+    Args:
+        name: nama engine (lihat ENGINES)
+        rows: jumlah baris grid
+        cols: jumlah kolom grid
+        rule: LifeRule (default B3/S23)
+        boundary: mode batas (default: bawaan engine, "dead" atau "infinite")
+    """
+    if name not in ENGINES:
+        raise ValueError(f"Engine tidak dikenal: {name}")
+    options = {} if boundary is None else {"boundary": boundary}
+    return ENGINES[name](rows, cols, rule=rule, **options)
+
+
+# ==================== DETEKSI SIKLUS ====================
+_MASK64 = (1 << 64) - 1
+
+CycleInfo = namedtuple("CycleInfo", ["period", "start_generation", "detected_generation"])
+
+
+def zobrist_key(row, col):
+    """
+    Kunci acak 64-bit untuk satu sel, diturunkan dari koordinatnya dengan
+    splitmix64 sehingga tidak perlu tabel (berlaku juga untuk semesta tak terbatas)
+    """
+    x = ((row & 0xFFFFFFFF) << 32) | (col & 0xFFFFFFFF)
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+def zobrist_hash(cells):
+    """Fingerprint papan: XOR kunci semua sel hidup"""
+    fingerprint = 0
+    for row, col in cells:
+        fingerprint ^= zobrist_key(row, col)
+    return fingerprint
+
+
+def describe_cycle(cycle):
+    """Membuat kalimat penjelasan untuk CycleInfo"""
+    if cycle.period == 1:
+        return f"Pola stabil (still life) sejak generasi {cycle.start_generation}"
+    return (f"Pola berulang dengan periode {cycle.period} "
+            f"sejak generasi {cycle.start_generation}")
+
+
+class CycleDetector:
+    """
+    Mendeteksi still life dan siklus periode-N dengan menyimpan fingerprint
+    generasi-generasi terakhir dalam tabel riwayat berukuran terbatas
+    """
+    
+    def __init__(self, history_size=1024):
+        """
+        Args:
+            history_size: jumlah generasi terakhir yang diingat
+                          (periode terpanjang yang dapat dideteksi)
+        """
+        self.history_size = history_size
+        self.history = OrderedDict()
+    
+    def reset(self):
+        """Melupakan seluruh riwayat (misalnya setelah papan diubah manual)"""
+        self.history.clear()
+    
+    def record(self, fingerprint, generation):
+        """
+        Mencatat fingerprint sebuah generasi
+        Returns:
+            CycleInfo jika fingerprint pernah muncul, selain itu None
+        """
+        first = self.history.get(fingerprint)
+        if first is not None:
+            return CycleInfo(generation - first, first, generation)
+        self.history[fingerprint] = generation
+        if len(self.history) > self.history_size:
+            self.history.popitem(last=False)
+        return None
+
+
+# ==================== RIWAYAT GENERASI ====================
+HistoryEntry = namedtuple("HistoryEntry", ["generation", "keyframe", "data"])
+
+
+class GenerationHistory:
+    """
+    Ring buffer generasi terakhir. Setiap keyframe_interval generasi disimpan
+    keyframe (keadaan papan penuh); generasi lain disimpan sebagai delta XOR
+    terhadap generasi sebelumnya. Untuk engine dengan packed_rows() keyframe
+    berupa bytes bit-packed seluruh papan dan delta hanya berisi indeks baris
+    yang berubah beserta XOR baris tersebut (lebar tetap per baris); engine
+    lain memakai himpunan sel hidup dan himpunan sel yang berubah.
+    """
+    
+    def __init__(self, capacity=256, keyframe_interval=32, packed=False):
+        """
+        Args:
+            capacity: jumlah generasi maksimum yang disimpan
+            keyframe_interval: jarak antar keyframe (generasi)
+            packed: simpan keadaan dari engine.packed_rows() alih-alih himpunan sel
+        """
+        if capacity < 1 or keyframe_interval < 1:
+            raise ValueError("Kapasitas dan interval keyframe harus lebih besar dari 0")
+        self.capacity = capacity
+        self.keyframe_interval = keyframe_interval
+        self.packed = packed
+        self.entries = deque()
+        # True jika papan diubah manual sejak generasi terakhir dicatat
+        self.dirty = False
+        # Baris bit-packed generasi terakhir, dasar delta berikutnya (mode packed)
+        self._current = None
+        # Jumlah byte per baris bit-packed
+        self._width = None
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def first_generation(self):
+        """Generasi tertua yang masih tersimpan (None jika kosong)"""
+        return self.entries[0].generation if self.entries else None
+    
+    def last_generation(self):
+        """Generasi terbaru yang tersimpan (None jika kosong)"""
+        return self.entries[-1].generation if self.entries else None
+    
+    def truncate_after(self, generation):
+        """Membuang generasi setelah generation (misalnya setelah mundur lalu melangkah lagi)"""
+        entries = self.entries
+        if not entries or entries[-1].generation <= generation:
+            return
+        while entries and entries[-1].generation >= generation + 1:
+            entries.pop()
+        if self.packed:
+            self._current = self._state(len(entries) - 1) if entries else None
+    
+    def record(self, generation, engine, step=False, changed_cells=None):
+        """
+        Mencatat satu generasi
+        Args:
+            generation: nomor generasi
+            engine: engine simulasi yang berisi generasi tersebut
+            step: True jika generasi ini hasil satu langkah engine dari generasi
+                  terakhir yang dicatat; False memaksa keyframe
+            changed_cells: hasil engine.changed_cells() jika sudah dihitung
+                           (hanya dipakai tanpa mode packed)
+        """
+        entries = self.entries
+        if entries and entries[-1].generation == generation:
+            entries.pop()
+            self._current = None
+        elif entries and entries[-1].generation != generation - 1:
+            # Generasi tidak bersambung (nomor generasi diganti): riwayat lama tidak berlaku
+            entries.clear()
+        keyframe = (not step or not entries or generation % self.keyframe_interval == 0 or
+                    (self.packed and self._current is None))
+        if self.packed:
+            rows = engine.packed_rows()
+            width = self._width = (engine.cols + 7) // 8
+            if keyframe:
+                data = b"".join(value.to_bytes(width, "little") for value in rows)
+            else:
+                current = self._current
+                changed = array.array("I", (row for row, (new, old)
+                                            in enumerate(zip(rows, current)) if new != old))
+                data = (changed, b"".join((rows[row] ^ current[row]).to_bytes(width, "little")
+                                          for row in changed))
+            self._current = rows
+        elif keyframe:
+            data = frozenset(engine.live_cells())
+        else:
+            data = frozenset(engine.changed_cells() if changed_cells is None else changed_cells)
+        entries.append(HistoryEntry(generation, keyframe, data))
+        self.dirty = False
+        
+        if len(entries) > self.capacity:
+            # Entri tertua harus keyframe agar generasi lain dapat direkonstruksi:
+            # entri berikutnya dijadikan keyframe sebelum entri tertua dibuang
+            oldest, following = entries.popleft(), entries[0]
+            if not following.keyframe:
+                entries[0] = HistoryEntry(following.generation, True,
+                                          self._apply(oldest.data, following.data))
+    
+    def _apply(self, keyframe, delta):
+        """Data keyframe generasi berikutnya: keyframe ditambah satu delta"""
+        if not self.packed:
+            return keyframe ^ delta
+        width = self._width
+        changed, diffs = delta
+        # Baris XOR ditempatkan di posisinya lalu seluruh papan di-XOR sekaligus
+        expanded = bytearray(len(keyframe))
+        for offset, row in enumerate(changed):
+            expanded[row * width:(row + 1) * width] = diffs[offset * width:(offset + 1) * width]
+        return (int.from_bytes(keyframe, "little") ^
+                int.from_bytes(expanded, "little")).to_bytes(len(keyframe), "little")
+    
+    def _index(self, generation):
+        """Posisi entri generasi tertentu di entries (pencarian biner), None jika tidak ada"""
+        entries = self.entries
+        low, high = 0, len(entries)
+        while low < high:
+            middle = (low + high) // 2
+            if entries[middle].generation < generation:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(entries) and entries[low].generation == generation:
+            return low
+        return None
+    
+    def _state(self, index):
+        """Keadaan entri ke-index: list baris bit-packed (mode packed) atau himpunan sel"""
+        entries = self.entries
+        start = index
+        while not entries[start].keyframe:
+            start -= 1
+        if not self.packed:
+            cells = set(entries[start].data)
+            for position in range(start + 1, index + 1):
+                cells.symmetric_difference_update(entries[position].data)
+            return cells
+        width, data = self._width, entries[start].data
+        rows = [int.from_bytes(data[offset:offset + width], "little")
+                for offset in range(0, len(data), width)]
+        for position in range(start + 1, index + 1):
+            changed, diffs = entries[position].data
+            for offset, row in enumerate(changed):
+                rows[row] ^= int.from_bytes(diffs[offset * width:(offset + 1) * width], "little")
+        return rows
+    
+    def state_at(self, generation):
+        """Merekonstruksi himpunan sel hidup pada generasi tertentu"""
+        index = self._index(generation)
+        if index is None:
+            raise IndexError(f"Generasi {generation} tidak ada di riwayat")
+        state = self._state(index)
+        if not self.packed:
+            return state
+        cells = set()
+        for row, value in enumerate(state):
+            while value:
+                low = value & -value
+                cells.add((row, low.bit_length() - 1))
+                value ^= low
+        return cells
+
+
+# ==================== GAME OF LIFE CORE ====================
+class GameOfLife:
+    """Kelas untuk mengimplementasikan Game of Life"""
+    
+    def __init__(self, rows, cols, engine="python", rule="B3/S23", boundary=None):
+        """
+        Inisialisasi Game of Life dengan ukuran grid tertentu
+        Args:
+            rows: jumlah baris grid
+            cols: jumlah kolom grid
+            engine: nama engine simulasi (lihat ENGINES)
+            rule: aturan life-like, misalnya "B36/S23" atau nama dari RULES
+            boundary: mode batas (lihat BOUNDARIES); default bawaan engine
+        """
+        self.rows = rows
+        self.cols = cols
+        self.rule = parse_rule(rule)
+        self.engine = create_engine(engine, rows, cols, self.rule, boundary)
+        self.boundary = self.engine.boundary
+        self.generation = 0
+        # Deteksi siklus bersifat opsional (lihat enable_cycle_detection)
+        self.cycle_detector = None
+        self.fingerprint = 0
+        self.cycle = None
+        # ConsoleRenderer, dibuat console.display_console saat pertama dipakai
+        self.renderer = None
+        # AutoCheckpointer opsional, dipanggil setelah setiap generasi
+        self.checkpointer = None
+        # Riwayat generasi opsional untuk mundur (lihat enable_history)
+        self.history = None
+        # Statistik per generasi opsional (lihat enable_stats)
+        self.stats = None
+        # Populasi generasi saat ini, dihitung sekali lalu dipakai ulang
+        self._population = None
+        # True setelah grid milik engine diberikan lewat properti grid: papan dapat
+        # ditulis tanpa melewati set_cell sehingga populasi tidak lagi disimpan
+        self._grid_exposed = False
+        self._initialize_grid()
+    
+    @property
+    def grid(self):
+        """
+        Grid generasi saat ini (salinan jika engine tidak memakai Grid).
+        Pada engine python buffer ini dipakai ulang: gunakan snapshot() untuk
+        menyimpan generasi, atau next_generation(in_place=True) agar referensi
+        yang sama selalu berisi generasi terbaru. Menulis langsung ke grid
+        tersebut diperbolehkan; get_population lalu selalu menghitung ulang.
+        """
+        grid = self.engine.to_grid()
+        if grid is getattr(self.engine, "grid", None):
+            self._grid_exposed = True
+        return grid
+    
+    def _initialize_grid(self):
+        """Menginisialisasi grid dengan nilai 0 (mati)"""
+        self.engine.clear()
+        self._touched()
+    
+    def _touched(self):
+        """Menandai papan diubah manual: populasi dan statistik dihitung ulang"""
+        self._population = None
+        if self.stats is not None:
+            self.stats.reset()
+    
+    def in_bounds(self, row, col):
+        """Memeriksa apakah posisi dapat ditempati (selalu True untuk semesta tak terbatas)"""
+        return not self.engine.bounded or (0 <= row < self.rows and 0 <= col < self.cols)
+    
+    def set_cell(self, row, col, value):
+        """Mengatur nilai sel pada posisi tertentu"""
+        if self.in_bounds(row, col):
+            if ((self.cycle_detector is not None or self.history is not None) and
+                    self.engine.get_cell(row, col) != value):
+                if self.cycle_detector is not None:
+                    self.fingerprint ^= zobrist_key(row, col)
+                    self.cycle_detector.reset()
+                    self.cycle = None
+                if self.history is not None:
+                    self.history.dirty = True
+            self.engine.set_cell(row, col, value)
+            self._touched()
+    
+    def set_cells(self, cells, value=1):
+        """
+        Mengatur banyak sel sekaligus (dipakai pemuat file pola)
+        Args:
+            cells: iterable koordinat (row, col); posisi di luar grid diabaikan
+            value: nilai yang diberikan ke semua sel
+        """
+        if self.engine.bounded:
+            rows, cols = self.rows, self.cols
+            cells = ((row, col) for row, col in cells if 0 <= row < rows and 0 <= col < cols)
+        bulk = getattr(self.engine, "set_cells", None)
+        if bulk is not None:
+            bulk(cells, value)
+        else:
+            for row, col in cells:
+                self.engine.set_cell(row, col, value)
+        if self.cycle_detector is not None:
+            self.enable_cycle_detection(self.cycle_detector.history_size)
+        if self.history is not None:
+            self.history.dirty = True
+        self._touched()
+    
+    def close(self):
+        """Melepas sumber daya engine (misalnya process pool engine parallel)"""
+        close = getattr(self.engine, "close", None)
+        if close is not None:
+            close()
+    
+    def get_cell(self, row, col):
+        """Mendapatkan nilai sel pada posisi tertentu"""
+        if self.in_bounds(row, col):
+            return self.engine.get_cell(row, col)
+        return 0
+    
+    def count_neighbors(self, row, col):
+        """
+        Menghitung jumlah tetangga hidup (bernilai 1) dari sel pada posisi (row, col)
+        Tetangga adalah 8 sel di sekitar: vertikal, horizontal, dan diagonal
+        """
+        return self.engine.count_neighbors(row, col)
+    
+    def next_generation(self, in_place=False):
+        """
+        Menghitung generasi berikutnya berdasarkan aturan Game of Life
+        Args:
+            in_place: jika True, objek grid yang sedang dipegang pemanggil
+                      ikut diperbarui (bukan ditukar dengan buffer lain)
+        """
+        detector = self.cycle_detector
+        if detector is not None and not detector.history:
+            # Papan baru diubah: catat kondisi awal sebelum melangkah
+            detector.record(self.fingerprint, self.generation)
+        
+        history = self.history
+        if history is not None:
+            # Melangkah dari generasi lama (setelah mundur) membuang cabang lama
+            history.truncate_after(self.generation)
+            if history.dirty or not history:
+                history.record(self.generation, self.engine)
+        
+        with PROFILER.phase("step"):
+            if in_place and hasattr(self.engine, "step_in_place"):
+                self.engine.step_in_place()
+            else:
+                self.engine.step()
+        self.generation += 1
+        self._population = None
+        
+        stats = self.stats
+        if detector is not None or history is not None or stats is not None:
+            with PROFILER.phase("stats"):
+                self._record_changes(detector, history, stats)
+        
+        if self.checkpointer is not None:
+            self.checkpointer.capture(self)
+    
+    def _record_changes(self, detector, history, stats):
+        """Memperbarui statistik, riwayat, dan fingerprint dari sel yang berubah"""
+        # Daftar sel yang berubah hanya dibuat jika dibutuhkan; statistik dan riwayat
+        # bit-packed memakai operasi bit/vektor engine
+        needs_changes = detector is not None or (history is not None and not history.packed)
+        changed = self.engine.changed_cells() if needs_changes else None
+        
+        if stats is not None:
+            self._population = stats.publish(self, changed).population
+        
+        if history is not None:
+            history.record(self.generation, self.engine, step=True, changed_cells=changed)
+        
+        if detector is not None:
+            # Fingerprint diperbarui hanya dari sel yang berubah
+            for row, col in changed:
+                self.fingerprint ^= zobrist_key(row, col)
+            cycle = detector.record(self.fingerprint, self.generation)
+            if self.cycle is None:
+                self.cycle = cycle
+    
+    def enable_history(self, capacity=256, keyframe_interval=32):
+        """
+        Mengaktifkan riwayat generasi untuk mundur dan menggeser timeline
+        Args:
+            capacity: jumlah generasi yang disimpan
+            keyframe_interval: jarak antar keyframe (generasi)
+        """
+        self.history = GenerationHistory(capacity, keyframe_interval,
+                                         packed=hasattr(self.engine, "packed_rows"))
+        self.history.record(self.generation, self.engine)
+    
+    def goto_generation(self, generation):
+        """Memulihkan papan ke generasi yang tersimpan di riwayat"""
+        if self.history is None:
+            raise ValueError("Riwayat generasi belum diaktifkan")
+        if self.history.dirty:
+            # Simpan dulu perubahan manual agar generasi ini dapat dikunjungi lagi
+            self.history.truncate_after(self.generation)
+            self.history.record(self.generation, self.engine)
+        cells = self.history.state_at(generation)
+        self.engine.clear()
+        self.set_cells(cells)
+        self.generation = generation
+        self.history.dirty = False
+    
+    def step_back(self):
+        """Mundur satu generasi; mengembalikan False jika riwayat sudah habis"""
+        if self.history is None or self.history.first_generation() is None:
+            return False
+        if self.generation <= self.history.first_generation():
+            return False
+        self.goto_generation(self.generation - 1)
+        return True
+    
+    def enable_stats(self, track_bounding_box=True):
+        """
+        Mengaktifkan statistik per generasi (kelahiran, kematian, populasi,
+        kotak pembatas, kepadatan aktivitas)
+        Returns:
+            StatsStream; daftarkan subscriber dengan stats.subscribe(...)
+        """
+        self.stats = StatsStream(track_bounding_box)
+        return self.stats
+    
+    def enable_checkpoints(self, path, every=1000):
+        """
+        Mengaktifkan checkpoint otomatis setiap N generasi (ditulis di thread terpisah)
+        Args:
+            path: file checkpoint (ditimpa setiap kali)
+            every: interval checkpoint dalam generasi
+        Returns:
+            AutoCheckpointer; panggil close() agar snapshot terakhir selesai ditulis
+        """
+        # fileio mengimpor core, sehingga baru diimpor saat dibutuhkan
+        from .fileio import AutoCheckpointer
+        if self.checkpointer is not None:
+            self.checkpointer.close()
+        self.checkpointer = AutoCheckpointer(path, every)
+        return self.checkpointer
+    
+    def enable_cycle_detection(self, history_size=1024):
+        """
+        Mengaktifkan deteksi still life dan siklus; hasilnya tersedia di self.cycle
+        Args:
+            history_size: jumlah generasi terakhir yang diingat
+        """
+        self.cycle_detector = CycleDetector(history_size)
+        self.fingerprint = zobrist_hash(self.engine.live_cells())
+        self.cycle = None
+    
+    def snapshot(self):
+        """Mengembalikan salinan Grid generasi saat ini yang tidak ikut berubah"""
+        if hasattr(self.engine, "snapshot"):
+            return self.engine.snapshot()
+        return self.engine.to_grid()
+    
+    def bounding_box(self):
+        """
+        Mengembalikan kotak pembatas sel hidup (min_row, min_col, max_row, max_col)
+        atau None jika semua sel mati
+        """
+        fast = getattr(self.engine, "bounding_box", None)
+        if fast is not None:
+            return fast()
+        cells = self.engine.live_cells()
+        if not cells:
+            return None
+        rows = [row for row, _ in cells]
+        cols = [col for _, col in cells]
+        return min(rows), min(cols), max(rows), max(cols)
+    
+    def view_origin(self, rows=None, cols=None):
+        """
+        Mengembalikan pojok kiri atas jendela tampilan.
+        Pada semesta tak terbatas jendela mengikuti pola (pusat kotak pembatas).
+        Args:
+            rows: tinggi jendela dalam sel (default self.rows)
+            cols: lebar jendela dalam sel (default self.cols)
+        """
+        if self.engine.bounded:
+            return 0, 0
+        box = self.bounding_box()
+        if box is None:
+            return 0, 0
+        min_row, min_col, max_row, max_col = box
+        return ((min_row + max_row) // 2 - (self.rows if rows is None else rows) // 2,
+                (min_col + max_col) // 2 - (self.cols if cols is None else cols) // 2)
+    
+    def live_cells_in(self, top, left, height, width):
+        """
+        Mengembalikan sel hidup di dalam sebuah jendela tanpa memindai seluruh
+        papan jika engine mendukungnya (dipakai tampilan yang diperbesar)
+        Args:
+            top, left: pojok kiri atas jendela
+            height, width: ukuran jendela dalam sel
+        Returns:
+            List koordinat (row, col) papan
+        """
+        fast = getattr(self.engine, "live_cells_in", None)
+        if fast is not None:
+            return fast(top, left, height, width)
+        bottom, right = top + height, left + width
+        return [(row, col) for row, col in self.engine.live_cells()
+                if top <= row < bottom and left <= col < right]
+    
+    def density(self, top, left, height, width, block=1):
+        """
+        Menghitung jumlah sel hidup per blok block x block pada sebuah jendela
+        (dipakai tampilan yang diperkecil). Sel di luar papan dihitung mati.
+        Args:
+            top, left: pojok kiri atas jendela
+            height, width: ukuran jendela dalam blok
+            block: sisi blok dalam sel
+        Returns:
+            List baris berisi jumlah sel hidup per blok
+        """
+        fast = getattr(self.engine, "density", None)
+        if fast is not None:
+            return fast(top, left, height, width, block)
+        counts = [[0] * width for _ in range(height)]
+        for row, col in self.live_cells_in(top, left, height * block, width * block):
+            counts[(row - top) // block][(col - left) // block] += 1
+        return counts
+    
+    def display_console(self):
+        """Menampilkan grid di console (lihat console.display_console)"""
+        # Modul console (I/O terminal) baru dimuat saat tampilan console dipakai
+        from .console import display_console
+        display_console(self)
+    
+    def is_empty(self):
+        """Memeriksa apakah semua sel mati"""
+        return self.engine.is_empty()
+    
+    def get_population(self):
+        """
+        Menghitung jumlah sel hidup (sekali per generasi, hasilnya disimpan
+        kecuali grid engine sudah diberikan lewat properti grid)
+        """
+        if self._population is None or self._grid_exposed:
+            with PROFILER.phase("population"):
+                self._population = self.engine.population()
+        return self._population
+    
+    def run_console(self, max_generations=100, delay=0.5, stop_on_cycle=False,
+                    render_every=1, profile=False):
+        """Menjalankan simulasi Game of Life di console (lihat console.run_console)"""
+        from .console import run_console
+        run_console(self, max_generations, delay, stop_on_cycle, render_every, profile)
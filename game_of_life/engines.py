@@ -0,0 +1,1147 @@
+"""Engine simulasi satu proses (python, numpy, bitset, active, sparse) dan mode batas"""
+
+import itertools
+from collections import Counter
+
+from .adt import Grid
+from .optional import load_numpy
+from .rules import _halo_sources, _require_no_b0, parse_rule
+
+# NumPy opsional; baru diimpor saat engine "numpy" pertama kali dibuat
+np = None
+
+# ==================== ENGINE SIMULASI ====================
+# Posisi relatif 8 tetangga: vertikal, horizontal, dan diagonal
+NEIGHBOR_OFFSETS = tuple((i, j) for i in range(-1, 2) for j in range(-1, 2)
+                         if i != 0 or j != 0)
+
+# Mode batas papan: sel di luar tepi selalu mati, membungkus ke sisi seberang
+# (torus), atau berupa cermin sel di tepi (reflect)
+BOUNDARIES = ("dead", "torus", "reflect")
+
+
+def _halo_index(size, boundary):
+    """
+    Tabel indeks satu sumbu untuk papan berbingkai 1 sel
+    Args:
+        size: panjang sumbu papan asli
+        boundary: mode batas (lihat BOUNDARIES)
+    Returns:
+        daftar sepanjang size + 2: posisi p pada papan berbingkai membaca
+        posisi index[p] papan asli, atau None jika selalu mati
+    """
+    if boundary not in BOUNDARIES:
+        raise ValueError(f"Mode batas tidak dikenal: {boundary}")
+    inner = list(range(size))
+    if boundary == "torus":
+        return [size - 1] + inner + [0]
+    if boundary == "reflect":
+        return [0] + inner + [size - 1]
+    return [None] + inner + [None]
+
+
+# Tabel translate byte sel (0/1) menjadi digit biner ASCII untuk int(..., 2)
+_BIT_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def _packed_rows(data, rows, cols):
+    """
+    Mengemas buffer satu byte per sel menjadi satu bilangan bulat per baris
+    Args:
+        data: bytes sel baris demi baris (minimal rows * cols byte)
+        rows, cols: ukuran papan
+    Returns:
+        list bilangan bulat; bit ke-c = kolom c (sama dengan BitsetEngine)
+    """
+    digits = data[:rows * cols].translate(_BIT_DIGITS)
+    return [int(digits[start:start + cols][::-1], 2) for start in range(0, rows * cols, cols)]
+
+
+# Kebalikan _BIT_DIGITS: digit biner ASCII menjadi byte sel (0/1)
+_DIGIT_BITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def _unpacked_rows(values, cols):
+    """
+    Kebalikan _packed_rows: satu bilangan bulat per baris (bit ke-c = kolom c)
+    menjadi bytes satu byte per sel, baris demi baris
+    """
+    digits = "".join(format(value, f"0{cols}b")[::-1] for value in values)
+    return digits.encode("ascii").translate(_DIGIT_BITS)
+
+
+def _step_counts(current, previous):
+    """
+    Jumlah kelahiran dan kematian antara dua buffer satu byte per sel: kedua
+    buffer dibaca sebagai bilangan bulat lalu dihitung popcount(new & ~old)
+    """
+    new, old = int.from_bytes(current, "little"), int.from_bytes(previous, "little")
+    return (new & ~old).bit_count(), (old & ~new).bit_count()
+
+
+def _bytes_bounding_box(data, rows, cols):
+    """
+    Kotak pembatas sel hidup pada buffer satu byte per sel: find/rfind memberi
+    rentang baris, OR baris-baris tersebut (sebagai bilangan bulat) rentang kolom
+    """
+    first = data.find(1, 0, rows * cols)
+    if first < 0:
+        return None
+    min_row, max_row = first // cols, data.rfind(1, 0, rows * cols) // cols
+    union = 0
+    for start in range(min_row * cols, (max_row + 1) * cols, cols):
+        union |= int.from_bytes(data[start:start + cols], "little")
+    # Kolom c berada di bit 8 * c
+    min_col = ((union & -union).bit_length() - 1) // 8
+    return min_row, min_col, max_row, (union.bit_length() - 1) // 8
+
+
+def _bytes_outside(data, cols, top, left, bottom, right):
+    """
+    True jika buffer satu byte per sel memuat sel bernilai 1 di luar persegi
+    (top, left) - (bottom, right) (inklusif; persegi kosong berarti seluruh papan)
+    """
+    first = data.find(1)
+    if first < 0:
+        return False
+    if top > bottom or left > right:
+        return True
+    last = data.rfind(1)
+    if first < top * cols or last >= (bottom + 1) * cols:
+        return True
+    # Hanya baris persegi yang memuat sel bernilai 1 yang diperiksa sisi kiri/kanannya
+    for base in range(first // cols * cols, last // cols * cols + 1, cols):
+        if (data.find(1, base, base + left) >= 0 or
+                data.find(1, base + right + 1, base + cols) >= 0):
+            return True
+    return False
+
+
+def _bytes_box_changed(current, previous, cols, box):
+    """
+    True jika langkah dari buffer previous ke current dapat menggeser kotak
+    pembatas box: ada sel hidup di luar kotak (pasti baru lahir) atau sel mati
+    di tepi kotak. Perubahan di bagian dalam kotak tidak pernah mengubahnya.
+    """
+    min_row, min_col, max_row, max_col = box
+    if _bytes_outside(current, cols, min_row, min_col, max_row, max_col):
+        return True
+    # Tepi atas, tepi bawah, kolom kiri, dan kolom kanan kotak sebagai potongan buffer
+    top, bottom = min_row * cols, max_row * cols
+    edges = (slice(top + min_col, top + max_col + 1),
+             slice(bottom + min_col, bottom + max_col + 1),
+             slice(top + min_col, bottom + min_col + 1, cols),
+             slice(top + max_col, bottom + max_col + 1, cols))
+    return any(int.from_bytes(previous[edge], "little") & ~int.from_bytes(current[edge], "little")
+               for edge in edges)
+
+
+def _live_cells_in(data, rows, cols, top, left, height, width):
+    """
+    Sel hidup di dalam jendela pada buffer satu byte per sel (baris demi baris);
+    hanya baris dan kolom jendela yang diperiksa
+    Returns:
+        list koordinat (row, col) papan
+    """
+    cells = []
+    col0, col1 = max(left, 0), min(left + width, cols)
+    if col0 >= col1:
+        return cells
+    for row in range(max(top, 0), min(top + height, rows)):
+        base = row * cols
+        stop = base + col1
+        index = data.find(1, base + col0, stop)
+        while index >= 0:
+            cells.append((row, index - base))
+            index = data.find(1, index + 1, stop)
+    return cells
+
+
+def _count_neighbors_indexed(get_cell, row_index, col_index, row, col):
+    """Menghitung tetangga satu sel lewat tabel halo (untuk query, bukan loop step)"""
+    count = -get_cell(row, col)
+    for r in row_index[row:row + 3]:
+        if r is not None:
+            for c in col_index[col:col + 3]:
+                if c is not None:
+                    count += get_cell(r, c)
+    return count
+
+
+class PythonEngine:
+    """Engine bawaan: menghitung generasi sel demi sel menggunakan ADT Grid"""
+    
+    name = "python"
+    bounded = True
+    
+    def __init__(self, rows, cols, rule=None, boundary="dead"):
+        """
+        Membuat engine dengan grid kosong
+        Args:
+            rows: jumlah baris grid
+            cols: jumlah kolom grid
+            rule: LifeRule (default B3/S23)
+            boundary: mode batas (lihat BOUNDARIES)
+        """
+        self.rule = parse_rule(rule)
+        self.boundary = boundary
+        self.rows = rows
+        self.cols = cols
+        self._row_index = _halo_index(rows, boundary)
+        self._col_index = _halo_index(cols, boundary)
+        # Dua buffer bertipe (satu byte per sel) yang dipakai bergantian:
+        # grid = generasi saat ini, _back = tempat generasi berikutnya ditulis
+        self.grid = Grid(rows, cols, "B")
+        self._back = Grid(rows, cols, "B")
+        # Buffer cadangan untuk step_in_place
+        self._spare = Grid(rows, cols, "B")
+        # Papan berbingkai 1 sel (satu byte per sel) yang dialokasikan sekali dan
+        # diisi ulang di tempat setiap langkah; bingkai mode dead tetap nol
+        self._padded = bytearray((rows + 2) * (cols + 2))
+        self.clear()
+    
+    def clear(self):
+        """Mematikan semua sel"""
+        self.grid.clear(0)
+        self._back.clear(0)
+        self._stepped = False
+    
+    def get_cell(self, row, col):
+        """Mendapatkan nilai sel (posisi diasumsikan valid)"""
+        return self.grid[row][col]
+    
+    def set_cell(self, row, col, value):
+        """Mengatur nilai sel (posisi diasumsikan valid)"""
+        self.grid[row][col] = value
+    
+    def set_cells(self, cells, value=1):
+        """Mengatur banyak sel sekaligus pada salinan buffer lalu menulisnya sekali"""
+        data = bytearray(self._bytes(self.grid))
+        cols = self.cols
+        for row, col in cells:
+            data[row * cols + col] = value
+        self.grid.memoryview().cast("B")[:] = data
+    
+    def load_bytes(self, data):
+        """Mengisi seluruh papan dari buffer satu byte per sel (rows * cols byte) sekaligus"""
+        self.grid.memoryview().cast("B")[:] = data
+    
+    def count_neighbors(self, row, col):
+        """
+        Menghitung jumlah tetangga hidup (bernilai 1) dari sel pada posisi (row, col)
+        Tetangga adalah 8 sel di sekitar: vertikal, horizontal, dan diagonal,
+        dengan posisi di luar tepi dipetakan sesuai mode batas
+        """
+        return _count_neighbors_indexed(self.get_cell, self._row_index, self._col_index,
+                                        row, col)
+    
+    def _refresh_padded(self):
+        """Menyalin generasi saat ini ke papan berbingkai lalu mengisi bingkainya"""
+        padded, rows, cols = self._padded, self.rows, self.cols
+        width = cols + 2
+        source = self.grid.memoryview().cast("B")
+        left, right = self._col_index[0], self._col_index[-1]
+        for row in range(rows):
+            base = (row + 1) * width
+            padded[base + 1:base + 1 + cols] = source[row * cols:(row + 1) * cols]
+            if left is not None:
+                padded[base] = padded[base + 1 + left]
+            if right is not None:
+                padded[base + width - 1] = padded[base + 1 + right]
+        # Baris bingkai disalin utuh setelah kolom bingkai terisi (sudut ikut)
+        top, bottom = self._row_index[0], self._row_index[-1]
+        view = memoryview(padded)
+        if top is not None:
+            padded[:width] = view[(top + 1) * width:(top + 2) * width]
+        if bottom is not None:
+            padded[(rows + 1) * width:] = view[(bottom + 1) * width:(bottom + 2) * width]
+        return view
+    
+    def _compute(self, new_grid):
+        """Menulis generasi berikutnya ke new_grid berdasarkan aturan Game of Life"""
+        table = self.rule.table
+        cols = self.cols
+        width = cols + 2
+        view = self._refresh_padded()
+        target = new_grid.memoryview().cast("B")
+        for row in range(self.rows):
+            # Baris di atas, baris sel, dan baris di bawah pada papan berbingkai
+            # sebagai potongan memoryview (tanpa salinan), masing-masing digeser
+            # 0, 1, dan 2 kolom sehingga kolom col papan asli sejajar
+            above, current, below = row * width, (row + 1) * width, (row + 2) * width
+            
+            # Terapkan aturan lewat tabel: untuk B3/S23 sel hidup bertahan
+            # dengan 2-3 tetangga dan sel mati lahir dengan tepat 3 tetangga.
+            # Hasil ditulis langsung ke buffer new_grid sel demi sel.
+            for index, nw, n, ne, w, c, e, sw, s, se in zip(
+                    range(row * cols, (row + 1) * cols),
+                    view[above:above + cols], view[above + 1:above + 1 + cols],
+                    view[above + 2:above + width],
+                    view[current:current + cols], view[current + 1:current + 1 + cols],
+                    view[current + 2:current + width],
+                    view[below:below + cols], view[below + 1:below + 1 + cols],
+                    view[below + 2:below + width]):
+                target[index] = table[c * 9 + nw + n + ne + w + e + sw + s + se]
+    
+    def step(self):
+        """Menghitung generasi berikutnya lalu menukar kedua buffer (tanpa alokasi papan baru)"""
+        self._compute(self._back)
+        self.grid, self._back = self._back, self.grid
+        self._stepped = True
+    
+    def step_in_place(self):
+        """
+        Seperti step, tetapi objek self.grid tetap sama sehingga pemegang
+        referensi grid melihat generasi baru. Isi buffer disalin per blok:
+        generasi lama dipindah ke buffer cadangan yang menjadi _back.
+        """
+        self._compute(self._back)
+        spare = self._spare
+        spare.copy_from(self.grid)
+        self.grid.copy_from(self._back)
+        self._spare, self._back = self._back, spare
+        self._stepped = True
+    
+    def snapshot(self):
+        """Mengembalikan salinan Grid generasi saat ini"""
+        return self.grid.copy()
+    
+    def _bytes(self, grid):
+        """Isi buffer grid sebagai bytes (satu byte per sel, baris demi baris)"""
+        return grid.memoryview().tobytes()
+    
+    def is_empty(self):
+        """Memeriksa apakah semua sel mati"""
+        return not any(self._bytes(self.grid))
+    
+    def population(self):
+        """Menghitung jumlah sel hidup"""
+        return self._bytes(self.grid).count(1)
+    
+    def changed_cells(self):
+        """
+        Mengembalikan koordinat sel yang berubah oleh langkah terakhir
+        (buffer belakang masih berisi generasi sebelumnya)
+        """
+        if not self._stepped:
+            return []
+        current, previous = self._bytes(self.grid), self._bytes(self._back)
+        if current == previous:
+            return []
+        return [divmod(index, self.cols)
+                for index, (a, b) in enumerate(zip(current, previous)) if a != b]
+    
+    def step_counts(self):
+        """Jumlah (kelahiran, kematian) langkah terakhir tanpa membuat daftar sel"""
+        if not self._stepped:
+            return 0, 0
+        return _step_counts(self._bytes(self.grid), self._bytes(self._back))
+    
+    def bounding_box(self):
+        """Kotak pembatas sel hidup (None jika kosong)"""
+        return _bytes_bounding_box(self._bytes(self.grid), self.rows, self.cols)
+    
+    def box_changed(self, box):
+        """True jika langkah terakhir dapat menggeser kotak pembatas box"""
+        if not self._stepped:
+            return True
+        return _bytes_box_changed(self._bytes(self.grid), self._bytes(self._back), self.cols, box)
+    
+    def live_cells(self):
+        """Mengembalikan daftar koordinat (row, col) sel hidup"""
+        return [divmod(index, self.cols)
+                for index, value in enumerate(self._bytes(self.grid)) if value]
+    
+    def live_cells_in(self, top, left, height, width):
+        """Sel hidup di dalam jendela height x width yang berpojok (top, left)"""
+        return _live_cells_in(self._bytes(self.grid), self.rows, self.cols,
+                              top, left, height, width)
+    
+    def packed_rows(self):
+        """Setiap baris sebagai bilangan bulat (bit ke-c = kolom c), untuk riwayat"""
+        return _packed_rows(self._bytes(self.grid), self.rows, self.cols)
+    
+    def density(self, top, left, height, width, block=1):
+        """Jumlah sel hidup per blok dengan bytes.count pada potongan setiap baris"""
+        data = self._bytes(self.grid)
+        counts = [[0] * width for _ in range(height)]
+        col0, col1 = max(left, 0), min(left + width * block, self.cols)
+        spans = [(index, max(left + index * block, col0), min(left + (index + 1) * block, col1))
+                 for index in range((col0 - left) // block, -(-(col1 - left) // block))]
+        for row in range(max(top, 0), min(top + height * block, self.rows)):
+            line = counts[(row - top) // block]
+            base = row * self.cols
+            for index, start, stop in spans:
+                line[index] += data.count(1, base + start, base + stop)
+        return counts
+    
+    def to_grid(self):
+        """Mengembalikan Grid generasi saat ini"""
+        return self.grid
+
+
+def _fill_halo(padded, col_index, row_index=None):
+    """
+    Mengisi bingkai papan NumPy berbingkai (dua sumbu terakhir) dari tabel halo.
+    Bingkai mode dead dibiarkan nol. Jika row_index None, baris bingkai sudah
+    diisi pemanggil dan hanya kolom bingkai yang diisi.
+    """
+    if row_index is not None:
+        top, bottom = row_index[0], row_index[-1]
+        if top is not None:
+            padded[..., 0, 1:-1] = padded[..., top + 1, 1:-1]
+        if bottom is not None:
+            padded[..., -1, 1:-1] = padded[..., bottom + 1, 1:-1]
+    # Kolom diisi setinggi papan berbingkai sehingga sudut ikut terisi
+    left, right = col_index[0], col_index[-1]
+    if left is not None:
+        padded[..., :, 0] = padded[..., :, left + 1]
+    if right is not None:
+        padded[..., :, -1] = padded[..., :, right + 1]
+
+
+def _numpy_next(padded, lut):
+    """
+    Menghitung generasi berikutnya dari papan NumPy yang sudah diberi bingkai
+    1 sel, dengan menjumlahkan 8 salinan papan yang digeser ke setiap arah.
+    Dua sumbu terakhir adalah baris dan kolom, sehingga tumpukan papan
+    (N, rows + 2, cols + 2) juga dapat dihitung sekaligus.
+    Args:
+        padded: papan berbingkai (uint8)
+        lut: tabel aturan sebagai array NumPy (lihat LifeRule.table)
+    """
+    neighbors = (padded[..., :-2, :-2] + padded[..., :-2, 1:-1] + padded[..., :-2, 2:] +
+                 padded[..., 1:-1, :-2] + padded[..., 1:-1, 2:] +
+                 padded[..., 2:, :-2] + padded[..., 2:, 1:-1] + padded[..., 2:, 2:])
+    
+    return lut[padded[..., 1:-1, 1:-1] * 9 + neighbors]
+
+
+def _numpy_outside(mask, top, left, bottom, right):
+    """True jika mask NumPy 2D bernilai benar di luar persegi (top, left) - (bottom, right)"""
+    if top > bottom or left > right:
+        return bool(mask.any())
+    return bool(mask[:top].any() or mask[bottom + 1:].any() or
+                mask[top:bottom + 1, :left].any() or mask[top:bottom + 1, right + 1:].any())
+
+
+class NumpyEngine:
+    """
+    Engine berbasis NumPy: satu generasi dihitung sekaligus untuk seluruh papan
+    dengan menjumlahkan 8 salinan papan yang digeser (tanpa loop per sel)
+    """
+    
+    name = "numpy"
+    bounded = True
+    
+    def __init__(self, rows, cols, rule=None, boundary="dead"):
+        """
+        Membuat engine dengan papan kosong
+        Args:
+            rows: jumlah baris grid
+            cols: jumlah kolom grid
+            rule: LifeRule (default B3/S23)
+            boundary: mode batas (lihat BOUNDARIES)
+        """
+        global np
+        self.rule = parse_rule(rule)
+        np = load_numpy()
+        if np is None:
+            raise ImportError("Engine 'numpy' membutuhkan paket numpy")
+        self.boundary = boundary
+        self.rows = rows
+        self.cols = cols
+        self._row_index = _halo_index(rows, boundary)
+        self._col_index = _halo_index(cols, boundary)
+        self._lut = np.array(self.rule.table, dtype=np.uint8)
+        self.cells = np.zeros((rows, cols), dtype=np.uint8)
+        # Papan dengan bingkai 1 sel yang diisi ulang sesuai mode batas setiap langkah
+        self._padded = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+        self.clear()
+    
+    def clear(self):
+        """Mematikan semua sel"""
+        self.cells.fill(0)
+        self._previous = None
+    
+    def get_cell(self, row, col):
+        """Mendapatkan nilai sel (posisi diasumsikan valid)"""
+        return int(self.cells[row, col])
+    
+    def set_cell(self, row, col, value):
+        """Mengatur nilai sel (posisi diasumsikan valid)"""
+        self.cells[row, col] = value
+    
+    def set_cells(self, cells, value=1):
+        """Mengatur banyak sel sekaligus, diproses per potongan array"""
+        cells = iter(cells)
+        while True:
+            chunk = list(itertools.islice(cells, 1 << 16))
+            if not chunk:
+                return
+            rows, cols = zip(*chunk)
+            self.cells[list(rows), list(cols)] = value
+    
+    def count_neighbors(self, row, col):
+        """Menghitung jumlah tetangga hidup dari sel pada posisi (row, col)"""
+        return _count_neighbors_indexed(self.get_cell, self._row_index, self._col_index,
+                                        row, col)
+    
+    def step(self):
+        """Menghitung generasi berikutnya untuk seluruh papan sekaligus"""
+        padded = self._padded
+        padded[1:-1, 1:-1] = self.cells
+        _fill_halo(padded, self._col_index, self._row_index)
+        self._previous = self.cells
+        self.cells = _numpy_next(padded, self._lut)
+    
+    def is_empty(self):
+        """Memeriksa apakah semua sel mati"""
+        return not self.cells.any()
+    
+    def population(self):
+        """Menghitung jumlah sel hidup"""
+        return int(self.cells.sum())
+    
+    def changed_cells(self):
+        """Mengembalikan koordinat sel yang berubah oleh langkah terakhir"""
+        if self._previous is None:
+            return []
+        rows, cols = np.nonzero(self.cells != self._previous)
+        return list(zip(rows.tolist(), cols.tolist()))
+    
+    def step_counts(self):
+        """Jumlah (kelahiran, kematian) langkah terakhir dengan np.count_nonzero"""
+        if self._previous is None:
+            return 0, 0
+        return (int(np.count_nonzero(self.cells > self._previous)),
+                int(np.count_nonzero(self.cells < self._previous)))
+    
+    def live_cells(self):
+        """Mengembalikan daftar koordinat (row, col) sel hidup"""
+        rows, cols = np.nonzero(self.cells)
+        return list(zip(rows.tolist(), cols.tolist()))
+    
+    def live_cells_in(self, top, left, height, width):
+        """Sel hidup di dalam jendela dari potongan array (tanpa memindai seluruh papan)"""
+        row0, col0 = max(top, 0), max(left, 0)
+        rows, cols = np.nonzero(self.cells[row0:max(top + height, 0),
+                                           col0:max(left + width, 0)])
+        return list(zip((rows + row0).tolist(), (cols + col0).tolist()))
+    
+    def packed_rows(self):
+        """Setiap baris sebagai bilangan bulat (bit ke-c = kolom c) lewat np.packbits"""
+        packed = np.packbits(self.cells, axis=1, bitorder="little")
+        data, width = packed.tobytes(), packed.shape[1]
+        return [int.from_bytes(data[start:start + width], "little")
+                for start in range(0, len(data), width)]
+    
+    def bounding_box(self):
+        """Kotak pembatas sel hidup dari proyeksi baris dan kolom (None jika kosong)"""
+        rows = np.flatnonzero(self.cells.any(axis=1))
+        if not len(rows):
+            return None
+        cols = np.flatnonzero(self.cells.any(axis=0))
+        return int(rows[0]), int(cols[0]), int(rows[-1]), int(cols[-1])
+    
+    def box_changed(self, box):
+        """True jika ada sel hidup di luar kotak box atau sel mati di tepinya"""
+        if self._previous is None:
+            return True
+        min_row, min_col, max_row, max_col = box
+        if _numpy_outside(self.cells, min_row, min_col, max_row, max_col):
+            return True
+        died = self._previous[min_row:max_row + 1, min_col:max_col + 1] > \
+            self.cells[min_row:max_row + 1, min_col:max_col + 1]
+        return bool(died[0].any() or died[-1].any() or died[:, 0].any() or died[:, -1].any())
+    
+    def density(self, top, left, height, width, block=1):
+        """Jumlah sel hidup per blok dengan reshape-sum pada bagian papan yang terlihat"""
+        counts = np.zeros((height, width), dtype=np.int32)
+        row0, col0 = max(top, 0), max(left, 0)
+        row1 = min(top + height * block, self.rows)
+        col1 = min(left + width * block, self.cols)
+        if row0 >= row1 or col0 >= col1:
+            return counts.tolist()
+        # Potongan papan diselaraskan ke batas blok agar bisa di-reshape
+        first_row, first_col = (row0 - top) // block, (col0 - left) // block
+        last_row, last_col = -(-(row1 - top) // block), -(-(col1 - left) // block)
+        aligned = np.zeros(((last_row - first_row) * block, (last_col - first_col) * block),
+                           dtype=np.int32)
+        offset_row, offset_col = row0 - top - first_row * block, col0 - left - first_col * block
+        aligned[offset_row:offset_row + row1 - row0,
+                offset_col:offset_col + col1 - col0] = self.cells[row0:row1, col0:col1]
+        counts[first_row:last_row, first_col:last_col] = aligned.reshape(
+            last_row - first_row, block, last_col - first_col, block).sum(axis=(1, 3))
+        return counts.tolist()
+    
+    def to_grid(self):
+        """Mengembalikan salinan papan dalam bentuk Grid"""
+        grid = Grid(self.rows, self.cols, "B")
+        # Buffer Grid diserahkan ke NumPy tanpa salinan lalu diisi sekaligus
+        np.asarray(grid.memoryview())[:, :] = self.cells
+        return grid
+
+
+class BitsetEngine:
+    """
+    Engine bit-packed: setiap baris disimpan sebagai satu bilangan bulat Python
+    (bit ke-c = kolom c), sehingga aturan dievaluasi dengan operasi bitwise
+    untuk seluruh kolom dalam satu baris sekaligus
+    """
+    
+    name = "bitset"
+    bounded = True
+    
+    def __init__(self, rows, cols, rule=None, boundary="dead"):
+        """
+        Membuat engine dengan papan kosong
+        Args:
+            rows: jumlah baris grid
+            cols: jumlah kolom grid
+            rule: LifeRule (default B3/S23)
+            boundary: mode batas (lihat BOUNDARIES)
+        """
+        self.rule = parse_rule(rule)
+        self.boundary = boundary
+        self.rows = rows
+        self.cols = cols
+        self._row_index = _halo_index(rows, boundary)
+        self._col_index = _halo_index(cols, boundary)
+        self._mask = (1 << cols) - 1
+        # Jumlah tetangga yang menghasilkan sel hidup, per status sel
+        self._counts = sorted(self.rule.birth | self.rule.survive)
+        self.clear()
+    
+    def clear(self):
+        """Mematikan semua sel"""
+        self.bits = [0] * self.rows
+        self._previous = None
+    
+    def get_cell(self, row, col):
+        """Mendapatkan nilai sel (posisi diasumsikan valid)"""
+        return (self.bits[row] >> col) & 1
+    
+    def set_cell(self, row, col, value):
+        """Mengatur nilai sel (posisi diasumsikan valid)"""
+        if value:
+            self.bits[row] |= 1 << col
+        else:
+            self.bits[row] &= ~(1 << col)
+    
+    def set_cells(self, cells, value=1):
+        """Mengatur banyak sel sekaligus dengan mengumpulkan mask per baris"""
+        masks = {}
+        for row, col in cells:
+            masks[row] = masks.get(row, 0) | (1 << col)
+        for row, mask in masks.items():
+            if value:
+                self.bits[row] |= mask
+            else:
+                self.bits[row] &= ~mask
+    
+    def count_neighbors(self, row, col):
+        """Menghitung jumlah tetangga hidup dari sel pada posisi (row, col)"""
+        return _count_neighbors_indexed(self.get_cell, self._row_index, self._col_index,
+                                        row, col)
+    
+    def _halo(self):
+        """
+        Baris-baris papan berbingkai: bit ke-(c + 1) = kolom c, bit 0 dan bit
+        cols + 1 diisi kolom halo sesuai mode batas
+        """
+        bits, cols = self.bits, self.cols
+        left, right = self._col_index[0], self._col_index[-1]
+        padded = []
+        for source in self._row_index:
+            if source is None:
+                padded.append(0)
+                continue
+            value = bits[source]
+            line = value << 1
+            if left is not None:
+                line |= (value >> left) & 1
+            if right is not None:
+                line |= ((value >> right) & 1) << (cols + 1)
+            padded.append(line)
+        return padded
+    
+    def step(self):
+        """Menghitung generasi berikutnya baris demi baris dengan logika penjumlah bit"""
+        bits = self.bits
+        mask = self._mask
+        birth, survive, counts = self.rule.birth, self.rule.survive, self._counts
+        padded = self._halo()
+        new_bits = [0] * self.rows
+        
+        for row in range(self.rows):
+            above, middle, below = padded[row], padded[row + 1], padded[row + 2]
+            current = bits[row]
+            
+            # Penjumlah bit-sliced: s0..s3 menyimpan jumlah tetangga (0-8)
+            # untuk semua kolom sekaligus. Geseran 0, 1, 2 pada baris berbingkai
+            # menyejajarkan tetangga kiri, tengah, dan kanan dengan kolom sel.
+            s0 = s1 = s2 = s3 = 0
+            for x in (above, above >> 1, above >> 2,
+                      middle, middle >> 2,
+                      below, below >> 1, below >> 2):
+                carry0 = s0 & x
+                s0 ^= x
+                carry1 = s1 & carry0
+                s1 ^= carry0
+                carry2 = s2 & carry1
+                s2 ^= carry1
+                s3 |= carry2
+            
+            # Mask "jumlah tetangga == n" dibangun dari keempat bit-plane,
+            # lalu digabung sesuai himpunan lahir dan bertahan dari aturan
+            planes = ((s0, ~s0), (s1, ~s1), (s2, ~s2), (s3, ~s3))
+            born = stay = 0
+            for n in counts:
+                equal = mask
+                for bit, (plane, inverted) in enumerate(planes):
+                    equal &= plane if n >> bit & 1 else inverted
+                if n in birth:
+                    born |= equal
+                if n in survive:
+                    stay |= equal
+            new_bits[row] = ((born & ~current) | (stay & current)) & mask
+        
+        self._previous = bits
+        self.bits = new_bits
+    
+    def is_empty(self):
+        """Memeriksa apakah semua sel mati"""
+        return not any(self.bits)
+    
+    def population(self):
+        """Menghitung jumlah sel hidup"""
+        return sum(row.bit_count() for row in self.bits)
+    
+    def changed_cells(self):
+        """Mengembalikan koordinat sel yang berubah oleh langkah terakhir"""
+        if self._previous is None:
+            return []
+        changed = []
+        for row, (current, previous) in enumerate(zip(self.bits, self._previous)):
+            diff = current ^ previous
+            while diff:
+                low = diff & -diff
+                changed.append((row, low.bit_length() - 1))
+                diff ^= low
+        return changed
+    
+    def step_counts(self):
+        """Jumlah (kelahiran, kematian) langkah terakhir dari popcount per baris"""
+        if self._previous is None:
+            return 0, 0
+        pairs = list(zip(self.bits, self._previous))
+        return (sum((new & ~old).bit_count() for new, old in pairs),
+                sum((old & ~new).bit_count() for new, old in pairs))
+    
+    def bounding_box(self):
+        """Kotak pembatas sel hidup: OR semua baris memberi rentang kolom"""
+        rows = [row for row, value in enumerate(self.bits) if value]
+        if not rows:
+            return None
+        union = 0
+        for value in self.bits:
+            union |= value
+        return rows[0], (union & -union).bit_length() - 1, rows[-1], union.bit_length() - 1
+    
+    def box_changed(self, box):
+        """True jika ada sel hidup di luar kotak box atau sel mati di tepinya (mask per baris)"""
+        if self._previous is None:
+            return True
+        min_row, min_col, max_row, max_col = box
+        bits, previous = self.bits, self._previous
+        inside = ((1 << (max_col + 1)) - 1) >> min_col << min_col
+        if (any(bits[:min_row]) or any(bits[max_row + 1:]) or
+                any(value & ~inside for value in bits[min_row:max_row + 1])):
+            return True
+        # Baris tepi atas/bawah diperiksa selebar kotak, baris lain hanya kolom tepinya
+        sides = (1 << min_col) | (1 << max_col)
+        for row in range(min_row, max_row + 1):
+            mask = inside if row == min_row or row == max_row else sides
+            if previous[row] & ~bits[row] & mask:
+                return True
+        return False
+    
+    def live_cells(self):
+        """Mengembalikan daftar koordinat (row, col) sel hidup"""
+        cells = []
+        for row, value in enumerate(self.bits):
+            while value:
+                low = value & -value
+                cells.append((row, low.bit_length() - 1))
+                value ^= low
+        return cells
+    
+    def live_cells_in(self, top, left, height, width):
+        """Sel hidup di dalam jendela: setiap baris digeser lalu di-mask selebar jendela"""
+        col0 = max(left, 0)
+        mask = (1 << max(left + width - col0, 0)) - 1
+        cells = []
+        for row in range(max(top, 0), min(top + height, self.rows)):
+            value = (self.bits[row] >> col0) & mask
+            while value:
+                low = value & -value
+                cells.append((row, col0 + low.bit_length() - 1))
+                value ^= low
+        return cells
+    
+    def packed_rows(self):
+        """Salinan baris bit-packed (bit ke-c = kolom c), untuk riwayat"""
+        return list(self.bits)
+    
+    def to_grid(self):
+        """Mengembalikan salinan papan dalam bentuk Grid"""
+        grid = Grid(self.rows, self.cols, "B")
+        for row in range(self.rows):
+            value = self.bits[row]
+            grid[row][:] = [(value >> col) & 1 for col in range(self.cols)]
+        return grid
+
+
+class ActiveSetEngine:
+    """
+    Engine inkremental: hanya sel yang berubah pada generasi sebelumnya beserta
+    8 tetangganya yang dievaluasi ulang, sehingga biaya per generasi sebanding
+    dengan aktivitas, bukan luas papan
+    """
+    
+    name = "active"
+    bounded = True
+    
+    def __init__(self, rows, cols, rule=None, boundary="dead"):
+        """
+        Membuat engine dengan papan kosong
+        Args:
+            rows: jumlah baris grid
+            cols: jumlah kolom grid
+            rule: LifeRule (default B3/S23)
+            boundary: mode batas (lihat BOUNDARIES)
+        """
+        self.rule = parse_rule(rule)
+        # Sel yang tidak pernah disentuh perubahan dianggap tetap, sehingga
+        # aturan B0 (lahir tanpa tetangga) tidak dapat dijalankan
+        _require_no_b0(self.rule, self.name)
+        self.boundary = boundary
+        self.rows = rows
+        self.cols = cols
+        # Sel yang jumlah tetangganya berubah saat sebuah sel dibalik, per sumbu
+        self._row_index = _halo_index(rows, boundary)
+        self._col_index = _halo_index(cols, boundary)
+        self._row_sources = _halo_sources(self._row_index)
+        self._col_sources = _halo_sources(self._col_index)
+        self.clear()
+    
+    def clear(self):
+        """Mematikan semua sel"""
+        self.cells = [bytearray(self.cols) for _ in range(self.rows)]
+        # Jumlah tetangga hidup setiap sel, diperbarui saat ada sel yang berubah
+        self.counts = [bytearray(self.cols) for _ in range(self.rows)]
+        self._changed = set()
+        self._population = 0
+    
+    def get_cell(self, row, col):
+        """Mendapatkan nilai sel (posisi diasumsikan valid)"""
+        return self.cells[row][col]
+    
+    def set_cell(self, row, col, value):
+        """Mengatur nilai sel (posisi diasumsikan valid)"""
+        value = 1 if value else 0
+        if self.cells[row][col] != value:
+            self._flip(row, col)
+            self._changed.add((row, col))
+    
+    def set_cells(self, cells, value=1):
+        """
+        Mengatur banyak sel sekaligus: sel ditulis langsung lalu jumlah
+        tetangga dihitung ulang satu kali (bukan per sel lewat _flip)
+        """
+        value = 1 if value else 0
+        lines, changed = self.cells, self._changed
+        for row, col in cells:
+            line = lines[row]
+            if line[col] != value:
+                line[col] = value
+                changed.add((row, col))
+        self._population = sum(line.count(1) for line in lines)
+        self._rebuild_counts()
+    
+    def load_bytes(self, data):
+        """
+        Mengisi seluruh papan dari buffer satu byte per sel (rows * cols byte)
+        sekaligus; sel yang berubah dicari dari XOR papan lama dan baru
+        """
+        rows, cols = self.rows, self.cols
+        diff = int.from_bytes(b"".join(self.cells), "little") ^ int.from_bytes(data, "little")
+        self._changed.update(_live_cells_in(diff.to_bytes(rows * cols, "little"),
+                                            rows, cols, 0, 0, rows, cols))
+        self.cells = [bytearray(data[start:start + cols]) for start in range(0, rows * cols, cols)]
+        self._population = data.count(1)
+        self._rebuild_counts()
+    
+    def _rebuild_counts(self):
+        """
+        Menghitung ulang jumlah tetangga seluruh papan. Setiap baris berbingkai
+        dibaca sebagai bilangan bulat (satu byte per sel), sehingga jumlah tiga
+        kolom bertetangga cukup dengan geseran dan penjumlahan; jumlah maksimum
+        8 tidak pernah melimpah ke byte berikutnya.
+        """
+        cols = self.cols
+        left, right = self._col_index[0], self._col_index[-1]
+        # Per baris berbingkai: (kolom kiri + kanan, kolom tengah)
+        padded = []
+        for source in self._row_index:
+            if source is None:
+                padded.append((0, 0))
+                continue
+            line = self.cells[source]
+            framed = (bytes((0 if left is None else line[left],)) + line +
+                      bytes((0 if right is None else line[right],)))
+            value = int.from_bytes(framed, "little")
+            padded.append((value + (value >> 16), value >> 8))
+        counts = []
+        for row in range(self.rows):
+            (above, above_centre), (sides, _), (below, below_centre) = padded[row:row + 3]
+            total = above + above_centre + sides + below + below_centre
+            counts.append(bytearray(total.to_bytes(cols + 2, "little")[:cols]))
+        self.counts = counts
+    
+    def _flip(self, row, col):
+        """Membalik status sel dan memperbarui jumlah tetangga di sekitarnya"""
+        cells = self.cells
+        delta = -1 if cells[row][col] else 1
+        cells[row][col] += delta
+        self._population += delta
+        
+        counts = self.counts
+        col_sources = self._col_sources[col]
+        for r, dr in self._row_sources[row]:
+            counts_row = counts[r]
+            for c, dc in col_sources:
+                # Offset (0, 0) adalah sel itu sendiri, bukan tetangganya. Pada mode
+                # reflect sel di tepi tetap bisa menjadi tetangga dirinya (cermin).
+                if dr or dc:
+                    counts_row[c] += delta
+    
+    def count_neighbors(self, row, col):
+        """Menghitung jumlah tetangga hidup dari sel pada posisi (row, col)"""
+        return self.counts[row][col]
+    
+    def step(self):
+        """Mengevaluasi ulang hanya sel di sekitar perubahan generasi sebelumnya"""
+        row_sources, col_sources = self._row_sources, self._col_sources
+        candidates = set()
+        for row, col in self._changed:
+            for r, _ in row_sources[row]:
+                for c, _ in col_sources[col]:
+                    candidates.add((r, c))
+        
+        # Kumpulkan semua perubahan dulu agar evaluasi memakai generasi lama
+        cells, counts = self.cells, self.counts
+        table = self.rule.table
+        flips = [(row, col) for row, col in candidates
+                 if table[cells[row][col] * 9 + counts[row][col]] != cells[row][col]]
+        
+        for row, col in flips:
+            self._flip(row, col)
+        self._changed = set(flips)
+    
+    def is_empty(self):
+        """Memeriksa apakah semua sel mati"""
+        return self._population == 0
+    
+    def population(self):
+        """Mengembalikan jumlah sel hidup (dihitung berjalan, tanpa memindai papan)"""
+        return self._population
+    
+    def changed_cells(self):
+        """Mengembalikan koordinat sel yang berubah oleh langkah terakhir"""
+        return list(self._changed)
+    
+    def step_counts(self):
+        """Jumlah (kelahiran, kematian) langkah terakhir dari himpunan sel yang dibalik"""
+        cells = self.cells
+        births = sum(cells[row][col] for row, col in self._changed)
+        return births, len(self._changed) - births
+    
+    def bounding_box(self):
+        """Kotak pembatas sel hidup (None jika kosong)"""
+        return _bytes_bounding_box(b"".join(self.cells), self.rows, self.cols)
+    
+    def box_changed(self, box):
+        """True jika ada sel hidup di luar kotak box atau sel mati di tepinya"""
+        min_row, min_col, max_row, max_col = box
+        cells = self.cells
+        for row, col in self._changed:
+            if cells[row][col]:
+                if not (min_row <= row <= max_row and min_col <= col <= max_col):
+                    return True
+            elif not (min_row < row < max_row and min_col < col < max_col):
+                return True
+        return False
+    
+    def live_cells(self):
+        """Mengembalikan daftar koordinat (row, col) sel hidup"""
+        return [(row, col)
+                for row in range(self.rows)
+                for col, value in enumerate(self.cells[row])
+                if value]
+    
+    def live_cells_in(self, top, left, height, width):
+        """Sel hidup di dalam jendela height x width yang berpojok (top, left)"""
+        cells = []
+        col0, col1 = max(left, 0), min(left + width, self.cols)
+        if col0 >= col1:
+            return cells
+        for row in range(max(top, 0), min(top + height, self.rows)):
+            line = self.cells[row]
+            index = line.find(1, col0, col1)
+            while index >= 0:
+                cells.append((row, index))
+                index = line.find(1, index + 1, col1)
+        return cells
+    
+    def packed_rows(self):
+        """Setiap baris sebagai bilangan bulat (bit ke-c = kolom c), untuk riwayat"""
+        return _packed_rows(b"".join(self.cells), self.rows, self.cols)
+    
+    def to_grid(self):
+        """Mengembalikan salinan papan dalam bentuk Grid"""
+        grid = Grid(self.rows, self.cols, "B")
+        for row in range(self.rows):
+            grid[row][:] = self.cells[row]
+        return grid
+
+
+class SparseEngine:
+    """
+    Semesta tak terbatas: sel hidup disimpan sebagai himpunan koordinat sehingga
+    memori dan waktu sebanding dengan populasi, bukan luas kotak pembatas.
+    rows dan cols hanya menjadi ukuran jendela tampilan, kecuali jika dipilih
+    salah satu mode BOUNDARIES yang membatasi semesta pada rows x cols.
+    """
+    
+    name = "sparse"
+    bounded = False
+    
+    def __init__(self, rows, cols, rule=None, boundary="infinite"):
+        """
+        Membuat semesta kosong
+        Args:
+            rows: jumlah baris jendela tampilan
+            cols: jumlah kolom jendela tampilan
+            rule: LifeRule (default B3/S23)
+            boundary: "infinite" atau mode batas (lihat BOUNDARIES)
+        """
+        self.rule = parse_rule(rule)
+        _require_no_b0(self.rule, self.name)
+        self.boundary = boundary
+        self.rows = rows
+        self.cols = cols
+        if boundary != "infinite":
+            self.bounded = True
+            self._row_index = _halo_index(rows, boundary)
+            self._col_index = _halo_index(cols, boundary)
+            # Posisi yang dibaca sel (termasuk dirinya) pada setiap sumbu
+            self._row_near = [[r for r in self._row_index[row:row + 3] if r is not None]
+                              for row in range(rows)]
+            self._col_near = [[c for c in self._col_index[col:col + 3] if c is not None]
+                              for col in range(cols)]
+        self.clear()
+    
+    def clear(self):
+        """Mematikan semua sel"""
+        self.live = set()
+        self._previous = None
+    
+    def get_cell(self, row, col):
+        """Mendapatkan nilai sel pada koordinat mana pun"""
+        return 1 if (row, col) in self.live else 0
+    
+    def set_cell(self, row, col, value):
+        """Mengatur nilai sel pada koordinat mana pun"""
+        if value:
+            self.live.add((row, col))
+        else:
+            self.live.discard((row, col))
+    
+    def set_cells(self, cells, value=1):
+        """Mengatur banyak sel sekaligus"""
+        if value:
+            self.live.update(cells)
+        else:
+            self.live.difference_update(cells)
+    
+    def count_neighbors(self, row, col):
+        """Menghitung jumlah tetangga hidup dari sel pada posisi (row, col)"""
+        if self.bounded:
+            return _count_neighbors_indexed(self.get_cell, self._row_index,
+                                            self._col_index, row, col)
+        live = self.live
+        return sum((row + dr, col + dc) in live for dr, dc in NEIGHBOR_OFFSETS)
+    
+    def _step_bounded(self):
+        """Langkah pada semesta terbatas: tetangga dipetakan lewat tabel halo"""
+        live = self.live
+        row_near, col_near = self._row_near, self._col_near
+        # Jumlah mencakup sel itu sendiri (offset 0, 0), dikurangi untuk sel hidup
+        counts = Counter((r, c)
+                         for row, col in live
+                         for r in row_near[row]
+                         for c in col_near[col])
+        table = self.rule.table
+        self._previous = live
+        self.live = {cell for cell, n in counts.items()
+                     if table[(cell in live) * 9 + n - (cell in live)]}
+    
+    def step(self):
+        """Menghitung generasi berikutnya hanya dari sel hidup dan tetangganya"""
+        if self.bounded:
+            self._step_bounded()
+            return
+        live = self.live
+        counts = Counter((row + dr, col + dc)
+                         for row, col in live
+                         for dr, dc in NEIGHBOR_OFFSETS)
+        table = self.rule.table
+        self._previous = live
+        self.live = {cell for cell, n in counts.items() if table[(cell in live) * 9 + n]}
+        if 0 in self.rule.survive:
+            # Sel hidup tanpa tetangga tidak muncul di counts
+            self.live.update(cell for cell in live if cell not in counts)
+    
+    def is_empty(self):
+        """Memeriksa apakah semua sel mati"""
+        return not self.live
+    
+    def population(self):
+        """Menghitung jumlah sel hidup"""
+        return len(self.live)
+    
+    def changed_cells(self):
+        """Mengembalikan koordinat sel yang berubah oleh langkah terakhir"""
+        if self._previous is None:
+            return []
+        return list(self.live ^ self._previous)
+    
+    def step_counts(self):
+        """Jumlah (kelahiran, kematian) langkah terakhir dari selisih himpunan sel hidup"""
+        if self._previous is None:
+            return 0, 0
+        return len(self.live - self._previous), len(self._previous - self.live)
+    
+    def live_cells(self):
+        """Mengembalikan daftar koordinat (row, col) sel hidup"""
+        return list(self.live)
+    
+    def to_grid(self):
+        """Mengembalikan salinan jendela (0, 0) - (rows, cols) dalam bentuk Grid"""
+        grid = Grid(self.rows, self.cols, "B")
+        for row, col in self.live:
+            if 0 <= row < self.rows and 0 <= col < self.cols:
+                grid[row][col] = 1
+        return grid
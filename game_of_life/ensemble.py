@@ -0,0 +1,102 @@
+"""Menjalankan banyak papan acak sekaligus (ensemble) di process pool"""
+
+import random
+import itertools
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .core import GameOfLife
+from .engines import _fill_halo, _halo_index, _numpy_next
+from .optional import load_numpy
+from .patterns import RANDOM_DENSITY
+from .rules import parse_rule
+
+# ==================== ENSEMBLE ====================
+EnsembleResult = namedtuple("EnsembleResult", ["seeds", "populations", "extinction_generations"])
+
+
+def random_board(rows, cols, seed):
+    """
+    Papan acak yang identik dengan setup_pattern(game, "random", random.Random(seed)),
+    sebagai daftar bytearray per baris
+    """
+    rng = random.Random(seed)
+    return [bytearray(1 if rng.random() < RANDOM_DENSITY else 0 for _ in range(cols))
+            for _ in range(rows)]
+
+
+def _ensemble_chunk(rows, cols, seeds, generations, rule, boundary):
+    """
+    Menjalankan sekelompok papan bersama-sama
+    Returns:
+        daftar deret populasi (panjang generations + 1) per papan
+    """
+    np = load_numpy()
+    if np is None:
+        # Tanpa NumPy: setiap papan dijalankan dengan engine bitset
+        series = []
+        for seed in seeds:
+            game = GameOfLife(rows, cols, engine="bitset", rule=rule, boundary=boundary)
+            game.set_cells((row, col)
+                           for row, line in enumerate(random_board(rows, cols, seed))
+                           for col, value in enumerate(line) if value)
+            populations = [game.get_population()]
+            for _ in range(generations):
+                game.next_generation()
+                populations.append(game.get_population())
+            series.append(populations)
+        return series
+    
+    # Semua papan ditumpuk menjadi satu array (N, rows + 2, cols + 2)
+    padded = np.zeros((len(seeds), rows + 2, cols + 2), dtype=np.uint8)
+    for index, seed in enumerate(seeds):
+        padded[index, 1:-1, 1:-1] = np.array(random_board(rows, cols, seed), dtype=np.uint8)
+    
+    lut = np.array(parse_rule(rule).table, dtype=np.uint8)
+    row_index, col_index = _halo_index(rows, boundary), _halo_index(cols, boundary)
+    inner = padded[:, 1:-1, 1:-1]
+    populations = np.empty((len(seeds), generations + 1), dtype=np.int64)
+    populations[:, 0] = inner.sum(axis=(1, 2))
+    for generation in range(1, generations + 1):
+        _fill_halo(padded, col_index, row_index)
+        inner[...] = _numpy_next(padded, lut)
+        populations[:, generation] = inner.sum(axis=(1, 2))
+    return populations.tolist()
+
+
+def run_ensemble(rows, cols, seeds, generations, workers=None, chunk_size=256,
+                 rule="B3/S23", boundary="dead"):
+    """
+    Menjalankan banyak papan acak independen (satu per seed) sekaligus
+    Args:
+        rows, cols: ukuran setiap papan
+        seeds: daftar seed; papan ke-i sama dengan setup_pattern(..., "random",
+               random.Random(seeds[i])) sehingga hasilnya dapat direproduksi
+        generations: jumlah generasi
+        workers: jumlah proses (default: jumlah CPU); dipakai jika papan
+                 lebih banyak dari chunk_size
+        chunk_size: jumlah papan per kelompok yang ditumpuk
+        rule: aturan life-like untuk semua papan
+        boundary: mode batas untuk semua papan (lihat BOUNDARIES)
+    Returns:
+        EnsembleResult berisi deret populasi per papan dan generasi kepunahan
+        (None jika papan tidak punah)
+    """
+    seeds = list(seeds)
+    rule = parse_rule(rule).notation
+    chunks = [seeds[i:i + chunk_size] for i in range(0, len(seeds), chunk_size)]
+    if len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = pool.map(_ensemble_chunk, itertools.repeat(rows),
+                             itertools.repeat(cols), chunks, itertools.repeat(generations),
+                             itertools.repeat(rule), itertools.repeat(boundary))
+            populations = [series for part in parts for series in part]
+    else:
+        populations = [series for chunk in chunks
+                       for series in _ensemble_chunk(rows, cols, chunk, generations,
+                                                     rule, boundary)]
+    
+    extinction = [next((generation for generation, population in enumerate(series)
+                        if population == 0), None)
+                  for series in populations]
+    return EnsembleResult(seeds, populations, extinction)
@@ -0,0 +1,408 @@
+"""Membaca/menulis file pola (RLE, plaintext) dan checkpoint biner"""
+
+import os
+import queue
+import threading
+import mmap
+import struct
+
+from .core import GameOfLife
+from .engines import BOUNDARIES, BitsetEngine, NumpyEngine, _unpacked_rows
+from .optional import load_numpy
+from .rules import parse_rule
+
+# ==================== FILE POLA (RLE & PLAINTEXT) ====================
+class RLEReader:
+    """
+    Pembaca format RLE yang bekerja sebagai stream: header dibaca per baris,
+    isi pola dibaca per potongan sehingga teks yang sudah diekspansi tidak
+    pernah disimpan di memori
+    """
+    
+    def __init__(self, stream, chunk_size=1 << 16):
+        """
+        Args:
+            stream: file teks yang sudah dibuka
+            chunk_size: ukuran potongan pembacaan isi pola (karakter)
+        """
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.comments = []
+        self.width = None
+        self.height = None
+        self.rule = None
+        self._pending = ""
+        self._read_header()
+    
+    def _read_header(self):
+        """Membaca baris komentar (#) dan baris 'x = .., y = .., rule = ..'"""
+        while True:
+            line = self.stream.readline()
+            if not line:
+                return
+            stripped = line.strip()
+            if not stripped:
+                continue
+            if stripped.startswith("#"):
+                self.comments.append(stripped)
+                continue
+            if stripped.startswith("x"):
+                for part in stripped.split(","):
+                    key, _, value = part.partition("=")
+                    key, value = key.strip(), value.strip()
+                    if key == "x":
+                        self.width = int(value)
+                    elif key == "y":
+                        self.height = int(value)
+                    elif key == "rule":
+                        self.rule = value
+                return
+            # Tanpa baris header: baris ini sudah bagian dari isi pola
+            self._pending = line
+            return
+    
+    def _chunks(self):
+        """Menghasilkan potongan teks isi pola"""
+        if self._pending:
+            yield self._pending
+        while True:
+            chunk = self.stream.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    
+    def runs(self):
+        """
+        Menghasilkan deretan sel hidup sebagai (row, col, panjang), relatif
+        terhadap pojok kiri atas pola
+        """
+        row = col = 0
+        count = ""
+        for chunk in self._chunks():
+            for char in chunk:
+                if char.isdigit():
+                    count += char
+                    continue
+                if char in " \t\r\n":
+                    continue
+                n = int(count) if count else 1
+                count = ""
+                if char == "!":
+                    return
+                if char == "$":
+                    row += n
+                    col = 0
+                elif char in "b.":
+                    col += n
+                elif char.isalpha():
+                    yield row, col, n
+                    col += n
+                else:
+                    raise ValueError(f"Format RLE tidak valid: karakter {char!r}")
+    
+    def cells(self):
+        """Menghasilkan koordinat (row, col) setiap sel hidup"""
+        for row, col, n in self.runs():
+            for offset in range(n):
+                yield row, col + offset
+
+
+def iter_plaintext_cells(stream):
+    """Menghasilkan koordinat sel hidup dari format plaintext (.cells), baris demi baris"""
+    row = 0
+    for line in stream:
+        if line.startswith("!"):
+            continue
+        for col, char in enumerate(line.rstrip("\r\n")):
+            if char in "Oo*":
+                yield row, col
+        row += 1
+
+
+def load_pattern_file(game, path, top=None, left=None):
+    """
+    Memuat pola dari file RLE (.rle) atau plaintext (.cells/.txt) ke papan
+    Args:
+        game: GameOfLife (atau HashLife)
+        path: path file pola
+        top, left: posisi pojok kiri atas pola; default RLE ditempatkan di
+                   tengah grid (jika ukurannya tercantum), plaintext di (0, 0)
+    Returns:
+        game
+    """
+    with open(path, encoding="utf-8") as stream:
+        if path.lower().endswith(".rle"):
+            reader = RLEReader(stream)
+            if top is None:
+                top = max((game.rows - (reader.height or 0)) // 2, 0)
+            if left is None:
+                left = max((game.cols - (reader.width or 0)) // 2, 0)
+            cells = reader.cells()
+        else:
+            top = top or 0
+            left = left or 0
+            cells = iter_plaintext_cells(stream)
+        
+        placed = ((row + top, col + left) for row, col in cells)
+        if hasattr(game, "set_cells"):
+            game.set_cells(placed)
+        else:
+            for row, col in placed:
+                game.set_cell(row, col, 1)
+    return game
+
+
+def _rows_of_cells(game):
+    """Mengelompokkan sel hidup per baris (terurut) beserta kotak pembatasnya"""
+    cells = sorted(game.engine.live_cells() if hasattr(game, "engine") else game.live_cells())
+    if not cells:
+        return [], (0, 0, -1, -1)
+    min_row = cells[0][0]
+    max_row = cells[-1][0]
+    min_col = min(col for _, col in cells)
+    max_col = max(col for _, col in cells)
+    rows = []
+    for row, col in cells:
+        if not rows or rows[-1][0] != row:
+            rows.append((row, []))
+        rows[-1][1].append(col)
+    return rows, (min_row, min_col, max_row, max_col)
+
+
+def write_rle(game, path, rule=None):
+    """
+    Menyimpan sel hidup papan ke file RLE (baris dibungkus 70 karakter)
+    Args:
+        rule: aturan yang ditulis di header (default: aturan game)
+    """
+    rule = parse_rule(rule or game.rule)
+    rows, (min_row, min_col, max_row, max_col) = _rows_of_cells(game)
+    
+    tokens = []
+    previous_row = min_row
+    for row, cols in rows:
+        if row != previous_row:
+            gap = row - previous_row
+            tokens.append(f"{gap if gap > 1 else ''}$")
+            previous_row = row
+        position = min_col
+        start = None
+        for col in cols + [None]:
+            if start is not None and col == end + 1:
+                end = col
+                continue
+            if start is not None:
+                length = end - start + 1
+                if start > position:
+                    gap = start - position
+                    tokens.append(f"{gap if gap > 1 else ''}b")
+                tokens.append(f"{length if length > 1 else ''}o")
+                position = end + 1
+            start = end = col
+    tokens.append("!")
+    
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"x = {max_col - min_col + 1}, y = {max_row - min_row + 1}, rule = {rule}\n")
+        line = ""
+        for token in tokens:
+            if len(line) + len(token) > 70:
+                f.write(line + "\n")
+                line = ""
+            line += token
+        f.write(line + "\n")
+
+
+def write_plaintext(game, path, name=None):
+    """Menyimpan sel hidup papan ke file plaintext (.cells)"""
+    rows, (min_row, min_col, max_row, max_col) = _rows_of_cells(game)
+    width = max_col - min_col + 1
+    by_row = dict(rows)
+    with open(path, "w", encoding="utf-8") as f:
+        if name:
+            f.write(f"!Name: {name}\n")
+        for row in range(min_row, max_row + 1):
+            line = ["."] * width
+            for col in by_row.get(row, ()):
+                line[col - min_col] = "O"
+            f.write("".join(line).rstrip(".") + "\n")
+
+
+def save_pattern_file(game, path):
+    """Menyimpan papan sesuai ekstensi file: .rle atau plaintext (.cells/.txt)"""
+    if path.lower().endswith(".rle"):
+        write_rle(game, path)
+    else:
+        write_plaintext(game, path)
+
+
+# ==================== CHECKPOINT BINER ====================
+# Format: header tetap + string engine & aturan + papan bit-packed per baris
+# (bit ke-(c % 8) pada byte ke-(c // 8) = kolom c, sama dengan urutan bit
+# int.from_bytes(..., "little") dan numpy.packbits(bitorder="little")).
+# Sejak versi 2 string aturan berbentuk "B3/S23:torus" (aturan:mode batas).
+CHECKPOINT_MAGIC = b"GOLCKPT\0"
+CHECKPOINT_VERSION = 2
+_CHECKPOINT_HEADER = struct.Struct("<8sHIIqqIIQHH")
+
+
+def _pack_board(game, top, left, height, width):
+    """Mengemas area papan menjadi bytes, satu baris = (width + 7) // 8 byte"""
+    row_bytes = (width + 7) // 8
+    engine = game.engine
+    if isinstance(engine, BitsetEngine) and (top, left) == (0, 0):
+        return b"".join(value.to_bytes(row_bytes, "little") for value in engine.bits)
+    if isinstance(engine, NumpyEngine) and (top, left) == (0, 0):
+        np = load_numpy()
+        return np.packbits(engine.cells, axis=1, bitorder="little").tobytes()
+    
+    board = bytearray(row_bytes * height)
+    for row, col in engine.live_cells():
+        row -= top
+        col -= left
+        board[row * row_bytes + (col >> 3)] |= 1 << (col & 7)
+    return bytes(board)
+
+
+def checkpoint_bytes(game):
+    """Membuat isi checkpoint lengkap dari kondisi papan saat ini"""
+    if game.engine.bounded:
+        top, left, height, width = 0, 0, game.rows, game.cols
+    else:
+        box = game.bounding_box() or (0, 0, -1, -1)
+        top, left = box[0], box[1]
+        height, width = box[2] - box[0] + 1, box[3] - box[1] + 1
+    engine_name = game.engine.name.encode()
+    rule_name = f"{game.rule.notation}:{game.boundary}".encode()
+    header = _CHECKPOINT_HEADER.pack(CHECKPOINT_MAGIC, CHECKPOINT_VERSION,
+                                     game.rows, game.cols, top, left, height, width,
+                                     game.generation, len(engine_name), len(rule_name))
+    return header + engine_name + rule_name + _pack_board(game, top, left, height, width)
+
+
+def _write_atomic(path, data):
+    """Menulis file lewat file sementara agar checkpoint lama tidak rusak jika gagal"""
+    temp = f"{path}.tmp"
+    with open(temp, "wb") as f:
+        f.write(data)
+    os.replace(temp, path)
+
+
+def save_checkpoint(game, path):
+    """Menyimpan snapshot biner (papan bit-packed, generasi, dan aturan) ke file"""
+    _write_atomic(path, checkpoint_bytes(game))
+
+
+def load_checkpoint(path, engine=None):
+    """
+    Memulihkan GameOfLife dari file checkpoint. File dibaca lewat mmap sehingga
+    papan besar diambil langsung dari halaman file tanpa parsing penuh.
+    Args:
+        path: file checkpoint
+        engine: engine yang dipakai (default: engine saat checkpoint dibuat)
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        (magic, version, rows, cols, top, left, height, width, generation,
+         engine_len, rule_len) = _CHECKPOINT_HEADER.unpack_from(data)
+        if magic != CHECKPOINT_MAGIC or version not in (1, CHECKPOINT_VERSION):
+            raise ValueError("File bukan checkpoint Game of Life yang didukung")
+        offset = _CHECKPOINT_HEADER.size
+        engine_name = data[offset:offset + engine_len].decode()
+        offset += engine_len
+        rule, _, boundary = data[offset:offset + rule_len].decode().partition(":")
+        offset += rule_len
+        row_bytes = (width + 7) // 8
+        if len(data) < offset + row_bytes * height:
+            raise ValueError("Checkpoint terpotong")
+        
+        # Mode batas ikut dipulihkan, kecuali "infinite" untuk engine lain selain sparse
+        if boundary not in BOUNDARIES and (engine or engine_name) != "sparse":
+            boundary = None
+        game = GameOfLife(rows, cols, engine=engine or engine_name, rule=rule,
+                          boundary=boundary or None)
+        game.generation = generation
+        target = game.engine
+        # Checkpoint engine sparse hanya berisi kotak pembatas (kosong jika papan
+        # kosong): jalur cepat dipakai jika area tersimpan berada di dalam papan
+        inside = (height > 0 and 0 <= top and 0 <= left and
+                  top + height <= rows and left + width <= cols)
+        if isinstance(target, NumpyEngine) and inside:
+            np = load_numpy()
+            packed = np.frombuffer(data, dtype=np.uint8, count=row_bytes * height,
+                                   offset=offset).reshape(height, row_bytes)
+            try:
+                target.cells[top:top + height, left:left + width] = np.unpackbits(
+                    packed, axis=1, count=width, bitorder="little")
+            finally:
+                del packed  # Lepaskan buffer sebelum mmap ditutup
+        elif isinstance(target, BitsetEngine) and inside:
+            bits = [0] * rows
+            bits[top:top + height] = [
+                int.from_bytes(data[start:start + row_bytes], "little") << left
+                for start in range(offset, offset + row_bytes * height, row_bytes)]
+            target.bits = bits
+        elif (hasattr(target, "load_bytes") and
+              (top, left, height, width) == (0, 0, rows, cols)):
+            # Engine satu byte per sel: baris dibuka per baris lalu disalin sekaligus
+            target.load_bytes(_unpacked_rows(
+                (int.from_bytes(data[start:start + row_bytes], "little")
+                 for start in range(offset, offset + row_bytes * height, row_bytes)),
+                width))
+        else:
+            def cells():
+                for row in range(height):
+                    start = offset + row * row_bytes
+                    value = int.from_bytes(data[start:start + row_bytes], "little")
+                    while value:
+                        low = value & -value
+                        yield top + row, left + low.bit_length() - 1
+                        value ^= low
+            game.set_cells(cells())
+    return game
+
+
+class AutoCheckpointer:
+    """
+    Checkpoint otomatis setiap N generasi. Pada jalur stepping hanya dibuat
+    salinan papan bit-packed; penulisan ke disk dilakukan thread terpisah.
+    Jika penulisan sebelumnya belum selesai, snapshot yang menunggu diganti
+    dengan yang terbaru.
+    """
+    
+    def __init__(self, path, every=1000):
+        """
+        Args:
+            path: file checkpoint (ditimpa setiap kali)
+            every: interval checkpoint dalam generasi
+        """
+        self.path = path
+        self.every = every
+        self._pending = queue.Queue(maxsize=1)
+        self._thread = threading.Thread(target=self._writer, daemon=True)
+        self._thread.start()
+    
+    def capture(self, game):
+        """Dipanggil setelah setiap generasi; membuat snapshot jika sudah waktunya"""
+        if game.generation % self.every == 0:
+            data = checkpoint_bytes(game)
+            while True:
+                try:
+                    self._pending.put_nowait(data)
+                    return
+                except queue.Full:
+                    try:
+                        self._pending.get_nowait()
+                    except queue.Empty:
+                        pass
+    
+    def _writer(self):
+        """Thread penulis: menyimpan snapshot yang masuk ke disk"""
+        while True:
+            data = self._pending.get()
+            if data is None:
+                return
+            _write_atomic(self.path, data)
+    
+    def close(self):
+        """Menunggu snapshot terakhir ditulis lalu menghentikan thread"""
+        self._pending.put(None)
+        self._thread.join()
@@ -0,0 +1,803 @@
+"""Versi GUI (tkinter); tkinter baru diimpor saat GUI dibuat"""
+
+import os
+
+from .core import GameOfLife
+from .engines import BOUNDARIES
+from .fileio import load_pattern_file, save_pattern_file
+from .patterns import setup_pattern
+from .profiling import PROFILER
+from .rules import LifeRule, RULES, parse_rule
+from .worker import SimulationWorker, Viewport, density_image_data, density_palette
+
+# tkinter baru diimpor saat GUI dibuat (lihat _load_tkinter) agar mode headless
+# tetap bisa berjalan di server tanpa Tk/display
+tk = ttk = filedialog = None
+
+# ==================== GUI VERSION ====================
+def _load_tkinter():
+    """Mengimpor tkinter sekali, saat GUI pertama kali dibuat"""
+    global tk, ttk, filedialog
+    if tk is None:
+        import tkinter as tk
+        from tkinter import ttk, filedialog
+
+
+class GameOfLifeGUI:
+    """GUI untuk Game of Life"""
+    
+    ALIVE_COLOR = '#2c3e50'  # Dark blue-gray for alive
+    DEAD_COLOR = '#ecf0f1'  # Light gray for dead
+    PATTERN_FILETYPES = [("RLE", "*.rle"), ("Plaintext", "*.cells *.txt"), ("Semua file", "*")]
+    # Piksel per sel; di bawah DETAIL_ZOOM papan digambar sebagai satu gambar kepadatan
+    ZOOM_LEVELS = (1 / 16, 1 / 8, 1 / 4, 1 / 2, 1, 2, 3, 4, 6, 8, 10, 15, 20, 30)
+    DETAIL_ZOOM = 6
+    MAX_VIEW_WIDTH = 900
+    MAX_VIEW_HEIGHT = 600
+    # Riwayat generasi untuk mundur; aktif otomatis hanya pada papan sampai HISTORY_MAX_CELLS
+    HISTORY_CAPACITY = 500
+    HISTORY_KEYFRAME_INTERVAL = 25
+    HISTORY_MAX_CELLS = 250_000
+    
+    def __init__(self, rows=30, cols=50, cell_size=15, engine="python", rule="B3/S23",
+                 boundary=None):
+        _load_tkinter()
+        self.rows = rows
+        self.cols = cols
+        self.cell_size = cell_size
+        self.engine = engine
+        self.rule = parse_rule(rule)
+        self.boundary = boundary
+        self.keep_history = rows * cols <= self.HISTORY_MAX_CELLS
+        self.game = self.new_game()
+        self.running = False
+        self.speed = 200  # milliseconds
+        self.worker = None
+        self.frame_interval = 15  # milliseconds antar pengecekan frame
+        
+        # Viewport: ukuran canvas tetap, zoom dan pojok kiri atas jendela bisa diubah
+        self.view_width = min(cols * cell_size, self.MAX_VIEW_WIDTH)
+        self.view_height = min(rows * cell_size, self.MAX_VIEW_HEIGHT)
+        self.zoom_levels = tuple(sorted(set(self.ZOOM_LEVELS) | {cell_size}))
+        self.zoom = self.fit_zoom(rows, cols)
+        self.origin = (0, 0)
+        # Pada semesta tak terbatas jendela mengikuti pola sampai pengguna menggeser
+        self.follow = not self.game.engine.bounded
+        self.pan_start = None
+        
+        # Buat window
+        self.root = tk.Tk()
+        self.root.title("Conway's Game of Life")
+        
+        # Frame utama
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Frame untuk canvas
+        canvas_frame = ttk.Frame(main_frame)
+        canvas_frame.pack(padx=5, pady=5)
+        
+        # Canvas untuk grid
+        self.canvas = tk.Canvas(
+            canvas_frame,
+            width=self.view_width,
+            height=self.view_height,
+            bg='white',
+            highlightthickness=1,
+            highlightbackground='gray'
+        )
+        self.canvas.pack()
+        
+        # Bind click event
+        self.canvas.bind('<Button-1>', self.toggle_cell)
+        self.canvas.bind('<B1-Motion>', self.drag_cell)
+        
+        # Geser dengan tombol kanan/tengah atau panah, zoom dengan roda mouse atau +/-
+        for button in (2, 3):
+            self.canvas.bind(f'<ButtonPress-{button}>', self.start_pan)
+            self.canvas.bind(f'<B{button}-Motion>', self.pan)
+        self.canvas.bind('<MouseWheel>', self.wheel_zoom)
+        self.canvas.bind('<Button-4>', self.wheel_zoom)
+        self.canvas.bind('<Button-5>', self.wheel_zoom)
+        for key, (drow, dcol) in {'<Up>': (-1, 0), '<Down>': (1, 0),
+                                  '<Left>': (0, -1), '<Right>': (0, 1)}.items():
+            self.canvas.bind(key, lambda event, d=(drow, dcol): self.pan_step(*d))
+        for key in ('<plus>', '<equal>', '<KP_Add>'):
+            self.canvas.bind(key, lambda event: self.zoom_by(1))
+        for key in ('<minus>', '<KP_Subtract>'):
+            self.canvas.bind(key, lambda event: self.zoom_by(-1))
+        
+        # Frame untuk kontrol tampilan
+        view_frame = ttk.Frame(main_frame)
+        view_frame.pack()
+        
+        ttk.Button(view_frame, text="−", command=lambda: self.zoom_by(-1),
+                   width=3).pack(side=tk.LEFT, padx=2)
+        ttk.Button(view_frame, text="+", command=lambda: self.zoom_by(1),
+                   width=3).pack(side=tk.LEFT, padx=2)
+        ttk.Button(view_frame, text="⌂ Pas", command=self.fit_view,
+                   width=6).pack(side=tk.LEFT, padx=2)
+        self.zoom_label = ttk.Label(view_frame, text="", foreground='gray')
+        self.zoom_label.pack(side=tk.LEFT, padx=10)
+        
+        # Frame untuk kontrol
+        control_frame = ttk.Frame(main_frame)
+        control_frame.pack(pady=10)
+        
+        # Tombol kontrol
+        self.start_btn = ttk.Button(
+            control_frame,
+            text="▶ Start",
+            command=self.start_simulation,
+            width=12
+        )
+        self.start_btn.pack(side=tk.LEFT, padx=3)
+        
+        self.stop_btn = ttk.Button(
+            control_frame,
+            text="⏸ Stop",
+            command=self.stop_simulation,
+            width=12,
+            state=tk.DISABLED
+        )
+        self.stop_btn.pack(side=tk.LEFT, padx=3)
+        
+        self.clear_btn = ttk.Button(
+            control_frame,
+            text="🗑 Clear",
+            command=self.clear_grid,
+            width=12
+        )
+        self.clear_btn.pack(side=tk.LEFT, padx=3)
+        
+        self.random_btn = ttk.Button(
+            control_frame,
+            text="🎲 Random",
+            command=self.random_grid,
+            width=12
+        )
+        self.random_btn.pack(side=tk.LEFT, padx=3)
+        
+        self.open_btn = ttk.Button(
+            control_frame,
+            text="📂 Muat",
+            command=self.open_pattern_file,
+            width=10
+        )
+        self.open_btn.pack(side=tk.LEFT, padx=3)
+        
+        self.save_btn = ttk.Button(
+            control_frame,
+            text="💾 Simpan",
+            command=self.save_pattern_file,
+            width=10
+        )
+        self.save_btn.pack(side=tk.LEFT, padx=3)
+        
+        # Frame untuk riwayat generasi
+        history_frame = ttk.Frame(main_frame)
+        history_frame.pack(pady=5)
+        
+        self.back_btn = ttk.Button(
+            history_frame,
+            text="◀ Mundur",
+            command=self.step_back,
+            width=12
+        )
+        self.back_btn.pack(side=tk.LEFT, padx=3)
+        
+        ttk.Label(history_frame, text="Timeline:").pack(side=tk.LEFT, padx=5)
+        self.updating_timeline = False
+        self.timeline = ttk.Scale(
+            history_frame,
+            from_=0,
+            to=0,
+            orient=tk.HORIZONTAL,
+            length=300,
+            command=self.scrub_timeline
+        )
+        self.timeline.pack(side=tk.LEFT, padx=5)
+        
+        self.history_var = tk.BooleanVar(value=self.keep_history)
+        ttk.Checkbutton(
+            history_frame,
+            text="Simpan riwayat",
+            variable=self.history_var,
+            command=self.toggle_history
+        ).pack(side=tk.LEFT, padx=10)
+        
+        # Frame untuk pola preset
+        preset_frame = ttk.Frame(main_frame)
+        preset_frame.pack(pady=5)
+        
+        ttk.Label(preset_frame, text="Pola Preset:").pack(side=tk.LEFT, padx=5)
+        
+        patterns = [
+            ("Simple", "simple"),
+            ("Block", "block"),
+            ("Oscillator", "oscillator"),
+            ("Glider", "glider"),
+            ("Document", "document_example")
+        ]
+        
+        for text, pattern in patterns:
+            btn = ttk.Button(
+                preset_frame,
+                text=text,
+                command=lambda p=pattern: self.load_pattern(p),
+                width=8
+            )
+            btn.pack(side=tk.LEFT, padx=2)
+        
+        # Frame untuk informasi
+        info_frame = ttk.Frame(main_frame)
+        info_frame.pack(pady=5)
+        
+        self.generation_label = ttk.Label(
+            info_frame,
+            text="Generasi: 0",
+            font=('Arial', 10, 'bold')
+        )
+        self.generation_label.pack(side=tk.LEFT, padx=15)
+        
+        self.population_label = ttk.Label(
+            info_frame,
+            text="Populasi: 0",
+            font=('Arial', 10, 'bold')
+        )
+        self.population_label.pack(side=tk.LEFT, padx=15)
+        
+        self.rate_label = ttk.Label(
+            info_frame,
+            text="Gen/detik: 0.0",
+            font=('Arial', 10, 'bold')
+        )
+        self.rate_label.pack(side=tk.LEFT, padx=15)
+        
+        # Speed control
+        speed_frame = ttk.Frame(main_frame)
+        speed_frame.pack(pady=5)
+        
+        ttk.Label(speed_frame, text="Kecepatan:").pack(side=tk.LEFT)
+        self.speed_scale = ttk.Scale(
+            speed_frame,
+            from_=50,
+            to=1000,
+            orient=tk.HORIZONTAL,
+            length=200,
+            command=self.change_speed
+        )
+        self.speed_scale.set(self.speed)
+        self.speed_scale.pack(side=tk.LEFT, padx=10)
+        
+        self.stop_on_cycle = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            speed_frame,
+            text="Berhenti jika pola berulang",
+            variable=self.stop_on_cycle
+        ).pack(side=tk.LEFT, padx=10)
+        
+        ttk.Label(speed_frame, text="Aturan:").pack(side=tk.LEFT)
+        self.rule_var = tk.StringVar(value=self.rule.notation)
+        self.rule_box = ttk.Combobox(
+            speed_frame,
+            textvariable=self.rule_var,
+            values=[LifeRule(rule).notation for rule in RULES.values()],
+            width=14
+        )
+        self.rule_box.bind('<<ComboboxSelected>>', self.apply_settings)
+        self.rule_box.bind('<Return>', self.apply_settings)
+        self.rule_box.pack(side=tk.LEFT, padx=5)
+        
+        ttk.Label(speed_frame, text="Batas:").pack(side=tk.LEFT)
+        self.boundary_var = tk.StringVar(value=self.game.boundary)
+        self.boundary_box = ttk.Combobox(
+            speed_frame,
+            textvariable=self.boundary_var,
+            values=BOUNDARIES + (("infinite",) if engine == "sparse" else ()),
+            state="readonly",
+            width=8
+        )
+        self.boundary_box.bind('<<ComboboxSelected>>', self.apply_settings)
+        self.boundary_box.pack(side=tk.LEFT, padx=5)
+        
+        self.profiling = tk.BooleanVar(value=PROFILER.enabled)
+        ttk.Checkbutton(
+            speed_frame,
+            text="Profiling",
+            variable=self.profiling,
+            command=self.toggle_profiling
+        ).pack(side=tk.LEFT, padx=10)
+        
+        # Status bar
+        self.status_label = ttk.Label(
+            main_frame,
+            text="Klik pada grid untuk menempatkan/menghapus organisme",
+            foreground='gray'
+        )
+        self.status_label.pack(pady=5)
+        
+        # Draw initial grid
+        self.rebuild_view()
+        
+    def new_game(self, generation=0):
+        """
+        Membuat instance GameOfLife baru dengan engine pilihan GUI
+        Args:
+            generation: nomor generasi awal (diatur sebelum riwayat diaktifkan)
+        """
+        game = GameOfLife(self.rows, self.cols, engine=self.engine, rule=self.rule,
+                          boundary=self.boundary)
+        game.generation = generation
+        if self.keep_history:
+            game.enable_history(self.HISTORY_CAPACITY, self.HISTORY_KEYFRAME_INTERVAL)
+        return game
+    
+    def fit_zoom(self, rows, cols):
+        """Zoom terbesar (maksimal cell_size) yang memuat rows x cols sel di canvas"""
+        fitting = [zoom for zoom in self.zoom_levels
+                   if zoom <= self.cell_size and rows * zoom <= self.view_height
+                   and cols * zoom <= self.view_width]
+        return fitting[-1] if fitting else self.zoom_levels[0]
+    
+    def layout(self):
+        """Menghitung ukuran jendela (dalam sel) dan mode gambar dari zoom saat ini"""
+        self.detail = self.zoom >= self.DETAIL_ZOOM
+        # Di bawah 1 piksel per sel satu piksel gambar mewakili block x block sel
+        self.block = max(1, round(1 / self.zoom))
+        self.magnify = 1 if self.detail else max(1, round(self.zoom))
+        self.view_rows = -(-self.view_height // self.zoom_pixels()) * self.block
+        self.view_cols = -(-self.view_width // self.zoom_pixels()) * self.block
+        if self.game.engine.bounded:
+            self.view_rows = min(self.view_rows, self.rows)
+            self.view_cols = min(self.view_cols, self.cols)
+        self.palette = None if self.detail else density_palette(
+            self.block, self.DEAD_COLOR, self.ALIVE_COLOR)
+        self.update_origin()
+        if self.zoom >= 1:
+            text = f"Zoom: {self.zoom:g} px/sel"
+        else:
+            text = f"Zoom: 1 px/{self.block}x{self.block} sel"
+        self.zoom_label.config(text=text)
+    
+    def zoom_pixels(self):
+        """Lebar piksel canvas untuk satu sel (mode detail) atau satu piksel gambar"""
+        return self.zoom if self.detail else self.magnify
+    
+    def update_origin(self):
+        """Memperbarui pojok kiri atas jendela (mengikuti pola atau dibatasi ke papan)"""
+        top, left = self.origin
+        if self.follow and not self.running:
+            # Saat simulasi berjalan worker yang menghitung jendela yang mengikuti pola
+            top, left = self.game.view_origin(self.view_rows, self.view_cols)
+        elif self.game.engine.bounded:
+            top = min(max(top, 0), self.rows - self.view_rows)
+            left = min(max(left, 0), self.cols - self.view_cols)
+        self.origin = (top, left)
+        # Dibaca oleh SimulationWorker di thread lain; selalu diganti utuh
+        self.view = Viewport(None if self.follow else top, None if self.follow else left,
+                             self.view_rows, self.view_cols, self.block, self.palette)
+    
+    def rebuild_view(self):
+        """Menyusun ulang isi canvas setelah zoom atau engine berubah lalu menggambar"""
+        self.layout()
+        self.canvas.delete("all")
+        if self.detail:
+            self.create_cells()
+        else:
+            self.create_image()
+        # Saat simulasi berjalan frame berikutnya dari worker yang menggambar
+        if not self.running:
+            self.draw_grid()
+    
+    def create_image(self):
+        """Membuat satu gambar kepadatan; satu piksel mewakili block x block sel"""
+        self.cell_items = []
+        self.image = tk.PhotoImage(width=-(-self.view_cols // self.block),
+                                   height=-(-self.view_rows // self.block))
+        self.shown_image = self.image
+        self.image_item = self.canvas.create_image(0, 0, image=self.image, anchor=tk.NW)
+    
+    def put_image(self, data):
+        """Mengisi gambar kepadatan dengan satu panggilan put lalu memperbesarnya bila perlu"""
+        self.image.put(data, to=(0, 0))
+        if self.magnify > 1:
+            self.shown_image = self.image.zoom(self.magnify, self.magnify)
+            self.canvas.itemconfigure(self.image_item, image=self.shown_image)
+    
+    def create_cells(self):
+        """Membuat item kotak canvas sekali untuk setiap sel yang terlihat"""
+        self.cell_items = []
+        # Status yang sedang tampil di canvas, agar itemconfig hanya untuk sel yang berubah
+        self.shown = [bytearray(self.view_cols) for _ in range(self.view_rows)]
+        self.shown_live = set()
+        self.drawn_origin = None
+        
+        for row in range(self.view_rows):
+            items = []
+            for col in range(self.view_cols):
+                x1 = col * self.zoom
+                y1 = row * self.zoom
+                x2 = x1 + self.zoom
+                y2 = y1 + self.zoom
+                
+                items.append(self.canvas.create_rectangle(
+                    x1, y1, x2, y2,
+                    fill=self.DEAD_COLOR,
+                    outline='#bdc3c7',
+                    width=1,
+                    tags=f"cell_{row}_{col}"
+                ))
+            self.cell_items.append(items)
+    
+    def paint_cell(self, row, col, alive):
+        """Mengubah warna satu sel tampilan jika statusnya berbeda"""
+        if self.shown[row][col] != alive:
+            self.shown[row][col] = alive
+            if alive:
+                self.shown_live.add((row, col))
+            else:
+                self.shown_live.discard((row, col))
+            color = self.ALIVE_COLOR if alive else self.DEAD_COLOR
+            self.canvas.itemconfigure(self.cell_items[row][col], fill=color)
+    
+    def draw_grid(self, changed=None):
+        """
+        Menggambar grid
+        Args:
+            changed: koordinat sel yang berubah (dari engine); None berarti
+                     seluruh tampilan diperiksa ulang
+        """
+        top, left = self.origin
+        with PROFILER.phase("render"):
+            if not self.detail:
+                counts = self.game.density(top, left, -(-self.view_rows // self.block),
+                                           -(-self.view_cols // self.block), self.block)
+                self.put_image(density_image_data(counts, self.palette))
+            elif changed is None or self.origin != self.drawn_origin:
+                for row in range(self.view_rows):
+                    for col in range(self.view_cols):
+                        self.paint_cell(row, col, self.game.get_cell(top + row, left + col))
+                self.drawn_origin = self.origin
+            else:
+                for row, col in changed:
+                    if 0 <= row - top < self.view_rows and 0 <= col - left < self.view_cols:
+                        self.paint_cell(row - top, col - left, self.game.get_cell(row, col))
+        
+        # Update labels
+        self.generation_label.config(text=f"Generasi: {self.game.generation}")
+        self.population_label.config(text=f"Populasi: {self.game.get_population()}")
+        self.update_timeline()
+    
+    def update_timeline(self):
+        """Menyesuaikan rentang timeline dengan generasi yang tersimpan di riwayat"""
+        history = self.game.history
+        first = history.first_generation() if history is not None else None
+        if first is None:
+            # Riwayat kosong atau tidak aktif: timeline hanya berisi generasi saat ini
+            first = last = self.game.generation
+        else:
+            last = history.last_generation()
+        self.updating_timeline = True
+        try:
+            self.timeline.config(from_=first, to=max(last, first))
+            self.timeline.set(self.game.generation)
+        finally:
+            self.updating_timeline = False
+    
+    def scrub_timeline(self, value):
+        """Berpindah ke generasi yang dipilih pada timeline"""
+        if self.running or self.updating_timeline:
+            return
+        generation = int(round(float(value)))
+        if generation != self.game.generation:
+            self.game.goto_generation(generation)
+            self.update_origin()
+            self.draw_grid()
+            self.status_label.config(text=f"Kembali ke generasi {generation}")
+    
+    def step_back(self):
+        """Mundur satu generasi menggunakan riwayat"""
+        if not self.running:
+            if self.game.history is None:
+                self.status_label.config(text="Riwayat generasi tidak aktif")
+            elif self.game.step_back():
+                self.update_origin()
+                self.draw_grid()
+                self.status_label.config(text=f"Mundur ke generasi {self.game.generation}")
+            else:
+                self.status_label.config(text="Riwayat generasi sudah habis")
+        
+    def cell_at(self, event):
+        """Mengubah posisi piksel event menjadi koordinat sel papan (None di luar jendela)"""
+        row = int(event.y // self.zoom)
+        col = int(event.x // self.zoom)
+        if 0 <= row < self.view_rows and 0 <= col < self.view_cols:
+            return row + self.origin[0], col + self.origin[1]
+        return None
+    
+    def toggle_cell(self, event):
+        """Toggle cell ketika diklik"""
+        self.canvas.focus_set()
+        if not self.running:
+            if not self.detail:
+                self.status_label.config(text="Perbesar tampilan untuk mengubah sel")
+                return
+            cell = self.cell_at(event)
+            if cell is not None:
+                row, col = cell
+                current = self.game.get_cell(row, col)
+                self.game.set_cell(row, col, 1 - current)
+                self.draw_grid(changed=[(row, col)])
+                self.status_label.config(text=f"Mengubah sel ({row}, {col})")
+    
+    def drag_cell(self, event):
+        """Mengubah cell saat drag mouse"""
+        if not self.running and self.detail:
+            cell = self.cell_at(event)
+            if cell is not None:
+                row, col = cell
+                # Set cell menjadi hidup saat drag
+                if self.game.get_cell(row, col) == 0:
+                    self.game.set_cell(row, col, 1)
+                    self.draw_grid(changed=[(row, col)])
+    
+    def move_view(self, top, left):
+        """Memindahkan jendela ke pojok kiri atas baru; jendela berhenti mengikuti pola"""
+        self.follow = False
+        self.origin = (int(top), int(left))
+        self.update_origin()
+        if not self.running:
+            self.draw_grid()
+    
+    def start_pan(self, event):
+        """Mencatat titik awal geser (tombol kanan/tengah)"""
+        self.canvas.focus_set()
+        self.pan_start = (event.x, event.y, self.origin)
+    
+    def pan(self, event):
+        """Menggeser jendela mengikuti drag mouse"""
+        if self.pan_start is None:
+            return
+        x, y, (top, left) = self.pan_start
+        self.move_view(top - (event.y - y) // self.zoom, left - (event.x - x) // self.zoom)
+    
+    def pan_step(self, drow, dcol):
+        """Menggeser jendela seperempat lebar/tinggi tampilan (tombol panah)"""
+        top, left = self.origin
+        self.move_view(top + drow * max(1, self.view_rows // 4),
+                       left + dcol * max(1, self.view_cols // 4))
+    
+    def set_zoom(self, zoom, x=None, y=None):
+        """
+        Mengganti zoom dengan sel di bawah titik (x, y) tetap di tempatnya
+        Args:
+            zoom: piksel per sel (salah satu zoom_levels)
+            x, y: titik jangkar di canvas (default tengah canvas)
+        """
+        if zoom == self.zoom:
+            return
+        x = self.view_width / 2 if x is None else x
+        y = self.view_height / 2 if y is None else y
+        top, left = self.origin
+        anchor_row, anchor_col = top + y / self.zoom, left + x / self.zoom
+        self.zoom = zoom
+        if not self.follow:
+            self.origin = (int(anchor_row - y / zoom), int(anchor_col - x / zoom))
+        self.rebuild_view()
+    
+    def zoom_by(self, steps, x=None, y=None):
+        """Berpindah sejumlah tingkat zoom (positif memperbesar)"""
+        index = self.zoom_levels.index(self.zoom) + steps
+        self.set_zoom(self.zoom_levels[min(max(index, 0), len(self.zoom_levels) - 1)], x, y)
+    
+    def wheel_zoom(self, event):
+        """Zoom dengan roda mouse di sekitar posisi kursor"""
+        up = event.num == 4 or getattr(event, "delta", 0) > 0
+        self.zoom_by(1 if up else -1, event.x, event.y)
+    
+    def fit_view(self):
+        """Memilih zoom yang memuat seluruh papan (atau seluruh pola pada semesta tak terbatas)"""
+        rows, cols = self.rows, self.cols
+        self.follow = not self.game.engine.bounded
+        if self.follow and not self.running:
+            box = self.game.bounding_box()
+            if box is not None:
+                rows, cols = box[2] - box[0] + 1, box[3] - box[1] + 1
+        else:
+            self.origin = (0, 0)
+        self.zoom = self.fit_zoom(rows, cols)
+        self.rebuild_view()
+    
+    def load_pattern(self, pattern_name):
+        """Memuat pola preset"""
+        if not self.running:
+            self.game = self.new_game()
+            self.game = setup_pattern(self.game, pattern_name)
+            self.update_origin()
+            self.draw_grid()
+            self.status_label.config(text=f"Memuat pola: {pattern_name}")
+    
+    def start_simulation(self):
+        """Memulai simulasi"""
+        if self.game.get_population() > 0:
+            self.running = True
+            self.start_btn.config(state=tk.DISABLED)
+            self.stop_btn.config(state=tk.NORMAL)
+            self.clear_btn.config(state=tk.DISABLED)
+            self.random_btn.config(state=tk.DISABLED)
+            self.open_btn.config(state=tk.DISABLED)
+            self.save_btn.config(state=tk.DISABLED)
+            self.back_btn.config(state=tk.DISABLED)
+            self.timeline.state(["disabled"])
+            self.status_label.config(text="Simulasi berjalan...")
+            if not self.stop_on_cycle.get():
+                # Deteksi siklus hanya dibayar jika simulasi berhenti saat pola berulang
+                self.game.cycle_detector = None
+            self.worker = SimulationWorker(
+                self.game,
+                interval=lambda: self.speed / 1000,
+                stop_on_cycle=self.stop_on_cycle.get(),
+                viewport=lambda: self.view
+            )
+            self.worker.start()
+            self.run_simulation()
+    
+    def stop_simulation(self):
+        """Menghentikan simulasi"""
+        self.running = False
+        if self.worker is not None:
+            self.worker.stop()
+            self.worker = None
+            # Worker bisa sudah melangkah melewati frame terakhir yang tampil
+            self.update_origin()
+            self.draw_grid()
+        self.start_btn.config(state=tk.NORMAL)
+        self.stop_btn.config(state=tk.DISABLED)
+        self.clear_btn.config(state=tk.NORMAL)
+        self.random_btn.config(state=tk.NORMAL)
+        self.open_btn.config(state=tk.NORMAL)
+        self.save_btn.config(state=tk.NORMAL)
+        self.back_btn.config(state=tk.NORMAL)
+        self.timeline.state(["!disabled"])
+        self.status_label.config(text="Simulasi dihentikan")
+    
+    def clear_grid(self):
+        """Membersihkan grid"""
+        if not self.running:
+            self.game = self.new_game()
+            self.draw_grid()
+            self.status_label.config(text="Grid dibersihkan")
+    
+    def random_grid(self):
+        """Membuat grid acak"""
+        if not self.running:
+            self.game = self.new_game()
+            self.game = setup_pattern(self.game, "random")
+            self.update_origin()
+            self.draw_grid()
+            self.status_label.config(text="Membuat pola acak")
+    
+    def open_pattern_file(self):
+        """Memuat pola dari file RLE atau plaintext"""
+        if self.running:
+            return
+        path = filedialog.askopenfilename(filetypes=self.PATTERN_FILETYPES)
+        if path:
+            game = self.new_game()
+            try:
+                load_pattern_file(game, path)
+            except (OSError, ValueError) as e:
+                self.status_label.config(text=f"Gagal memuat pola: {e}")
+                return
+            self.game = game
+            self.update_origin()
+            self.draw_grid()
+            self.status_label.config(text=f"Memuat file: {os.path.basename(path)}")
+    
+    def save_pattern_file(self):
+        """Menyimpan generasi saat ini ke file RLE atau plaintext"""
+        if self.running:
+            return
+        path = filedialog.asksaveasfilename(defaultextension=".rle",
+                                            filetypes=self.PATTERN_FILETYPES)
+        if path:
+            try:
+                save_pattern_file(self.game, path)
+            except OSError as e:
+                self.status_label.config(text=f"Gagal menyimpan pola: {e}")
+                return
+            self.status_label.config(text=f"Pola disimpan: {os.path.basename(path)}")
+    
+    def apply_settings(self, event=None):
+        """Mengganti aturan B/S dan mode batas; pola yang sedang tampil tetap dipertahankan"""
+        if self.running:
+            self.rule_var.set(self.rule.notation)
+            self.boundary_var.set(self.game.boundary)
+            return
+        previous = (self.rule, self.boundary)
+        try:
+            self.rule = LifeRule(self.rule_var.get())
+            self.boundary = self.boundary_var.get()
+            game = self.new_game(self.game.generation)
+        except ValueError as e:
+            self.rule, self.boundary = previous
+            self.rule_var.set(self.rule.notation)
+            self.boundary_var.set(self.game.boundary)
+            self.status_label.config(text=f"Pengaturan tidak valid: {e}")
+            return
+        game.set_cells(cell for cell in self.game.engine.live_cells() if game.in_bounds(*cell))
+        self.game = game
+        self.follow = self.follow and not game.engine.bounded
+        self.rule_var.set(self.rule.notation)
+        # Batas papan bisa berubah (terbatas <-> tak terbatas), jadi jendela disusun ulang
+        self.rebuild_view()
+        self.status_label.config(text=f"Aturan: {self.rule.notation}, batas: {game.boundary}")
+    
+    def toggle_history(self):
+        """Menyalakan/mematikan riwayat generasi (menambah biaya setiap langkah)"""
+        if self.running:
+            self.history_var.set(self.keep_history)
+            return
+        self.keep_history = self.history_var.get()
+        if self.keep_history:
+            self.game.enable_history(self.HISTORY_CAPACITY, self.HISTORY_KEYFRAME_INTERVAL)
+        else:
+            self.game.history = None
+        self.update_timeline()
+    
+    def toggle_profiling(self):
+        """Menyalakan/mematikan PROFILER; ringkasan dicetak ke console saat dimatikan"""
+        if self.profiling.get():
+            PROFILER.enable()
+            self.status_label.config(text="Profiling aktif")
+            return
+        PROFILER.disable()
+        print(PROFILER.summary())
+        phases = sorted(PROFILER.phases.items(), key=lambda item: -item[1][1])
+        self.status_label.config(text="Profiling: " + ", ".join(
+            f"{name} {total:.2f}s" for name, (_, total, _) in phases[:4]))
+    
+    def change_speed(self, value):
+        """Mengubah kecepatan simulasi"""
+        self.speed = int(float(value))
+    
+    def show_frame(self, frame):
+        """
+        Menampilkan frame dari worker: mode detail hanya mengubah sel yang berbeda,
+        mode kepadatan mengisi gambar sekaligus
+        """
+        # Frame yang dibuat untuk viewport lama (sebelum zoom/geser) dilewati
+        if frame.view == self.view:
+            self.origin = frame.origin
+            with PROFILER.phase("render"):
+                if frame.density is not None:
+                    self.put_image(frame.density)
+                else:
+                    self.drawn_origin = frame.origin
+                    for row, col in self.shown_live ^ frame.live:
+                        self.paint_cell(row, col, 1 if (row, col) in frame.live else 0)
+        
+        self.generation_label.config(text=f"Generasi: {frame.generation}")
+        self.population_label.config(text=f"Populasi: {frame.population}")
+        self.rate_label.config(
+            text=f"Gen/detik: {frame.rate:.1f} (target {1000 / self.speed:.1f})"
+        )
+    
+    def run_simulation(self):
+        """Mengambil frame terbaru dari worker (frame lain dibuang) lalu menampilkannya"""
+        if self.running:
+            frame = self.worker.latest()
+            if frame is not None:
+                self.show_frame(frame)
+                if frame.status is not None:
+                    self.stop_simulation()
+                    self.status_label.config(text=frame.status)
+                    return
+            
+            # Jadwalkan pengecekan berikutnya
+            self.root.after(self.frame_interval, self.run_simulation)
+    
+    def run(self):
+        """Menjalankan GUI"""
+        self.root.mainloop()
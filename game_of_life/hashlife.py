@@ -0,0 +1,310 @@
+"""HashLife: quadtree ter-memoisasi untuk melompati banyak generasi sekaligus"""
+
+from .engines import NEIGHBOR_OFFSETS
+from .rules import _require_no_b0, parse_rule
+
+# ==================== HASHLIFE ====================
+class _Node:
+    """
+    Simpul quadtree HashLife. Simpul bersifat kanonik (hash-consed): dua
+    simpul dengan isi yang sama selalu merupakan objek yang sama, sehingga
+    perbandingan dan hash cukup berdasarkan identitas objek.
+    """
+    
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population")
+    
+    def __init__(self, nw, ne, sw, se, level, population):
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+
+
+class HashLife:
+    """
+    Engine HashLife untuk melompati generasi dalam jumlah sangat besar.
+    Papan berupa quadtree simpul kanonik dengan hasil langkah yang di-memo,
+    sehingga pola berulang cukup dihitung sekali. Semesta tidak terbatas;
+    rows dan cols hanya dipakai oleh setup_pattern (misalnya pola "random").
+    """
+    
+    _OFF = _Node(None, None, None, None, 0, 0)
+    _ON = _Node(None, None, None, None, 0, 1)
+    
+    def __init__(self, rows, cols, max_nodes=1_000_000, rule="B3/S23"):
+        """
+        Membuat semesta HashLife kosong
+        Args:
+            rows: jumlah baris area awal
+            cols: jumlah kolom area awal
+            max_nodes: batas jumlah simpul ditambah hasil di cache sebelum
+                keduanya dibersihkan (juga di tengah satu lompatan besar)
+            rule: aturan life-like (B0 tidak didukung pada semesta tak terbatas)
+        """
+        self.rule = parse_rule(rule)
+        _require_no_b0(self.rule, "hashlife")
+        self.rows = rows
+        self.cols = cols
+        self.max_nodes = max_nodes
+        self.generation = 0
+        self._nodes = {}
+        self._cache = {}
+        # Batas efektif: tidak pernah di bawah dua kali jumlah simpul yang masih
+        # terjangkau, agar pembersihan tidak berulang terus (lihat _collect_garbage)
+        self._budget = max_nodes
+        self._empty = [self._OFF]
+        # Akar menutupi baris [top, top + 2^level) dan kolom [left, left + 2^level)
+        self.root = self._empty_node(3)
+        self.top = 0
+        self.left = 0
+    
+    # ---------- konstruksi simpul ----------
+    def _join(self, nw, ne, sw, se):
+        """Mengembalikan simpul kanonik dengan empat anak tertentu"""
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            node = _Node(nw, ne, sw, se, nw.level + 1,
+                         nw.population + ne.population + sw.population + se.population)
+            self._nodes[key] = node
+        return node
+    
+    def _empty_node(self, level):
+        """Mengembalikan simpul kosong pada level tertentu"""
+        while len(self._empty) <= level:
+            e = self._empty[-1]
+            self._empty.append(self._join(e, e, e, e))
+        return self._empty[level]
+    
+    def _centre(self, node):
+        """Simpul level-1 di tengah simpul"""
+        return self._join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+    
+    def _expand(self):
+        """Menggandakan ukuran akar dengan menempatkan akar lama di tengah"""
+        root = self.root
+        e = self._empty_node(root.level - 1)
+        self.root = self._join(self._join(e, e, e, root.nw),
+                               self._join(e, e, root.ne, e),
+                               self._join(e, root.sw, e, e),
+                               self._join(root.se, e, e, e))
+        half = 1 << (root.level - 1)
+        self.top -= half
+        self.left -= half
+    
+    def _is_padded(self):
+        """Memeriksa apakah semua sel hidup berada di perempat tengah akar"""
+        root = self.root
+        return (root.nw.population == root.nw.se.se.population and
+                root.ne.population == root.ne.sw.sw.population and
+                root.sw.population == root.sw.ne.ne.population and
+                root.se.population == root.se.nw.nw.population)
+    
+    # ---------- evolusi ----------
+    def _life_4x4(self, node):
+        """Kasus dasar: pusat 2x2 dari simpul 4x4 setelah satu generasi"""
+        cells = [[0] * 4 for _ in range(4)]
+        for quad, (r0, c0) in ((node.nw, (0, 0)), (node.ne, (0, 2)),
+                               (node.sw, (2, 0)), (node.se, (2, 2))):
+            cells[r0][c0] = quad.nw.population
+            cells[r0][c0 + 1] = quad.ne.population
+            cells[r0 + 1][c0] = quad.sw.population
+            cells[r0 + 1][c0 + 1] = quad.se.population
+        
+        table = self.rule.table
+        result = []
+        for row, col in ((1, 1), (1, 2), (2, 1), (2, 2)):
+            neighbors = sum(cells[row + dr][col + dc] for dr, dc in NEIGHBOR_OFFSETS)
+            alive = table[cells[row][col] * 9 + neighbors]
+            result.append(self._ON if alive else self._OFF)
+        return self._join(*result)
+    
+    def _successor(self, node, j):
+        """
+        Simpul level-1 di tengah simpul setelah maju 2^j generasi
+        (j paling besar level - 2)
+        """
+        if node.population == 0:
+            return self._empty_node(node.level - 1)
+        key = (node, j)
+        result = self._cache.get(key)
+        if result is not None:
+            return result
+        
+        if node.level == 2:
+            result = self._life_4x4(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            # Sembilan sub-simpul level-1 yang saling tumpang tindih
+            parts = [
+                nw,
+                self._join(nw.ne, ne.nw, nw.se, ne.sw),
+                ne,
+                self._join(nw.sw, nw.se, sw.nw, sw.ne),
+                self._join(nw.se, ne.sw, sw.ne, se.nw),
+                self._join(ne.sw, ne.se, se.nw, se.ne),
+                sw,
+                self._join(sw.ne, se.nw, sw.se, se.sw),
+                se,
+            ]
+            if j == node.level - 2:
+                # Kecepatan penuh: dua kali setengah langkah
+                parts = [self._successor(part, j - 1) for part in parts]
+                inner_j = j - 1
+            else:
+                parts = [self._centre(part) for part in parts]
+                inner_j = j
+            a, b, c, d, e, f, g, h, i = parts
+            result = self._join(self._successor(self._join(a, b, d, e), inner_j),
+                                self._successor(self._join(b, c, e, f), inner_j),
+                                self._successor(self._join(d, e, g, h), inner_j),
+                                self._successor(self._join(e, f, h, i), inner_j))
+        
+        self._cache[key] = result
+        # Anggaran diperiksa di dalam rekursi, sehingga satu step(n) yang sangat
+        # besar pun tidak menumpuk simpul dan cache tanpa batas
+        if len(self._nodes) + len(self._cache) > self._budget:
+            self._collect_garbage()
+        return result
+    
+    def _advance(self, j):
+        """Memajukan akar sebanyak 2^j generasi"""
+        while self.root.level < j + 2 or not self._is_padded():
+            self._expand()
+        # Satu kali lagi agar pola tidak keluar dari hasil
+        self._expand()
+        
+        quarter = 1 << (self.root.level - 2)
+        self.root = self._successor(self.root, j)
+        self.top += quarter
+        self.left += quarter
+        self.generation += 1 << j
+        
+        if len(self._nodes) + len(self._cache) > self._budget:
+            self._collect_garbage()
+    
+    def _collect_garbage(self):
+        """
+        Membuang cache hasil dan simpul yang tidak lagi terjangkau dari akar.
+        Aman dipanggil di tengah rekursi _successor: simpul yang sedang dipakai
+        tetap sah, hanya tidak lagi kanonik, sehingga paling buruk dihitung ulang.
+        """
+        self._cache = {}
+        reachable = {}
+        stack = [self.root]
+        seen = set()
+        while stack:
+            node = stack.pop()
+            if node.level == 0 or id(node) in seen:
+                continue
+            seen.add(id(node))
+            reachable[(node.nw, node.ne, node.sw, node.se)] = node
+            stack.extend((node.nw, node.ne, node.sw, node.se))
+        for node in self._empty[1:]:
+            reachable[(node.nw, node.ne, node.sw, node.se)] = node
+        self._nodes = reachable
+        self._budget = max(self.max_nodes, 2 * len(reachable))
+    
+    def step(self, n=1):
+        """
+        Memajukan simulasi sebanyak n generasi dengan lompatan 2^k
+        Args:
+            n: jumlah generasi (boleh sangat besar, misalnya 10**6 atau lebih)
+        Returns:
+            nomor generasi setelah melangkah
+        """
+        if n < 0:
+            raise ValueError("Jumlah generasi tidak boleh negatif")
+        j = 0
+        while n:
+            if n & 1:
+                self._advance(j)
+            n >>= 1
+            j += 1
+        return self.generation
+    
+    def next_generation(self):
+        """Menghitung satu generasi berikutnya"""
+        self.step(1)
+    
+    # ---------- akses sel ----------
+    def _set(self, node, row, col, value):
+        """Mengembalikan simpul baru dengan satu sel diubah (koordinat relatif)"""
+        if node.level == 0:
+            return self._ON if value else self._OFF
+        half = 1 << (node.level - 1)
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        if row < half:
+            if col < half:
+                nw = self._set(nw, row, col, value)
+            else:
+                ne = self._set(ne, row, col - half, value)
+        else:
+            if col < half:
+                sw = self._set(sw, row - half, col, value)
+            else:
+                se = self._set(se, row - half, col - half, value)
+        return self._join(nw, ne, sw, se)
+    
+    def set_cell(self, row, col, value):
+        """Mengatur nilai sel pada koordinat mana pun"""
+        while not (self.top <= row < self.top + (1 << self.root.level) and
+                   self.left <= col < self.left + (1 << self.root.level)):
+            self._expand()
+        self.root = self._set(self.root, row - self.top, col - self.left, value)
+    
+    def get_cell(self, row, col):
+        """Mendapatkan nilai sel pada koordinat mana pun"""
+        row -= self.top
+        col -= self.left
+        node = self.root
+        size = 1 << node.level
+        if not (0 <= row < size and 0 <= col < size):
+            return 0
+        while node.level > 0 and node.population:
+            half = 1 << (node.level - 1)
+            if row < half:
+                node = node.nw if col < half else node.ne
+            else:
+                node = node.sw if col < half else node.se
+            row %= half
+            col %= half
+        return node.population if node.level == 0 else 0
+    
+    def get_population(self):
+        """Jumlah sel hidup (tersimpan di akar, tanpa pemindaian)"""
+        return self.root.population
+    
+    def is_empty(self):
+        """Memeriksa apakah semua sel mati"""
+        return self.root.population == 0
+    
+    def live_cells(self):
+        """Mengembalikan daftar koordinat (row, col) sel hidup"""
+        cells = []
+        stack = [(self.root, self.top, self.left)]
+        while stack:
+            node, row, col = stack.pop()
+            if node.population == 0:
+                continue
+            if node.level == 0:
+                cells.append((row, col))
+                continue
+            half = 1 << (node.level - 1)
+            stack.extend(((node.nw, row, col), (node.ne, row, col + half),
+                          (node.sw, row + half, col), (node.se, row + half, col + half)))
+        return cells
+    
+    def bounding_box(self):
+        """
+        Mengembalikan kotak pembatas sel hidup (min_row, min_col, max_row, max_col)
+        atau None jika semua sel mati
+        """
+        cells = self.live_cells()
+        if not cells:
+            return None
+        rows = [row for row, _ in cells]
+        cols = [col for _, col in cells]
+        return min(rows), min(cols), max(rows), max(cols)
@@ -0,0 +1,22 @@
+"""
+Dependensi opsional yang baru diimpor saat pertama kali dibutuhkan, agar
+`import game_of_life` untuk engine murni Python tetap cepat
+"""
+
+_numpy = None
+
+
+def load_numpy():
+    """
+    Mengimpor NumPy sekali saja
+    Returns:
+        modul numpy, atau None jika NumPy tidak terpasang
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:  # NumPy opsional, hanya dibutuhkan engine "numpy"
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
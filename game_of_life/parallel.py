@@ -0,0 +1,312 @@
+"""Engine paralel: papan di shared memory, strip baris dihitung di process pool"""
+
+import time
+import os
+import random
+import weakref
+
+from .adt import Grid
+from .engines import (_bytes_bounding_box, _bytes_box_changed, _count_neighbors_indexed,
+                      _fill_halo, _halo_index, _live_cells_in, _numpy_next, _packed_rows,
+                      _step_counts)
+from .optional import load_numpy
+from .patterns import RANDOM_DENSITY
+from .rules import parse_rule
+
+# NumPy opsional; diimpor di proses worker (lihat _parallel_worker_init)
+np = None
+
+# ==================== ENGINE PARALEL ====================
+# State milik proses worker: buffer shared memory yang sudah di-attach
+_worker_state = {}
+
+
+def _parallel_worker_init(names, rows, cols, table, boundary):
+    """Initializer proses worker: attach ke dua buffer shared memory papan"""
+    global np
+    from multiprocessing import shared_memory
+    np = load_numpy()
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    _worker_state["blocks"] = blocks
+    _worker_state["shape"] = (rows, cols)
+    _worker_state["index"] = (_halo_index(rows, boundary), _halo_index(cols, boundary))
+    _worker_state["table"] = np.array(table, dtype=np.uint8) if np is not None else table
+
+
+def _parallel_worker_step(src, start, stop):
+    """Tugas worker: menghitung baris [start, stop) dari buffer src ke buffer lainnya"""
+    blocks = _worker_state["blocks"]
+    rows, cols = _worker_state["shape"]
+    _step_strip(blocks[src].buf, blocks[1 - src].buf, rows, cols, start, stop,
+                _worker_state["table"], *_worker_state["index"])
+    return stop - start
+
+
+def _step_strip(src, dst, rows, cols, start, stop, table, row_index, col_index):
+    """
+    Menghitung satu strip horizontal [start, stop) dari papan src (byte per sel)
+    ke papan dst. Baris halo di atas dan di bawah strip dibaca langsung dari
+    src, sehingga tidak ada papan yang perlu dikirim antar proses.
+    table adalah tabel aturan (array NumPy jika NumPy tersedia); row_index dan
+    col_index adalah tabel halo mode batas.
+    """
+    if np is not None:
+        board = np.frombuffer(src, dtype=np.uint8, count=rows * cols).reshape(rows, cols)
+        out = np.frombuffer(dst, dtype=np.uint8, count=rows * cols).reshape(rows, cols)
+        padded = np.zeros((stop - start + 2, cols + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = board[start:stop]
+        above, below = row_index[start], row_index[stop + 1]
+        if above is not None:
+            padded[0, 1:-1] = board[above]
+        if below is not None:
+            padded[-1, 1:-1] = board[below]
+        _fill_halo(padded, col_index)
+        out[start:stop] = _numpy_next(padded, table)
+        return
+    
+    zero = bytes(cols + 2)
+    left, right = col_index[0], col_index[-1]
+    
+    def halo_row(source):
+        """Baris src dengan kolom halo di kedua sisi"""
+        if source is None:
+            return zero
+        line = bytes(src[source * cols:(source + 1) * cols])
+        return (bytes((0 if left is None else line[left],)) + line +
+                bytes((0 if right is None else line[right],)))
+    
+    above, current = halo_row(row_index[start]), halo_row(row_index[start + 1])
+    for row in range(start, stop):
+        below = halo_row(row_index[row + 2])
+        line = bytearray(cols)
+        for col in range(cols):
+            neighbors = (above[col] + above[col + 1] + above[col + 2] +
+                         current[col] + current[col + 2] +
+                         below[col] + below[col + 1] + below[col + 2])
+            line[col] = table[current[col + 1] * 9 + neighbors]
+        dst[row * cols:(row + 1) * cols] = line
+        above, current = current, below
+
+
+def _release_parallel(resources):
+    """Mematikan process pool dan melepas shared memory milik ParallelEngine"""
+    pool = resources.get("pool")
+    if pool is not None:
+        pool.shutdown(wait=True)
+        resources["pool"] = None
+    for block in resources.get("blocks", ()):
+        block.close()
+        block.unlink()
+    resources["blocks"] = []
+
+
+class ParallelEngine:
+    """
+    Engine multi-core: papan disimpan di dua buffer multiprocessing.shared_memory
+    (generasi sekarang dan berikutnya) lalu dibagi menjadi strip horizontal yang
+    dihitung oleh process pool. Worker hanya menerima indeks strip; baris halo
+    dibaca langsung dari shared memory. Hasil identik dengan engine python.
+    """
+    
+    name = "parallel"
+    bounded = True
+    
+    def __init__(self, rows, cols, rule=None, boundary="dead", workers=None):
+        """
+        Membuat engine dengan papan kosong di shared memory
+        Args:
+            rows: jumlah baris grid
+            cols: jumlah kolom grid
+            rule: LifeRule (default B3/S23)
+            boundary: mode batas (lihat BOUNDARIES)
+            workers: jumlah proses worker (default: jumlah CPU)
+        """
+        # multiprocessing dan concurrent.futures mahal diimpor; hanya engine ini yang butuh
+        from multiprocessing import shared_memory
+        self.rule = parse_rule(rule)
+        self.boundary = boundary
+        self.rows = rows
+        self.cols = cols
+        self._row_index = _halo_index(rows, boundary)
+        self._col_index = _halo_index(cols, boundary)
+        self.workers = max(1, min(workers or os.cpu_count() or 1, rows))
+        blocks = [shared_memory.SharedMemory(create=True, size=rows * cols)
+                  for _ in range(2)]
+        self._resources = {"pool": None, "blocks": blocks}
+        self._finalizer = weakref.finalize(self, _release_parallel, self._resources)
+        self._front = 0
+        # Strip baris [start, stop) untuk setiap worker
+        bounds = [rows * i // self.workers for i in range(self.workers + 1)]
+        self._strips = [(bounds[i], bounds[i + 1]) for i in range(self.workers)]
+        self.clear()
+    
+    @property
+    def _cells(self):
+        """
+        Buffer byte generasi saat ini. SharedMemory.buf dapat lebih besar dari
+        ukuran yang diminta (dibulatkan ke halaman memori), sehingga selalu
+        dipotong tepat rows * cols byte.
+        """
+        return self._resources["blocks"][self._front].buf[:self.rows * self.cols]
+    
+    @property
+    def _previous_cells(self):
+        """Buffer byte generasi sebelumnya (buffer tujuan langkah berikutnya)"""
+        return self._resources["blocks"][1 - self._front].buf[:self.rows * self.cols]
+    
+    def _pool(self):
+        """Membuat process pool saat pertama kali dibutuhkan"""
+        pool = self._resources["pool"]
+        if pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+            names = [block.name for block in self._resources["blocks"]]
+            pool = ProcessPoolExecutor(max_workers=self.workers,
+                                       initializer=_parallel_worker_init,
+                                       initargs=(names, self.rows, self.cols,
+                                                 self.rule.table, self.boundary))
+            self._resources["pool"] = pool
+        return pool
+    
+    def close(self):
+        """Mematikan worker dan melepas shared memory"""
+        self._finalizer()
+    
+    def clear(self):
+        """Mematikan semua sel"""
+        self._cells[:] = bytes(self.rows * self.cols)
+        self._stepped = False
+    
+    def get_cell(self, row, col):
+        """Mendapatkan nilai sel (posisi diasumsikan valid)"""
+        return self._cells[row * self.cols + col]
+    
+    def set_cell(self, row, col, value):
+        """Mengatur nilai sel (posisi diasumsikan valid)"""
+        self._cells[row * self.cols + col] = 1 if value else 0
+    
+    def set_cells(self, cells, value=1):
+        """Mengatur banyak sel sekaligus pada salinan buffer lalu menyalinnya ke shared memory"""
+        data = bytearray(self._cells)
+        value = 1 if value else 0
+        cols = self.cols
+        for row, col in cells:
+            data[row * cols + col] = value
+        self._cells[:] = data
+    
+    def load_bytes(self, data):
+        """Mengisi seluruh papan dari buffer satu byte per sel (rows * cols byte) sekaligus"""
+        self._cells[:] = data
+    
+    def count_neighbors(self, row, col):
+        """Menghitung jumlah tetangga hidup dari sel pada posisi (row, col)"""
+        return _count_neighbors_indexed(self.get_cell, self._row_index, self._col_index,
+                                        row, col)
+    
+    def step(self):
+        """Menghitung generasi berikutnya secara paralel per strip"""
+        pool = self._pool()
+        futures = [pool.submit(_parallel_worker_step, self._front, start, stop)
+                   for start, stop in self._strips]
+        for future in futures:
+            future.result()
+        self._front = 1 - self._front
+        self._stepped = True
+    
+    def is_empty(self):
+        """Memeriksa apakah semua sel mati"""
+        return not any(self._cells)
+    
+    def population(self):
+        """Menghitung jumlah sel hidup"""
+        return bytes(self._cells).count(1)
+    
+    def changed_cells(self):
+        """
+        Mengembalikan koordinat sel yang berubah oleh langkah terakhir
+        (buffer lainnya masih berisi generasi sebelumnya)
+        """
+        if not self._stepped:
+            return []
+        current, previous = bytes(self._cells), bytes(self._previous_cells)
+        return [divmod(index, self.cols)
+                for index, (a, b) in enumerate(zip(current, previous)) if a != b]
+    
+    def step_counts(self):
+        """Jumlah (kelahiran, kematian) langkah terakhir tanpa membuat daftar sel"""
+        if not self._stepped:
+            return 0, 0
+        return _step_counts(bytes(self._cells), bytes(self._previous_cells))
+    
+    def bounding_box(self):
+        """Kotak pembatas sel hidup (None jika kosong)"""
+        return _bytes_bounding_box(bytes(self._cells), self.rows, self.cols)
+    
+    def box_changed(self, box):
+        """True jika langkah terakhir dapat menggeser kotak pembatas box"""
+        if not self._stepped:
+            return True
+        return _bytes_box_changed(bytes(self._cells), bytes(self._previous_cells), self.cols, box)
+    
+    def live_cells(self):
+        """Mengembalikan daftar koordinat (row, col) sel hidup"""
+        cells = bytes(self._cells)
+        return [divmod(index, self.cols)
+                for index, value in enumerate(cells) if value]
+    
+    def live_cells_in(self, top, left, height, width):
+        """Sel hidup di dalam jendela height x width yang berpojok (top, left)"""
+        return _live_cells_in(bytes(self._cells), self.rows, self.cols, top, left, height, width)
+    
+    def packed_rows(self):
+        """Setiap baris sebagai bilangan bulat (bit ke-c = kolom c), untuk riwayat"""
+        return _packed_rows(bytes(self._cells), self.rows, self.cols)
+    
+    def to_grid(self):
+        """Mengembalikan salinan papan dalam bentuk Grid"""
+        grid = Grid(self.rows, self.cols, "B")
+        cells, cols = self._cells, self.cols
+        for row in range(self.rows):
+            grid[row][:] = cells[row * cols:(row + 1) * cols]
+        return grid
+
+
+def measure_parallel_speedup(rows=1000, cols=1000, generations=20,
+                             worker_counts=(1, 2, 4, 8), seed=0):
+    """
+    Mengukur percepatan ParallelEngine untuk beberapa jumlah worker
+    Args:
+        rows, cols: ukuran papan acak
+        generations: jumlah generasi yang diukur
+        worker_counts: daftar jumlah worker yang dibandingkan
+        seed: seed papan acak
+    Returns:
+        dict {workers: {"seconds": ..., "speedup": ...}} relatif terhadap 1 worker
+    """
+    rng = random.Random(seed)
+    live = [(row, col) for row in range(rows) for col in range(cols)
+            if rng.random() < RANDOM_DENSITY]
+    
+    results = {}
+    baseline = None
+    reference = None
+    for workers in worker_counts:
+        engine = ParallelEngine(rows, cols, workers=workers)
+        try:
+            engine.set_cells(live)
+            engine.step()  # pemanasan: membuat process pool
+            start = time.perf_counter()
+            for _ in range(generations):
+                engine.step()
+            elapsed = time.perf_counter() - start
+            cells = bytes(engine._cells)
+        finally:
+            engine.close()
+        
+        if reference is None:
+            reference = cells
+        elif cells != reference:
+            raise RuntimeError(f"Hasil {workers} worker berbeda dari 1 worker")
+        if baseline is None:
+            baseline = elapsed
+        results[workers] = {"seconds": elapsed, "speedup": baseline / elapsed}
+    return results
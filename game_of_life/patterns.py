@@ -0,0 +1,71 @@
+"""Pola preset dari dokumen"""
+
+import random
+
+# ==================== PATTERN SETUP ====================
+# Peluang sebuah sel hidup pada pola "random" (juga dipakai ensemble.random_board)
+RANDOM_DENSITY = 0.3
+
+
+def setup_pattern(game, pattern_name, rng=None):
+    """
+    Mengatur pola awal berdasarkan contoh dalam dokumen
+    Args:
+        game: GameOfLife (atau objek lain dengan rows, cols, dan set_cell)
+        pattern_name: nama pola (lihat PATTERNS)
+        rng: sumber bilangan acak untuk pola "random" (default: modul random)
+    """
+    rng = rng or random
+    # Pola 1: Konfigurasi sederhana (dari dokumen)
+    if pattern_name == "simple":
+        # Bentuk L kecil
+        game.set_cell(10, 10, 1)
+        game.set_cell(10, 11, 1)
+        game.set_cell(11, 10, 1)
+        game.set_cell(11, 11, 1)
+        game.set_cell(12, 12, 1)
+    
+    # Pola 2: Blok stabil (dari dokumen)
+    elif pattern_name == "block":
+        # Blok 2x2 - stabil
+        game.set_cell(10, 10, 1)
+        game.set_cell(10, 11, 1)
+        game.set_cell(11, 10, 1)
+        game.set_cell(11, 11, 1)
+    
+    # Pola 3: Two-phase oscillator (dari dokumen)
+    elif pattern_name == "oscillator":
+        # Blinker (periode 2)
+        game.set_cell(10, 10, 1)
+        game.set_cell(10, 11, 1)
+        game.set_cell(10, 12, 1)
+    
+    # Pola 4: Glider (bergerak)
+    elif pattern_name == "glider":
+        game.set_cell(5, 5, 1)
+        game.set_cell(5, 6, 1)
+        game.set_cell(6, 5, 1)
+        game.set_cell(6, 6, 1)
+        game.set_cell(7, 7, 1)
+    
+    # Pola 5: Contoh dari dokumen
+    elif pattern_name == "document_example":
+        # Contoh konfigurasi awal dari dokumen
+        game.set_cell(10, 10, 1)
+        game.set_cell(10, 11, 1)
+        game.set_cell(11, 10, 1)
+        game.set_cell(11, 11, 1)
+        game.set_cell(12, 10, 1)
+    
+    # Pola 6: Acak
+    elif pattern_name == "random":
+        for row in range(game.rows):
+            for col in range(game.cols):
+                if rng.random() < RANDOM_DENSITY:  # 30% kemungkinan hidup
+                    game.set_cell(row, col, 1)
+    
+    return game
+
+
+# Nama semua pola yang dikenal setup_pattern
+PATTERNS = ("simple", "block", "oscillator", "glider", "document_example", "random")
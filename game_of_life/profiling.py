@@ -0,0 +1,162 @@
+"""Profiler fase yang bisa dinyalakan/dimatikan saat program berjalan"""
+
+import time
+import sys
+import threading
+import signal
+import marshal
+import contextlib
+
+# ==================== PROFILING ====================
+class _PhaseTimer:
+    """Context manager yang mengukur satu pemanggilan fase (hanya saat profiler aktif)"""
+    
+    __slots__ = ("profiler", "name", "start")
+    
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Profiler:
+    """
+    Pencatat waktu per fase (step, stats, population, render, ...) berisi
+    jumlah panggilan, total, dan waktu terlama. Saat nonaktif, phase() hanya
+    mengembalikan context manager kosong yang sama sehingga biayanya sebatas
+    satu pemanggilan method. Dapat dinyalakan/dimatikan kapan saja.
+    """
+    
+    _IDLE = contextlib.nullcontext()
+    
+    def __init__(self):
+        self.enabled = False
+        # {nama fase: [jumlah panggilan, total detik, maksimum detik]}
+        self.phases = {}
+        self._lock = threading.Lock()
+        self._trace = None
+        # True selama trace cProfile sedang berjalan
+        self._tracing = False
+    
+    def enable(self, trace=False):
+        """
+        Mengaktifkan pencatatan
+        Args:
+            trace: juga jalankan cProfile (hanya untuk thread pemanggil)
+        """
+        self.enabled = True
+        if trace:
+            if self._trace is None:
+                # cProfile hanya dimuat jika trace diminta (bukan saat paket diimpor)
+                import cProfile
+                self._trace = cProfile.Profile()
+            self._trace.enable()
+            self._tracing = True
+    
+    def disable(self):
+        """Menghentikan pencatatan; data yang sudah terkumpul tetap disimpan"""
+        self.enabled = False
+        if self._trace is not None:
+            self._trace.disable()
+            self._tracing = False
+    
+    def toggle(self):
+        """Membalik status profiler; mengembalikan status baru"""
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+        return self.enabled
+    
+    def reset(self):
+        """Menghapus semua data yang terkumpul"""
+        with self._lock:
+            self.phases = {}
+        if self._trace is not None:
+            tracing = self._tracing
+            self._trace.disable()
+            self._trace = None
+            self._tracing = False
+            if tracing:
+                self.enable(trace=True)
+    
+    def phase(self, name):
+        """Context manager pengukur fase: with PROFILER.phase("step"): ..."""
+        if not self.enabled:
+            return self._IDLE
+        return _PhaseTimer(self, name)
+    
+    def record(self, name, seconds):
+        """Menambahkan satu pengukuran ke fase name"""
+        with self._lock:
+            entry = self.phases.get(name)
+            if entry is None:
+                self.phases[name] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                if seconds > entry[2]:
+                    entry[2] = seconds
+    
+    def summary(self):
+        """Tabel ringkasan per fase, diurutkan dari total waktu terbesar"""
+        with self._lock:
+            phases = sorted(self.phases.items(), key=lambda item: -item[1][1])
+        if not phases:
+            return "Profiler belum mencatat apa pun"
+        grand_total = sum(total for _, (_, total, _) in phases) or 1e-12
+        lines = [f"{'fase':<12}{'panggilan':>10}{'total (s)':>12}"
+                 f"{'rata2 (ms)':>12}{'maks (ms)':>11}{'porsi':>8}"]
+        for name, (calls, total, longest) in phases:
+            lines.append(f"{name:<12}{calls:>10}{total:>12.4f}"
+                         f"{total / calls * 1000:>12.3f}{longest * 1000:>11.3f}"
+                         f"{total / grand_total:>8.1%}")
+        return "\n".join(lines)
+    
+    def dump_stats(self, path):
+        """
+        Menyimpan data dalam format file pstats (dapat dibuka dengan
+        pstats.Stats(path) atau snakeviz). Fase muncul sebagai fungsi
+        "<fase>:0(nama)"; jika trace cProfile aktif, datanya ikut disertakan.
+        """
+        stats = {}
+        if self._trace is not None:
+            # create_stats() menghentikan trace; lanjutkan lagi jika tadi sedang berjalan
+            self._trace.create_stats()
+            if self._tracing:
+                self._trace.enable()
+            stats.update(self._trace.stats)
+        with self._lock:
+            for name, (calls, total, _) in self.phases.items():
+                stats[("<fase>", 0, name)] = (calls, calls, total, total, {})
+        with open(path, "wb") as f:
+            marshal.dump(stats, f)
+    
+    def install_signal_toggle(self, signum=None):
+        """
+        Menyalakan/mematikan profiler lewat sinyal (default SIGUSR1) pada proses
+        yang sedang berjalan; ringkasan ditulis ke stderr saat dimatikan
+        Returns:
+            False jika platform tidak mendukung sinyal tersebut
+        """
+        signum = signum or getattr(signal, "SIGUSR1", None)
+        if signum is None:
+            return False
+        
+        def handler(signum, frame):
+            if not self.toggle():
+                print(self.summary(), file=sys.stderr)
+        
+        signal.signal(signum, handler)
+        return True
+
+
+# Profiler bersama untuk loop console, GUI, dan worker simulasi
+PROFILER = Profiler()
@@ -0,0 +1,95 @@
+"""Aturan life-like B/S yang dikompilasi menjadi tabel lookup"""
+
+# ==================== ATURAN LIFE-LIKE ====================
+# Nama aturan populer yang dapat dipakai selain notasi B/S
+RULES = {
+    "life": "B3/S23",
+    "highlife": "B36/S23",
+    "seeds": "B2/S",
+    "daynight": "B3678/S34678",
+}
+
+
+class LifeRule:
+    """
+    Aturan life-like dalam notasi B/S (misalnya B3/S23 untuk Conway).
+    Aturan dikompilasi sekali menjadi tabel 18 entri:
+    table[status * 9 + jumlah_tetangga] = status berikutnya (status 0 atau 1),
+    sehingga engine cukup melakukan satu lookup tanpa percabangan per sel.
+    """
+    
+    def __init__(self, notation="B3/S23"):
+        """
+        Args:
+            notation: "B36/S23", "b3/s23", notasi lama "23/3" (S/B),
+                      atau nama dari RULES
+        """
+        text = RULES.get(notation.strip().lower(), notation).strip().upper()
+        parts = text.split("/")
+        if len(parts) != 2:
+            raise ValueError(f"Notasi aturan tidak valid: {notation}")
+        if parts[0].startswith("B") or parts[1].startswith("S"):
+            birth, survive = parts
+        else:
+            survive, birth = parts  # Notasi lama: S/B
+        birth = birth.lstrip("B")
+        survive = survive.lstrip("S")
+        if not (birth + survive).isdigit() and (birth + survive):
+            raise ValueError(f"Notasi aturan tidak valid: {notation}")
+        if any(digit == "9" for digit in birth + survive):
+            raise ValueError(f"Jumlah tetangga harus 0-8: {notation}")
+        
+        self.birth = frozenset(int(digit) for digit in birth)
+        self.survive = frozenset(int(digit) for digit in survive)
+        self.table = tuple(
+            1 if n in (self.survive if alive else self.birth) else 0
+            for alive in (0, 1) for n in range(9)
+        )
+    
+    @property
+    def notation(self):
+        """Notasi kanonik, misalnya "B36/S23" """
+        return ("B" + "".join(map(str, sorted(self.birth))) +
+                "/S" + "".join(map(str, sorted(self.survive))))
+    
+    def __str__(self):
+        return self.notation
+    
+    def __repr__(self):
+        return f"LifeRule({self.notation!r})"
+    
+    def __eq__(self, other):
+        return isinstance(other, LifeRule) and self.table == other.table
+    
+    def __hash__(self):
+        return hash(self.table)
+
+
+def parse_rule(rule):
+    """Mengubah None, nama, notasi, atau LifeRule menjadi LifeRule"""
+    if rule is None:
+        return LifeRule()
+    if isinstance(rule, LifeRule):
+        return rule
+    return LifeRule(rule)
+
+
+def _halo_sources(index):
+    """
+    Kebalikan tabel halo satu sumbu: untuk setiap posisi y, daftar pasangan
+    (x, offset) dengan index[x + 1 + offset] == y, yaitu sel x yang membaca y
+    sebagai tetangga pada offset tersebut
+    """
+    sources = [[] for _ in range(len(index) - 2)]
+    for position in range(len(index) - 2):
+        for offset in (-1, 0, 1):
+            target = index[position + 1 + offset]
+            if target is not None:
+                sources[target].append((position, offset))
+    return sources
+
+
+def _require_no_b0(rule, engine):
+    """Engine berbasis sel hidup tidak dapat menjalankan aturan yang melahirkan dari 0 tetangga"""
+    if 0 in rule.birth:
+        raise ValueError(f"Aturan {rule} (B0) tidak didukung engine {engine}")
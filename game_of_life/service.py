@@ -0,0 +1,468 @@
+"""Layanan simulasi asyncio: sesi yang bisa dijeda dan di-stream ke banyak klien"""
+
+import json
+import asyncio
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from .core import describe_cycle
+
+# ==================== SESI ASYNC ====================
+SessionFrame = namedtuple("SessionFrame", ["generation", "population", "stats", "cells", "status"])
+
+# Penanda akhir stream di antrean subscriber
+_CLOSED = object()
+
+
+class FrameStream:
+    """
+    Async iterator frame untuk satu subscriber dengan antrean terbatas.
+    drop_oldest=False: pengirim menunggu sampai ada tempat (backpressure),
+    sehingga sesi tidak pernah lebih cepat dari subscriber ini.
+    drop_oldest=True: frame tertua dibuang sehingga pengirim tidak pernah
+    tertahan (seperti SimulationWorker.publish).
+    """
+    
+    def __init__(self, owner, maxsize=8, drop_oldest=False):
+        """
+        Args:
+            owner: objek dengan unsubscribe(stream) (SimulationSession atau SessionServer)
+            maxsize: kapasitas antrean
+            drop_oldest: buang frame tertua saat antrean penuh, bukan menunggu
+        """
+        self._owner = owner
+        self._queue = asyncio.Queue(maxsize)
+        self.drop_oldest = drop_oldest
+        self.dropped = 0
+        self.closed = False
+        # Di-set saat stream ditutup; membangunkan pengirim yang menunggu antrean penuh
+        self._closing = asyncio.Event()
+    
+    async def put(self, item):
+        """Mengirim item sesuai kebijakan antrean (diabaikan setelah stream ditutup)"""
+        if self.closed:
+            return
+        if not self.drop_oldest:
+            if self._queue.full():
+                await self._put_or_close(item)
+            else:
+                self._queue.put_nowait(item)
+            return
+        while self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(item)
+    
+    async def _put_or_close(self, item):
+        """
+        Menunggu tempat di antrean atau stream ditutup, mana yang lebih dulu:
+        subscriber yang berhenti saat antrean penuh tidak boleh menahan pengirim
+        """
+        putter = asyncio.ensure_future(self._queue.put(item))
+        closing = asyncio.ensure_future(self._closing.wait())
+        try:
+            await asyncio.wait((putter, closing), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            putter.cancel()
+            closing.cancel()
+    
+    def _finish(self):
+        """Menutup stream tanpa menunggu; frame yang sudah diantre tetap bisa dibaca"""
+        self.closed = True
+        self._closing.set()
+        # Pembaca yang sedang menunggu dibangunkan; jika antrean penuh ia tidak menunggu
+        if not self._queue.full():
+            self._queue.put_nowait(_CLOSED)
+    
+    def close(self):
+        """Berhenti berlangganan; iterasi berakhir setelah frame yang sudah diantre"""
+        self._owner.unsubscribe(self)
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self):
+        if self.closed and self._queue.empty():
+            raise StopAsyncIteration
+        item = await self._queue.get()
+        if item is _CLOSED:
+            raise StopAsyncIteration
+        return item
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+
+class SimulationSession:
+    """
+    Menjalankan GameOfLife di executor (satu thread, sehingga engine tidak
+    pernah diakses bersamaan) dan membagikan setiap frame ke semua subscriber.
+    Sesi bisa dijeda, dilanjutkan, dan dihentikan dari event loop.
+    """
+    
+    def __init__(self, game, interval=0.0, every=1, max_generations=None,
+                 stop_on_cycle=False, cells=False, executor=None):
+        """
+        Args:
+            game: GameOfLife yang dijalankan (jangan diubah dari luar selama sesi berjalan)
+            interval: jeda minimum antar frame (detik); 0 berarti secepat engine
+            every: jumlah generasi per frame
+            max_generations: berhenti setelah sekian generasi (None: tanpa batas)
+            stop_on_cycle: berhenti jika pola stabil atau berulang
+            cells: sertakan daftar sel hidup di setiap frame
+            executor: executor untuk langkah engine (default: ThreadPoolExecutor 1 thread)
+        """
+        self.game = game
+        self.interval = interval
+        self.every = max(1, every)
+        self.max_generations = max_generations
+        self.stop_on_cycle = stop_on_cycle
+        self.cells = cells
+        # True jika statistik dinyalakan oleh sesi ini (dimatikan lagi saat selesai)
+        self._own_stats = False
+        if stop_on_cycle and game.cycle_detector is None:
+            game.enable_cycle_detection()
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=1,
+                                                        thread_name_prefix="game-of-life")
+        self._subscribers = []
+        self._resume = asyncio.Event()
+        self._resume.set()
+        self._stopping = False
+        self._task = None
+        self.steps = 0
+        self.latest = None
+    
+    @property
+    def running(self):
+        """True selama sesi belum selesai (termasuk saat dijeda)"""
+        return self._task is not None and not self._task.done()
+    
+    @property
+    def paused(self):
+        """True jika sesi sedang dijeda"""
+        return not self._resume.is_set()
+    
+    def subscribe(self, maxsize=8, drop_oldest=False):
+        """
+        Berlangganan frame (lihat FrameStream untuk kebijakan antrean).
+        Subscriber tanpa drop_oldest yang berhenti membaca akan menahan sesi,
+        jadi tutup dengan close() atau gunakan `async with`.
+        """
+        stream = FrameStream(self, maxsize, drop_oldest)
+        self._subscribers.append(stream)
+        return stream
+    
+    def unsubscribe(self, stream):
+        """Menghapus subscriber dan mengakhiri stream-nya"""
+        if stream in self._subscribers:
+            self._subscribers.remove(stream)
+            stream._finish()
+    
+    def start(self):
+        """Memulai sesi di event loop yang sedang berjalan; mengembalikan task-nya"""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self._task
+    
+    def pause(self):
+        """Menjeda setelah frame yang sedang dihitung"""
+        self._resume.clear()
+    
+    def resume(self):
+        """Melanjutkan sesi yang dijeda"""
+        self._resume.set()
+    
+    async def stop(self):
+        """
+        Menghentikan sesi setelah langkah yang sedang berjalan lalu menunggu selesai
+        Returns:
+            frame terakhir
+        """
+        self._stopping = True
+        self._resume.set()
+        return await self.wait()
+    
+    async def wait(self):
+        """Menunggu sampai sesi selesai; mengembalikan frame terakhir"""
+        if self._task is not None:
+            await self._task
+        return self.latest
+    
+    def _status(self):
+        """Alasan sesi berakhir setelah langkah terakhir (None jika masih berjalan)"""
+        game = self.game
+        if game.get_population() == 0:
+            return "Semua organisme telah punah!"
+        if self.stop_on_cycle and game.cycle is not None:
+            return describe_cycle(game.cycle)
+        if self.max_generations is not None and self.steps >= self.max_generations:
+            return f"Selesai setelah {self.steps} generasi"
+        return None
+    
+    def _frame(self, status=None):
+        """Membuat frame dari generasi saat ini (dijalankan di executor)"""
+        game = self.game
+        stats = game.stats.latest if game.stats is not None else None
+        if stats is not None and stats.generation != game.generation:
+            stats = None
+        cells = sorted(game.engine.live_cells()) if self.cells else None
+        return SessionFrame(game.generation, game.get_population(), stats, cells, status)
+    
+    def _advance(self):
+        """Langkah engine di executor: sampai `every` generasi, lalu membuat frame"""
+        status = None
+        for _ in range(self.every):
+            self.game.next_generation()
+            self.steps += 1
+            status = self._status()
+            if status is not None:
+                break
+        return self._frame(status)
+    
+    async def _publish(self, frame):
+        """Membagikan frame ke semua subscriber (menunggu subscriber tanpa drop_oldest)"""
+        self.latest = frame
+        for stream in list(self._subscribers):
+            await stream.put(frame)
+    
+    async def _run(self):
+        """Loop sesi: tunggu jika dijeda, langkah di executor, bagikan, atur laju"""
+        loop = asyncio.get_running_loop()
+        if self.game.stats is None:
+            # Populasi per generasi didapat dari statistik tanpa memindai papan,
+            # hanya selama sesi berjalan
+            self.game.enable_stats()
+            self._own_stats = True
+        try:
+            frame = await loop.run_in_executor(self._executor,
+                                               lambda: self._frame(self._status()))
+            await self._publish(frame)
+            while frame.status is None:
+                await self._resume.wait()
+                if self._stopping:
+                    await self._publish(frame._replace(status="Simulasi dihentikan"))
+                    break
+                started = loop.time()
+                frame = await loop.run_in_executor(self._executor, self._advance)
+                await self._publish(frame)
+                if self.interval:
+                    await asyncio.sleep(max(0.0, self.interval - (loop.time() - started)))
+        finally:
+            if self._own_stats:
+                self.game.stats = None
+                self._own_stats = False
+            for stream in list(self._subscribers):
+                self.unsubscribe(stream)
+            if self._own_executor:
+                self._executor.shutdown(wait=False)
+
+
+def encode_frame(frame):
+    """Mengubah SessionFrame menjadi satu baris JSON (bytes, diakhiri newline)"""
+    data = {"generation": frame.generation, "population": frame.population}
+    if frame.stats is not None:
+        data.update(births=frame.stats.births, deaths=frame.stats.deaths,
+                    bounding_box=frame.stats.bounding_box, activity=frame.stats.activity)
+    if frame.cells is not None:
+        data["cells"] = frame.cells
+    data["status"] = frame.status
+    return (json.dumps(data, separators=(",", ":")) + "\n").encode()
+
+
+# ==================== FRONT END HTTP ====================
+class SessionServer:
+    """
+    Front end HTTP lokal untuk satu SimulationSession. Semua klien berbagi
+    sesi yang sama: setiap frame di-encode sekali lalu dibagikan, dan klien
+    yang lambat kehilangan frame lama alih-alih menahan simulasi.
+        GET  /stream   NDJSON, satu baris per frame sampai sesi selesai
+        GET  /status   frame terakhir beserta status sesi
+        POST /pause, /resume, /stop
+    """
+    
+    def __init__(self, session, host="127.0.0.1", port=8765, client_buffer=16):
+        """
+        Args:
+            session: SimulationSession yang dibagikan
+            host, port: alamat server (port 0: pilih port bebas)
+            client_buffer: jumlah frame yang diantre per klien
+        """
+        self.session = session
+        self.host = host
+        self.port = port
+        self.client_buffer = client_buffer
+        self.clients = []
+        self.latest_line = None
+        self._server = None
+        self._broadcaster = None
+        # Task latar (misalnya stop dari POST /stop) disimpan agar tidak dibuang GC
+        self._tasks = set()
+        # Koneksi yang sedang dilayani: task handler -> writer
+        self._connections = {}
+    
+    async def start(self):
+        """Membuka socket dan mulai membagikan frame sesi"""
+        # Berlangganan sebelum sesi dimulai agar frame pertama tidak terlewat
+        frames = self.session.subscribe()
+        self._broadcaster = asyncio.get_running_loop().create_task(self._broadcast(frames))
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+    
+    async def close(self, timeout=5.0):
+        """
+        Menutup socket dan mengakhiri semua stream klien. Frame yang sudah
+        diantre (termasuk frame status terakhir) dikirim dulu; koneksi yang
+        belum selesai setelah timeout baru diputus.
+        Args:
+            timeout: batas waktu (detik) untuk mengosongkan antrean klien
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        if self._server is not None:
+            # Berhenti menerima koneksi baru; koneksi yang ada tetap dilayani
+            self._server.close()
+        if self._broadcaster is not None:
+            # Broadcaster selesai setelah frame terakhir sesi lalu menutup stream klien
+            await asyncio.wait([self._broadcaster], timeout=max(0.0, deadline - loop.time()))
+            if not self._broadcaster.done():
+                self._broadcaster.cancel()
+                for client in list(self.clients):
+                    self.unsubscribe(client)
+        connections = list(self._connections)
+        if connections:
+            _, pending = await asyncio.wait(connections, timeout=max(0.0, deadline - loop.time()))
+            # Klien yang tidak lagi membaca bisa menahan drain(); baru sekarang diputus
+            for task in pending:
+                self._connections[task].transport.abort()
+            await asyncio.gather(*pending, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+    
+    def unsubscribe(self, stream):
+        """Menghapus stream klien"""
+        if stream in self.clients:
+            self.clients.remove(stream)
+            stream._finish()
+    
+    async def _broadcast(self, frames):
+        """Meng-encode setiap frame sekali lalu menaruhnya di antrean semua klien"""
+        async with frames:
+            async for frame in frames:
+                self.latest_line = encode_frame(frame)
+                for client in list(self.clients):
+                    await client.put(self.latest_line)
+        for client in list(self.clients):
+            self.unsubscribe(client)
+    
+    async def _handle(self, reader, writer):
+        """Melayani satu koneksi HTTP"""
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            request = (await reader.readline()).decode("latin-1").split()
+            # Header tidak dipakai; cukup dibaca sampai baris kosong
+            while (await reader.readline()).strip():
+                pass
+            if len(request) < 2:
+                await self._respond(writer, 400, {"error": "request tidak valid"})
+                return
+            method, path = request[0], request[1].split("?")[0]
+            if method == "GET" and path == "/stream":
+                await self._stream(reader, writer)
+            elif method == "GET" and path == "/status":
+                await self._respond(writer, 200, self.status())
+            elif method == "POST" and path in ("/pause", "/resume", "/stop"):
+                if path == "/pause":
+                    self.session.pause()
+                elif path == "/resume":
+                    self.session.resume()
+                else:
+                    stopper = asyncio.get_running_loop().create_task(self.session.stop())
+                    self._tasks.add(stopper)
+                    stopper.add_done_callback(self._tasks.discard)
+                await self._respond(writer, 200, self.status())
+            else:
+                await self._respond(writer, 404, {"error": f"tidak ada {method} {path}"})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self._connections[task]
+            writer.close()
+    
+    def status(self):
+        """Ringkasan sesi untuk /status"""
+        latest = self.latest_line
+        return {
+            "running": self.session.running,
+            "paused": self.session.paused,
+            "clients": len(self.clients),
+            "latest": json.loads(latest) if latest is not None else None,
+        }
+    
+    async def _respond(self, writer, code, data):
+        """Mengirim respons JSON lengkap"""
+        body = json.dumps(data).encode()
+        reason = {200: "OK", 400: "Bad Request", 404: "Not Found"}[code]
+        writer.write(f"HTTP/1.1 {code} {reason}\r\nContent-Type: application/json\r\n"
+                     f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+        await writer.drain()
+    
+    async def _stream(self, reader, writer):
+        """Mengirim frame sebagai NDJSON sampai sesi selesai atau klien memutus koneksi"""
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+                     b"Cache-Control: no-cache\r\nConnection: close\r\n\r\n")
+        client = FrameStream(self, self.client_buffer, drop_oldest=True)
+        # Klien yang bergabung di tengah langsung menerima frame terakhir
+        if self.latest_line is not None:
+            await client.put(self.latest_line)
+        if self.session.running or self.latest_line is None:
+            self.clients.append(client)
+        else:
+            client._finish()
+        async with client:
+            # Koneksi yang ditutup klien dilepas segera, juga saat sesi dijeda
+            # dan tidak ada frame yang dikirim (jumlah klien di /status tetap benar)
+            watcher = asyncio.get_running_loop().create_task(
+                self._wait_disconnect(reader, client))
+            try:
+                async for line in client:
+                    if watcher.done():
+                        break
+                    writer.write(line)
+                    await writer.drain()
+            finally:
+                watcher.cancel()
+    
+    @staticmethod
+    async def _wait_disconnect(reader, client):
+        """Menunggu klien menutup koneksinya lalu mengakhiri stream-nya"""
+        try:
+            await reader.read()
+        except ConnectionError:
+            pass
+        client.close()
+
+
+async def serve_session(session, host="127.0.0.1", port=8765, ready=None):
+    """
+    Menjalankan sesi bersama SessionServer sampai sesi selesai
+    Args:
+        session: SimulationSession yang belum dimulai
+        host, port: alamat server
+        ready: fungsi ready(server) yang dipanggil setelah socket terbuka
+    Returns:
+        frame terakhir sesi
+    """
+    server = SessionServer(session, host, port)
+    await server.start()
+    if ready is not None:
+        ready(server)
+    session.start()
+    try:
+        return await session.wait()
+    finally:
+        await server.close()
@@ -0,0 +1,156 @@
+"""Statistik per generasi dan sink file CSV/JSONL"""
+
+import os
+import json
+from collections import namedtuple
+
+# ==================== STATISTIK GENERASI ====================
+GenerationStats = namedtuple("GenerationStats", ["generation", "population", "births",
+                                                 "deaths", "bounding_box", "activity"])
+
+
+class StatsStream:
+    """
+    Statistik per generasi yang dihitung dari hasil sampingan langkah engine,
+    bukan dari pemindaian ulang papan. Engine dengan step_counts() dan
+    box_changed() menghitung kelahiran dan kematian dengan operasi bit/vektor
+    tanpa membuat daftar sel; engine lain memakai daftar sel yang berubah.
+    Kotak pembatas diperbarui secara inkremental: papan hanya dipindai ulang
+    jika ada sel lahir di luar kotak atau sel di tepi kotak mati.
+    Setiap GenerationStats dikirim ke semua subscriber.
+    """
+    
+    def __init__(self, track_bounding_box=True):
+        """
+        Args:
+            track_bounding_box: hitung kotak pembatas (False: bounding_box None)
+        """
+        self.track_bounding_box = track_bounding_box
+        self.subscribers = []
+        self.latest = None
+        self.reset()
+    
+    def reset(self):
+        """Dipanggil saat papan diubah manual: populasi dan kotak dihitung ulang"""
+        self.population = None
+        self._box = None
+    
+    def subscribe(self, callback):
+        """Mendaftarkan fungsi callback(stats); mengembalikan callback"""
+        self.subscribers.append(callback)
+        return callback
+    
+    def unsubscribe(self, callback):
+        """Menghapus subscriber"""
+        self.subscribers.remove(callback)
+    
+    def _update_box(self, game, population, born, died):
+        """
+        Kotak pembatas baru dari kotak lama dan sel yang lahir/mati; born None
+        berarti engine sendiri yang memeriksa perubahan lewat box_changed()
+        """
+        if population == 0:
+            return None
+        box = self._box
+        if self.population is None or (born is None and box is None):
+            return game.bounding_box()
+        if born is None:
+            return game.bounding_box() if game.engine.box_changed(box) else box
+        if box is not None and any(
+                row in (box[0], box[2]) or col in (box[1], box[3]) for row, col in died):
+            return game.bounding_box()
+        for row, col in born:
+            if box is None:
+                box = (row, col, row, col)
+            else:
+                box = (min(box[0], row), min(box[1], col), max(box[2], row), max(box[3], col))
+        return box
+    
+    def publish(self, game, changed=None):
+        """
+        Menghitung statistik generasi saat ini lalu mengirimnya ke subscriber
+        Args:
+            game: GameOfLife yang baru melangkah
+            changed: sel yang berubah oleh langkah terakhir jika sudah dihitung
+        Returns:
+            GenerationStats
+        """
+        engine = game.engine
+        counts = getattr(engine, "step_counts", None)
+        if counts is not None and (hasattr(engine, "box_changed") or
+                                   not self.track_bounding_box):
+            births, deaths = counts()
+            born = died = None
+        else:
+            if changed is None:
+                changed = engine.changed_cells()
+            get_cell = engine.get_cell
+            born, died = [], []
+            for row, col in changed:
+                (born if get_cell(row, col) else died).append((row, col))
+            births, deaths = len(born), len(died)
+        
+        if self.population is None:
+            population = engine.population()
+        else:
+            population = self.population + births - deaths
+        box = None
+        if self.track_bounding_box:
+            box = self._update_box(game, population, born, died)
+        self.population, self._box = population, box
+        
+        # Kepadatan aktivitas: proporsi sel yang berubah terhadap luas papan
+        # (semesta tak terbatas: luas kotak pembatas)
+        if engine.bounded or box is None:
+            area = game.rows * game.cols
+        else:
+            area = (box[2] - box[0] + 1) * (box[3] - box[1] + 1)
+        stats = GenerationStats(game.generation, population, births, deaths, box,
+                                (births + deaths) / area if area else 0.0)
+        self.latest = stats
+        for callback in self.subscribers:
+            callback(stats)
+        return stats
+
+
+class StatsFileSink:
+    """
+    Subscriber yang menulis setiap GenerationStats ke file CSV atau JSONL
+    (format ditentukan dari ekstensi file, seperti save_pattern_file)
+    """
+    
+    CSV_COLUMNS = ("generation", "population", "births", "deaths",
+                   "min_row", "min_col", "max_row", "max_col", "activity")
+    
+    def __init__(self, path, flush_every=100):
+        """
+        Args:
+            path: file tujuan (.csv atau .jsonl)
+            flush_every: jumlah baris sebelum buffer file di-flush
+        """
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in (".csv", ".jsonl"):
+            raise ValueError(f"Format statistik tidak dikenal: {path}")
+        self.csv = extension == ".csv"
+        self.flush_every = flush_every
+        self._count = 0
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        if self.csv:
+            self._file.write(",".join(self.CSV_COLUMNS) + "\n")
+    
+    def __call__(self, stats):
+        """Menulis satu baris statistik"""
+        if self.csv:
+            box = stats.bounding_box or ("", "", "", "")
+            line = ",".join(map(str, (stats.generation, stats.population, stats.births,
+                                      stats.deaths, *box, f"{stats.activity:.6g}")))
+        else:
+            line = json.dumps(stats._asdict(), separators=(",", ":"))
+        self._file.write(line + "\n")
+        self._count += 1
+        if self._count % self.flush_every == 0:
+            self._file.flush()
+    
+    def close(self):
+        """Menutup file"""
+        self._file.close()
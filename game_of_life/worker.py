@@ -0,0 +1,161 @@
+"""Viewport dan thread simulasi latar belakang (tidak membutuhkan Tk)"""
+
+import time
+import queue
+import threading
+from collections import deque, namedtuple
+
+from .core import describe_cycle
+from .profiling import PROFILER
+
+# ==================== VIEWPORT ====================
+# Jendela tampilan: top/left None berarti jendela mengikuti pola; palette None berarti
+# sel digambar satu per satu, selain itu kepadatan blok digambar sebagai gambar
+Viewport = namedtuple("Viewport", ["top", "left", "rows", "cols", "block", "palette"])
+
+
+def density_palette(block, dead_color, alive_color):
+    """
+    Membuat warna untuk setiap jumlah sel hidup dalam satu blok (0..block*block)
+    Args:
+        block: sisi blok dalam sel
+        dead_color, alive_color: warna '#rrggbb' untuk blok kosong dan penuh
+    Returns:
+        Tuple warna sepanjang block*block + 1
+    """
+    dead = [int(dead_color[i:i + 2], 16) for i in (1, 3, 5)]
+    alive = [int(alive_color[i:i + 2], 16) for i in (1, 3, 5)]
+    cells = block * block
+    palette = []
+    for count in range(cells + 1):
+        # Akar kuadrat agar blok yang hanya berisi sedikit sel tetap terlihat
+        level = (count / cells) ** 0.5
+        palette.append("#%02x%02x%02x" % tuple(
+            round(d + (a - d) * level) for d, a in zip(dead, alive)))
+    return tuple(palette)
+
+
+def density_image_data(counts, palette):
+    """
+    Menyusun data PhotoImage.put ('{#rrggbb ...} {...}') dari jumlah sel per blok
+    sehingga seluruh gambar diisi dengan satu panggilan
+    """
+    return " ".join("{" + " ".join([palette[count] for count in row]) + "}" for row in counts)
+
+
+# ==================== SIMULASI LATAR BELAKANG ====================
+Frame = namedtuple("Frame", ["generation", "population", "live", "origin", "rate", "status",
+                             "view", "density"])
+
+
+class SimulationWorker(threading.Thread):
+    """
+    Thread yang menjalankan engine dengan laju target dan menaruh frame ke
+    antrean terbatas. Frame baru hanya dibuat setelah konsumen mengambil frame
+    sebelumnya, sehingga generasi yang tidak akan tampil tidak dibuatkan frame;
+    jika antrean tetap penuh, frame lama dibuang.
+    """
+    
+    def __init__(self, game, interval, stop_on_cycle=False, max_frames=2, viewport=None):
+        """
+        Args:
+            game: GameOfLife yang dijalankan (jangan diubah thread lain selama berjalan)
+            interval: fungsi tanpa argumen yang mengembalikan jeda antar generasi (detik)
+            stop_on_cycle: berhenti jika pola stabil atau berulang
+            max_frames: kapasitas antrean frame
+            viewport: fungsi tanpa argumen yang mengembalikan Viewport saat ini
+                      (default: jendela rows x cols yang mengikuti pola)
+        """
+        super().__init__(daemon=True)
+        self.game = game
+        self.interval = interval
+        self.stop_on_cycle = stop_on_cycle
+        if stop_on_cycle and game.cycle_detector is None:
+            game.enable_cycle_detection()
+        if viewport is None:
+            view = Viewport(None, None, game.rows, game.cols, 1, None)
+            viewport = lambda: view
+        self.viewport = viewport
+        self.frames = queue.Queue(maxsize=max_frames)
+        self._stop_event = threading.Event()
+    
+    def stop(self):
+        """Meminta thread berhenti dan menunggu sampai selesai"""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
+    
+    def make_frame(self, rate, status=None):
+        """
+        Membuat frame untuk jendela tampilan: sel hidup di dalam jendela, atau
+        data gambar kepadatan jika viewport memakai palet
+        """
+        game = self.game
+        view = self.viewport()
+        live = density = None
+        with PROFILER.phase("frame"):
+            if view.top is None:
+                top, left = game.view_origin(view.rows, view.cols)
+            else:
+                top, left = view.top, view.left
+            if view.palette is None:
+                # Hanya jendela yang diambil dari engine, bukan seluruh papan
+                live = {(row - top, col - left)
+                        for row, col in game.live_cells_in(top, left, view.rows, view.cols)}
+            else:
+                counts = game.density(top, left, -(-view.rows // view.block),
+                                      -(-view.cols // view.block), view.block)
+                density = density_image_data(counts, view.palette)
+        return Frame(game.generation, game.get_population(), live, (top, left), rate, status,
+                     view, density)
+    
+    def publish(self, frame):
+        """Menaruh frame ke antrean, membuang frame tertua jika penuh"""
+        while True:
+            try:
+                self.frames.put_nowait(frame)
+                return
+            except queue.Full:
+                try:
+                    self.frames.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def latest(self):
+        """Mengambil frame terbaru (None jika belum ada) dan membuang sisanya"""
+        frame = None
+        while True:
+            try:
+                frame = self.frames.get_nowait()
+            except queue.Empty:
+                return frame
+    
+    def run(self):
+        """Loop simulasi: melangkah, mengukur laju, lalu menunggu sesuai target"""
+        game = self.game
+        recent = deque()
+        deadline = time.perf_counter()
+        while not self._stop_event.is_set():
+            game.next_generation()
+            
+            # Laju tercapai = jumlah selang antar generasi dalam satu detik terakhir
+            # dibagi rentang waktunya (n sampel waktu hanya memuat n - 1 selang)
+            now = time.perf_counter()
+            recent.append(now)
+            while recent[0] < now - 1.0:
+                recent.popleft()
+            rate = (len(recent) - 1) / max(now - recent[0], 1e-9) if len(recent) > 1 else 0.0
+            
+            status = None
+            if game.is_empty():
+                status = "Semua organisme telah punah!"
+            elif self.stop_on_cycle and game.cycle is not None:
+                status = describe_cycle(game.cycle)
+            # Frame status terakhir selalu dikirim; frame biasa hanya jika antrean kosong
+            if status is not None or self.frames.empty():
+                self.publish(self.make_frame(rate, status))
+            if status is not None:
+                return
+            
+            deadline = max(deadline + self.interval(), now)
+            self._stop_event.wait(max(0.0, deadline - time.perf_counter()))
@@ -0,0 +1,56 @@
+"""Helper pengujian bersama: daftar engine, papan acak, dan pelepasan game"""
+
+import random
+
+import pytest
+
+from game_of_life import ENGINES, GameOfLife
+from game_of_life.optional import load_numpy
+
+ROWS, COLS = 11, 13
+
+
+def engine_names():
+    """Semua engine GameOfLife; engine numpy dilewati jika NumPy tidak terpasang"""
+    marks = {"numpy": pytest.mark.skipif(load_numpy() is None, reason="NumPy tidak terpasang")}
+    return [pytest.param(name, marks=marks.get(name, ())) for name in ENGINES]
+
+
+@pytest.fixture(params=engine_names())
+def engine(request):
+    """Nama engine; pengujian yang memakainya dijalankan sekali per engine"""
+    return request.param
+
+
+def random_cells(seed, rows=ROWS, cols=COLS, density=0.35):
+    """Papan acak yang sama di setiap proses (seed string tidak dipengaruhi PYTHONHASHSEED)"""
+    generator = random.Random(seed)
+    return {(row, col) for row in range(rows) for col in range(cols)
+            if generator.random() < density}
+
+
+def make_game(engine="python", cells=(), rows=ROWS, cols=COLS, **options):
+    """GameOfLife dengan engine tertentu dan sel-sel cells hidup (options: misalnya rule)"""
+    game = GameOfLife(rows, cols, engine=engine, **options)
+    for row, col in cells:
+        game.set_cell(row, col, 1)
+    return game
+
+
+
+@pytest.fixture
+def closing():
+    """
+    Mengembalikan register(game): setiap game yang didaftarkan dilepas setelah
+    pengujian selesai, juga saat assert gagal (process pool dan shared memory
+    engine parallel)
+    """
+    games = []
+    
+    def register(game):
+        games.append(game)
+        return game
+    
+    yield register
+    for game in games:
+        game.close()
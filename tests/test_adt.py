@@ -0,0 +1,206 @@
+"""Pengujian ADT Array dan Grid, dengan dan tanpa typecode"""
+
+import array
+import sys
+
+import pytest
+
+from game_of_life import Array, ArrayIterator, Grid
+
+TYPECODES = (None, "B")
+
+
+# ==================== ADT ARRAY ====================
+def test_array_uses_slots():
+    values = Array(3)
+    assert not hasattr(values, "__dict__")
+    with pytest.raises(AttributeError):
+        values.extra = 1
+
+
+def test_array_storage_depends_on_typecode():
+    untyped, typed = Array(4), Array(4, "B")
+    assert untyped.typecode is None and list(untyped) == [None] * 4
+    assert typed.typecode == "B" and list(typed) == [0] * 4
+    assert isinstance(typed._elements, array.array)
+    untyped[0] = "sel"
+    assert untyped[0] == "sel"
+    with pytest.raises(TypeError):
+        typed[0] = "sel"
+    with pytest.raises(OverflowError):
+        typed[0] = 256
+
+
+def test_array_rejects_empty_size():
+    with pytest.raises(ValueError, match="Ukuran array harus lebih besar dari 0"):
+        Array(0)
+
+
+@pytest.mark.parametrize("typecode", TYPECODES)
+def test_array_bounds_checks(typecode):
+    values = Array(3, typecode)
+    for index in (-1, 3):
+        with pytest.raises(IndexError, match="Indeks di luar rentang array"):
+            values[index]
+        with pytest.raises(IndexError, match="Indeks di luar rentang array"):
+            values[index] = 1
+        with pytest.raises(IndexError, match="Indeks di luar rentang array"):
+            values.getitem(index)
+        with pytest.raises(IndexError, match="Indeks di luar rentang array"):
+            values.setitem(index, 1)
+
+
+@pytest.mark.parametrize("typecode", TYPECODES)
+def test_array_slicing(typecode):
+    values = Array(6, typecode)
+    for index in range(6):
+        values[index] = index
+    part = values[1:5:2]
+    assert isinstance(part, Array)
+    assert list(part) == [1, 3] and len(part) == 2 and part.typecode == typecode
+    # Potongan adalah salinan
+    part[0] = 9
+    assert values[1] == 1
+    values[0:2] = [7, 8]
+    values[4:6] = part
+    assert list(values) == [7, 8, 2, 3, 9, 3]
+    with pytest.raises(ValueError, match="Panjang nilai tidak sesuai"):
+        values[0:2] = [1]
+    with pytest.raises(ValueError, match="Potongan array tidak boleh kosong"):
+        values[3:3]
+
+
+@pytest.mark.parametrize("typecode", TYPECODES)
+def test_array_clearing(typecode):
+    values = Array(4, typecode)
+    values.clearing(1)
+    assert list(values) == [1] * 4 and len(values) == values.length() == 4
+
+
+def test_array_buffer_is_shared_without_copy():
+    values = Array(4, "B")
+    view = values.memoryview()
+    assert view.format == "B" and view.tolist() == [0] * 4
+    view[2] = 5
+    assert values[2] == 5
+    assert values.__buffer__(0).tolist() == [0, 0, 5, 0]
+    if sys.version_info >= (3, 12):
+        assert memoryview(values).tolist() == [0, 0, 5, 0]
+
+
+@pytest.mark.parametrize("typecode", TYPECODES)
+def test_array_iterator_is_kept_for_direct_use(typecode):
+    values = Array(3, typecode)
+    values.clearing(1)
+    iterator = ArrayIterator(values)
+    assert iter(iterator) is iterator
+    assert list(iterator) == list(values) == [1, 1, 1]
+    with pytest.raises(StopIteration):
+        next(iterator)
+
+
+def test_untyped_array_has_no_buffer():
+    with pytest.raises(TypeError, match="Array tanpa typecode tidak memiliki buffer"):
+        Array(2).memoryview()
+
+
+# ==================== ADT GRID ====================
+def filled_grid(typecode, rows=3, cols=4):
+    grid = Grid(rows, cols, typecode)
+    for row in range(rows):
+        for col in range(cols):
+            grid.setitem(row, col, row * cols + col)
+    return grid
+
+
+def test_grid_uses_slots():
+    grid = Grid(2, 2, "B")
+    assert not hasattr(grid, "__dict__")
+    with pytest.raises(AttributeError):
+        grid.extra = 1
+
+
+@pytest.mark.parametrize("typecode", TYPECODES)
+def test_grid_initial_values_and_size(typecode):
+    grid = Grid(2, 3, typecode)
+    assert (grid.rows(), grid.cols()) == (2, 3)
+    expected = None if typecode is None else 0
+    assert all(grid.getitem(row, col) == expected for row in range(2) for col in range(3))
+
+
+@pytest.mark.parametrize("typecode", TYPECODES)
+def test_grid_bounds_checks(typecode):
+    grid = Grid(2, 3, typecode)
+    for row, col in ((-1, 0), (2, 0), (0, -1), (0, 3)):
+        with pytest.raises(IndexError, match="Posisi di luar rentang grid"):
+            grid.getitem(row, col)
+        with pytest.raises(IndexError, match="Posisi di luar rentang grid"):
+            grid.setitem(row, col, 1)
+    with pytest.raises(IndexError, match="Indeks di luar rentang array"):
+        grid[2]
+
+
+def test_typed_grid_rows_share_one_buffer():
+    grid = filled_grid("B")
+    grid[1][2] = 99
+    assert grid._buffer[1 * 4 + 2] == 99
+    view = grid.memoryview()
+    assert view.shape == (3, 4) and view.format == "B"
+    view[0, 0] = 42
+    assert grid.getitem(0, 0) == 42
+    assert grid.__buffer__(0).tolist() == view.tolist()
+    if sys.version_info >= (3, 12):
+        assert memoryview(grid).tolist() == view.tolist()
+
+
+def test_untyped_grid_has_no_buffer():
+    with pytest.raises(TypeError, match="Grid tanpa typecode tidak memiliki buffer"):
+        Grid(2, 2).memoryview()
+
+
+@pytest.mark.parametrize("typecode", TYPECODES)
+def test_grid_row_slicing_copies(typecode):
+    grid = filled_grid(typecode)
+    part = grid[1:3]
+    assert isinstance(part, Grid) and (part.rows(), part.cols()) == (2, 4)
+    assert list(part[0]) == [4, 5, 6, 7] and list(part[1]) == [8, 9, 10, 11]
+    part.setitem(0, 0, 0)
+    assert grid.getitem(1, 0) == 4
+    with pytest.raises(ValueError, match="Potongan grid tidak boleh kosong"):
+        grid[2:2]
+
+
+@pytest.mark.parametrize("typecode", TYPECODES)
+def test_grid_row_assignment(typecode):
+    grid = filled_grid(typecode)
+    grid[0] = [1, 1, 1, 1]
+    grid[1] = Array._wrap([2, 2, 2, 2], None) if typecode is None else Array(4, typecode)
+    assert isinstance(grid[0], Array)
+    assert list(grid[0]) == [1, 1, 1, 1]
+    assert list(grid[1]) == ([2, 2, 2, 2] if typecode is None else [0, 0, 0, 0])
+    with pytest.raises(ValueError, match="Jumlah kolom tidak sesuai"):
+        grid[2] = [1, 2]
+
+
+@pytest.mark.parametrize("typecode", TYPECODES)
+def test_grid_clear_copy_and_copy_from(typecode):
+    grid = filled_grid(typecode)
+    clone = grid.copy()
+    assert str(clone) == str(grid)
+    clone.setitem(0, 0, 50)
+    assert grid.getitem(0, 0) == 0
+    
+    target = Grid(3, 4, typecode)
+    target.copy_from(clone)
+    assert target.getitem(0, 0) == 50 and target.getitem(2, 3) == 11
+    grid.clear(0)
+    assert str(grid) == "0 0 0 0 \n" * 3
+
+
+def test_copy_from_between_typed_and_untyped_grids():
+    typed, untyped = filled_grid("B"), Grid(3, 4)
+    untyped.copy_from(typed)
+    assert [list(untyped[row]) for row in range(3)] == [list(typed[row]) for row in range(3)]
+    typed.clear(0)
+    typed.copy_from(untyped)
+    assert typed.getitem(2, 3) == 11
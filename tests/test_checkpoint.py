@@ -0,0 +1,92 @@
+"""Pengujian checkpoint biner: simpan dari setiap engine, pulihkan ke setiap engine lain"""
+
+import pytest
+
+from game_of_life import BOUNDARIES, GameOfLife, load_checkpoint, save_checkpoint
+from conftest import engine_names, make_game
+
+# Blok di pojok (0, 0), glider, dan blinker: kotak pembatas (0, 0) - (10, 12)
+# lebih kecil dari papan 12 x 16
+CELLS = {(0, 0), (0, 1), (1, 0), (1, 1),
+         (3, 6), (4, 7), (5, 5), (5, 6), (5, 7),
+         (9, 10), (9, 11), (9, 12)}
+
+
+def stepped(cells, generations, rows=12, cols=16):
+    """Sel hidup setelah sekian generasi, dihitung dengan engine python"""
+    game = make_game("python", cells, rows, cols)
+    for _ in range(generations):
+        game.next_generation()
+    return set(game.engine.live_cells())
+
+
+@pytest.mark.parametrize("target", engine_names())
+@pytest.mark.parametrize("source", engine_names())
+def test_round_trip_between_engines(tmp_path, closing, source, target):
+    path = str(tmp_path / "board.ckpt")
+    game = closing(make_game(source, CELLS, rows=12, cols=16))
+    for _ in range(3):
+        game.next_generation()
+    save_checkpoint(game, path)
+    expected = set(game.engine.live_cells())
+    
+    restored = closing(load_checkpoint(path, engine=target))
+    assert restored.engine.name == target
+    assert (restored.rows, restored.cols, restored.generation) == (12, 16, 3)
+    assert set(restored.engine.live_cells()) == expected
+    assert restored.get_population() == len(expected)
+    # Papan hasil pemulihan harus dapat langsung dilangkahkan
+    restored.next_generation()
+    assert set(restored.engine.live_cells()) == stepped(CELLS, 4)
+
+
+def test_default_engine_is_the_saved_one(tmp_path):
+    path = str(tmp_path / "board.ckpt")
+    save_checkpoint(make_game("bitset", CELLS, rows=12, cols=16), path)
+    restored = load_checkpoint(path)
+    assert restored.engine.name == "bitset"
+    assert set(restored.engine.live_cells()) == CELLS
+
+
+def test_sparse_bounding_box_away_from_origin(tmp_path):
+    path = str(tmp_path / "board.ckpt")
+    cells = {(row + 1, col + 2) for row, col in CELLS}
+    save_checkpoint(make_game("sparse", cells, rows=12, cols=16), path)
+    for target in ("python", "bitset", "active", "sparse"):
+        restored = load_checkpoint(path, engine=target)
+        assert set(restored.engine.live_cells()) == cells
+        restored.next_generation()
+        assert set(restored.engine.live_cells()) == stepped(cells, 1)
+
+
+def test_sparse_cells_outside_board_are_dropped(tmp_path):
+    path = str(tmp_path / "board.ckpt")
+    save_checkpoint(make_game("sparse", {(-2, -2), (1, 1), (20, 3)}, rows=12, cols=16), path)
+    assert set(load_checkpoint(path, engine="bitset").engine.live_cells()) == {(1, 1)}
+    assert set(load_checkpoint(path, engine="sparse").engine.live_cells()) == {
+        (-2, -2), (1, 1), (20, 3)}
+
+
+def test_empty_board(tmp_path):
+    path = str(tmp_path / "board.ckpt")
+    for source in ("python", "sparse"):
+        save_checkpoint(GameOfLife(5, 7, engine=source), path)
+        for target in ("python", "bitset", "sparse"):
+            restored = load_checkpoint(path, engine=target)
+            assert restored.is_empty()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "board.ckpt"
+    path.write_bytes(b"bukan checkpoint" * 8)
+    with pytest.raises(ValueError):
+        load_checkpoint(str(path))
+
+
+@pytest.mark.parametrize("boundary", BOUNDARIES)
+def test_boundary_is_restored(tmp_path, boundary):
+    path = str(tmp_path / "board.ckpt")
+    save_checkpoint(make_game("bitset", CELLS, rows=12, cols=16, boundary=boundary), path)
+    for target in ("python", "sparse"):
+        restored = load_checkpoint(path, engine=target)
+        assert restored.boundary == boundary
@@ -0,0 +1,116 @@
+"""Pengujian CLI headless: kode keluar, ringkasan, dan file keluaran"""
+
+import csv
+import json
+import random
+
+import pytest
+
+from game_of_life import GameOfLife, fileio, load_checkpoint, setup_pattern
+from game_of_life.cli import cli_main
+
+
+def run_json(capsys, *argv):
+    """Menjalankan cli_main dengan --json dan mengembalikan ringkasannya"""
+    assert cli_main([*argv, "--json"]) == 0
+    return json.loads(capsys.readouterr().out)
+
+
+def test_json_summary_matches_game_of_life(capsys):
+    summary = run_json(capsys, "--rows", "12", "--cols", "20", "--seed", "3",
+                       "--generations", "15", "--engine", "bitset")
+    game = setup_pattern(GameOfLife(12, 20), "random", random.Random(3))
+    initial = game.get_population()
+    for _ in range(15):
+        game.next_generation()
+    assert summary["engine"] == "bitset"
+    assert (summary["rule"], summary["boundary"]) == ("B3/S23", "dead")
+    assert (summary["generation"], summary["generations"]) == (15, 15)
+    assert (summary["initial_population"], summary["population"]) == (
+        initial, game.get_population())
+    assert summary["bounding_box"] == list(game.bounding_box())
+
+
+def test_stop_on_cycle(capsys):
+    summary = run_json(capsys, "--pattern", "simple", "--generations", "50",
+                       "--stop-on-cycle")
+    assert summary["generations"] < 50
+    assert summary["cycle"] is not None
+
+
+def test_text_summary(capsys):
+    assert cli_main(["--rows", "8", "--cols", "8", "--seed", "1", "--generations", "2"]) == 0
+    out = capsys.readouterr().out
+    assert "Engine python, aturan B3/S23, batas dead, grid 8x8" in out
+    assert "Generasi: 2 (2 dijalankan" in out
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl"])
+def test_stats_file(tmp_path, capsys, suffix):
+    path = tmp_path / f"stats{suffix}"
+    summary = run_json(capsys, "--seed", "5", "--generations", "12", "--stats", str(path))
+    if suffix == ".csv":
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        generations = [int(row["generation"]) for row in rows]
+        populations = [int(row["population"]) for row in rows]
+    else:
+        rows = [json.loads(line) for line in path.read_text().splitlines()]
+        generations = [row["generation"] for row in rows]
+        populations = [row["population"] for row in rows]
+    assert generations == list(range(1, 13))
+    assert populations[-1] == summary["population"]
+
+
+def test_output_and_final_checkpoint(tmp_path, capsys):
+    output, checkpoint = tmp_path / "final.rle", tmp_path / "final.ckpt"
+    summary = run_json(capsys, "--seed", "2", "--generations", "7", "--engine", "active",
+                       "--output", str(output), "--checkpoint", str(checkpoint))
+    assert output.read_text().startswith("x = ")
+    restored = load_checkpoint(str(checkpoint))
+    assert (restored.engine.name, restored.generation) == ("active", 7)
+    assert restored.get_population() == summary["population"]
+
+
+def test_checkpoint_every_writes_periodic_snapshots(tmp_path, capsys, monkeypatch):
+    written = []
+    write = fileio._write_atomic
+    
+    def spy(path, data):
+        write(path, data)
+        written.append(load_checkpoint(path).generation)
+    
+    monkeypatch.setattr(fileio, "_write_atomic", spy)
+    checkpoint = tmp_path / "run.ckpt"
+    run_json(capsys, "--seed", "4", "--generations", "10", "--checkpoint", str(checkpoint),
+             "--checkpoint-every", "4")
+    # Snapshot berkala (generasi 8 selalu ditulis) lalu checkpoint akhir
+    assert 8 in written[:-1] and set(written[:-1]) <= {4, 8}
+    assert written[-1] == 10
+    assert load_checkpoint(str(checkpoint)).generation == 10
+
+
+@pytest.mark.parametrize("argv", [
+    ["--pattern-file", "tidak-ada.rle"],
+    ["--stats", "stats.txt"],
+])
+def test_file_errors_exit_with_1(tmp_path, monkeypatch, capsys, argv):
+    monkeypatch.chdir(tmp_path)
+    assert cli_main(argv + ["--generations", "1"]) == 1
+    assert capsys.readouterr().err.startswith("Error: ")
+
+
+@pytest.mark.parametrize("argv", [
+    ["--rows", "0"],
+    ["--generations", "-1"],
+    ["--rule", "B9/S23"],
+    ["--engine", "fortran"],
+    ["--checkpoint-every", "5"],
+    ["--checkpoint", "run.ckpt", "--checkpoint-every", "0"],
+    ["--pattern", "glider", "--pattern-file", "glider.rle"],
+])
+def test_bad_arguments_exit_with_2(capsys, argv):
+    with pytest.raises(SystemExit) as excinfo:
+        cli_main(argv)
+    assert excinfo.value.code == 2
+    assert "error:" in capsys.readouterr().err
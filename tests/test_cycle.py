@@ -0,0 +1,93 @@
+"""Pengujian deteksi still life dan siklus dengan fingerprint Zobrist"""
+
+from game_of_life import CycleDetector, CycleInfo, describe_cycle
+from game_of_life.core import zobrist_hash, zobrist_key
+from conftest import make_game, random_cells
+
+BLOCK = {(4, 4), (4, 5), (5, 4), (5, 5)}
+BLINKER = {(5, 4), (5, 5), (5, 6)}
+
+
+# ==================== FINGERPRINT ZOBRIST ====================
+def test_zobrist_keys_are_distinct_64_bit_values():
+    keys = {zobrist_key(row, col) for row in range(-16, 16) for col in range(-16, 16)}
+    assert len(keys) == 32 * 32
+    assert all(0 <= key < 1 << 64 for key in keys)
+    assert zobrist_key(3, 7) != zobrist_key(7, 3)
+
+
+def test_zobrist_hash_is_order_independent_and_incremental():
+    cells = sorted(random_cells("zobrist"))
+    assert zobrist_hash(cells) == zobrist_hash(reversed(cells))
+    assert zobrist_hash([]) == 0
+    # Menambah atau membuang satu sel cukup di-XOR dengan kuncinya
+    assert zobrist_hash(cells[1:]) == zobrist_hash(cells) ^ zobrist_key(*cells[0])
+
+
+# ==================== CYCLE DETECTOR ====================
+def test_detector_reports_period_and_first_generation():
+    detector = CycleDetector()
+    for generation, fingerprint in enumerate((10, 20, 30, 40)):
+        assert detector.record(fingerprint, generation) is None
+    assert detector.record(20, 4) == CycleInfo(period=3, start_generation=1,
+                                               detected_generation=4)
+
+
+def test_detector_forgets_beyond_history_size():
+    detector = CycleDetector(history_size=2)
+    for generation, fingerprint in enumerate((10, 20, 30)):
+        detector.record(fingerprint, generation)
+    assert detector.record(10, 3) is None
+    assert detector.record(30, 4) == CycleInfo(2, 2, 4)
+    detector.reset()
+    assert detector.record(30, 5) is None
+
+
+def test_describe_cycle():
+    assert describe_cycle(CycleInfo(1, 3, 4)) == "Pola stabil (still life) sejak generasi 3"
+    assert describe_cycle(CycleInfo(2, 0, 2)) == "Pola berulang dengan periode 2 sejak generasi 0"
+
+
+# ==================== DETEKSI PADA GAME ====================
+def test_still_life_and_oscillator(engine, closing):
+    game = closing(make_game(engine, BLOCK))
+    game.enable_cycle_detection()
+    game.next_generation()
+    assert game.cycle == CycleInfo(1, 0, 1)
+    
+    game = closing(make_game(engine, BLINKER))
+    game.enable_cycle_detection()
+    game.next_generation()
+    assert game.cycle is None
+    game.next_generation()
+    assert game.cycle == CycleInfo(2, 0, 2)
+
+
+def test_fingerprint_follows_changed_cells(engine, closing):
+    game = closing(make_game(engine, random_cells("fingerprint")))
+    game.enable_cycle_detection()
+    for _ in range(8):
+        game.next_generation()
+        assert game.fingerprint == zobrist_hash(game.engine.live_cells())
+
+
+def test_manual_edit_restarts_detection(engine, closing):
+    game = closing(make_game(engine, BLOCK))
+    game.enable_cycle_detection()
+    game.next_generation()
+    assert game.cycle is not None
+    # Sel terpencil mati pada langkah berikutnya; blok tersisa dianggap pola baru
+    game.set_cell(0, 0, 1)
+    assert game.cycle is None
+    assert game.fingerprint == zobrist_hash(game.engine.live_cells())
+    game.next_generation()
+    assert game.cycle is None
+    game.next_generation()
+    assert game.cycle == CycleInfo(1, 2, 3)
+
+
+def test_detection_is_opt_in():
+    game = make_game("python", BLOCK)
+    for _ in range(3):
+        game.next_generation()
+    assert game.cycle_detector is None and game.cycle is None
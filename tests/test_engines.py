@@ -0,0 +1,303 @@
+"""Pengujian engine: setiap engine dibandingkan dengan simulasi naif per aturan dan mode batas"""
+
+import pytest
+
+from game_of_life import (BOUNDARIES, ENGINES, GameOfLife, HashLife, LifeRule, NumpyEngine,
+                          ParallelEngine)
+from game_of_life.optional import load_numpy
+from conftest import COLS, ROWS, make_game, random_cells
+
+GENERATIONS = 6
+RULE_NAMES = ("life", "highlife", "seeds", "daynight", "B0/S8")
+
+# Engine berbasis sel hidup tidak mendukung aturan B0
+LIVE_CELL_ENGINES = ("active", "sparse")
+
+# Glider bergeser satu sel diagonal (ke kanan bawah) setiap 4 generasi
+GLIDER = {(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)}
+
+
+# ==================== SIMULASI NAIF ====================
+def reference_position(position, size, boundary):
+    """Posisi papan yang dibaca tetangga di position, atau None jika selalu mati"""
+    if 0 <= position < size or boundary == "infinite":
+        return position
+    if boundary == "torus":
+        return position % size
+    if boundary == "reflect":
+        return min(max(position, 0), size - 1)
+    return None
+
+
+def reference_neighbors(cells, row, col, rows=ROWS, cols=COLS, boundary="dead"):
+    """Jumlah tetangga hidup, dibaca lewat reference_position"""
+    count = 0
+    for dr in (-1, 0, 1):
+        for dc in (-1, 0, 1):
+            if dr or dc:
+                r = reference_position(row + dr, rows, boundary)
+                c = reference_position(col + dc, cols, boundary)
+                count += r is not None and c is not None and (r, c) in cells
+    return count
+
+
+def reference_step(cells, rows=ROWS, cols=COLS, boundary="dead", rule="B3/S23"):
+    """
+    Satu generasi dengan menghitung 8 tetangga setiap sel secara langsung
+    (boundary "infinite": semesta tak terbatas, ditinjau di sekitar sel hidup saja)
+    """
+    rule = LifeRule(rule)
+    if boundary == "infinite":
+        candidates = {(row + dr, col + dc) for row, col in cells
+                      for dr in (-1, 0, 1) for dc in (-1, 0, 1)}
+    else:
+        candidates = {(row, col) for row in range(rows) for col in range(cols)}
+    result = set()
+    for row, col in candidates:
+        count = reference_neighbors(cells, row, col, rows, cols, boundary)
+        if count in (rule.survive if (row, col) in cells else rule.birth):
+            result.add((row, col))
+    return result
+
+
+# ==================== ENGINE vs SIMULASI NAIF ====================
+@pytest.mark.parametrize("rule", RULE_NAMES)
+@pytest.mark.parametrize("boundary", (None,) + BOUNDARIES)
+def test_engine_matches_reference(engine, closing, boundary, rule):
+    # boundary None: mode batas bawaan engine ("infinite" untuk sparse)
+    if engine in LIVE_CELL_ENGINES and rule == "B0/S8":
+        with pytest.raises(ValueError, match="B0"):
+            make_game(engine, rule=rule, boundary=boundary)
+        return
+    cells = random_cells(f"{boundary} {rule}")
+    game = closing(make_game(engine, cells, rule=rule, boundary=boundary))
+    assert game.boundary == boundary or boundary is None
+    for generation in range(1, GENERATIONS + 1):
+        game.next_generation()
+        cells = reference_step(cells, boundary=game.boundary, rule=rule)
+        assert set(game.engine.live_cells()) == cells, f"generasi {generation}"
+        assert game.get_population() == len(cells)
+        assert game.is_empty() == (not cells)
+    assert game.generation == GENERATIONS
+
+
+def test_edits_between_generations(engine, closing):
+    # Sel yang diubah manual harus ikut dievaluasi pada langkah berikutnya,
+    # termasuk oleh engine yang hanya meninjau ulang sekitar perubahan
+    cells = random_cells("edits")
+    game = closing(make_game(engine, cells))
+    edits = random_cells("edits 2", density=0.1)
+    for generation in range(GENERATIONS):
+        game.next_generation()
+        cells = reference_step(cells, boundary=game.boundary)
+        row, col = sorted(edits)[generation]
+        value = (row, col) not in cells
+        game.set_cell(row, col, 1 if value else 0)
+        (cells.add if value else cells.discard)((row, col))
+        assert set(game.engine.live_cells()) == cells
+        assert game.get_population() == len(cells)
+
+
+def test_still_life_and_cleared_board_stay_settled(engine, closing):
+    block = {(4, 4), (4, 5), (5, 4), (5, 5)}
+    game = closing(make_game(engine, block))
+    for _ in range(3):
+        game.next_generation()
+        assert set(game.engine.live_cells()) == block
+    game.engine.clear()
+    game.set_cell(0, 1, 1)
+    game.set_cell(1, 1, 1)
+    game.set_cell(2, 1, 1)
+    game.next_generation()
+    assert set(game.engine.live_cells()) == {(1, 0), (1, 1), (1, 2)}
+    assert game.get_population() == 3
+
+
+def test_snapshot_keeps_its_generation(engine, closing):
+    cells = random_cells("snapshot")
+    game = closing(make_game(engine, cells))
+    snapshot = game.snapshot()
+    game.next_generation()
+    game.next_generation()
+    assert {(row, col) for row in range(ROWS) for col in range(COLS)
+            if snapshot[row][col]} == cells
+
+
+def test_in_place_step_updates_held_grid():
+    cells = random_cells("in place")
+    game = make_game("python", cells)
+    grid = game.grid
+    for _ in range(3):
+        game.next_generation(in_place=True)
+        cells = reference_step(cells)
+        assert game.grid is grid
+        assert {(row, col) for row in range(ROWS) for col in range(COLS)
+                if grid[row][col]} == cells
+
+
+def test_changed_cells(engine, closing):
+    cells = random_cells("changes")
+    game = closing(make_game(engine, cells))
+    for _ in range(3):
+        game.next_generation()
+        previous, cells = cells, set(game.engine.live_cells())
+        assert sorted(game.engine.changed_cells()) == sorted(cells ^ previous)
+
+
+def test_fresh_engine_reports_no_changes(engine):
+    # Tanpa GameOfLife (yang selalu memanggil clear), engine baru harus sudah siap pakai
+    fresh = ENGINES[engine](5, 5)
+    try:
+        assert fresh.changed_cells() == []
+        assert fresh.is_empty()
+    finally:
+        if hasattr(fresh, "close"):
+            fresh.close()
+
+
+@pytest.mark.parametrize("boundary", BOUNDARIES)
+def test_count_neighbors_follows_boundary(engine, closing, boundary):
+    cells = random_cells(f"neighbors {boundary}")
+    game = closing(make_game(engine, cells, boundary=boundary))
+    for row in range(ROWS):
+        for col in range(COLS):
+            assert game.count_neighbors(row, col) == reference_neighbors(
+                cells, row, col, boundary=boundary)
+
+
+def test_bounding_box_and_view_origin(engine, closing):
+    game = closing(make_game(engine, {(row + 3, col + 4) for row, col in GLIDER}))
+    assert game.bounding_box() == (3, 4, 5, 6)
+    if game.engine.bounded:
+        assert game.view_origin() == (0, 0)
+    else:
+        # Jendela rows x cols berpusat di tengah kotak pembatas
+        assert game.view_origin() == (4 - ROWS // 2, 5 - COLS // 2)
+    game.engine.clear()
+    assert game.bounding_box() is None and game.view_origin() == (0, 0)
+
+
+@pytest.mark.parametrize("cols", (1, 2, 70))
+def test_bitset_rows_do_not_leak_across_edges(cols):
+    # Blinker tegak di kolom pertama dan terakhir: bit yang digeser keluar baris
+    # tidak boleh muncul di sisi lain atau di atas kolom terakhir
+    cells = {(row, col) for row in (1, 2, 3) for col in {0, cols - 1}}
+    game = make_game("bitset", cells, rows=5, cols=cols)
+    for _ in range(4):
+        game.next_generation()
+        cells = reference_step(cells, 5, cols)
+        assert set(game.engine.live_cells()) == cells
+
+
+def test_bitset_eight_neighbors_do_not_count_as_zero():
+    # Sel tengah blok 3x3 penuh bertetangga 8 (000 pada penjumlah 3 bit)
+    cells = {(row, col) for row in range(1, 4) for col in range(1, 4)}
+    game = make_game("bitset", cells, rows=5, cols=5)
+    game.next_generation()
+    assert game.get_cell(2, 2) == 0
+    assert set(game.engine.live_cells()) == reference_step(cells, 5, 5)
+
+
+def test_sparse_universe_follows_pattern_out_of_window():
+    game = make_game("sparse", GLIDER, rows=6, cols=6)
+    for _ in range(40):
+        game.next_generation()
+    assert set(game.engine.live_cells()) == {(row + 10, col + 10) for row, col in GLIDER}
+    assert game.bounding_box() == (10, 10, 12, 12)
+    assert game.view_origin() == (11 - 3, 11 - 3)
+    # Sel di luar jendela tetap dapat diatur dan dibaca
+    game.set_cell(-5, -5, 1)
+    assert game.get_cell(-5, -5) == 1
+    assert game.get_population() == 6
+
+
+@pytest.mark.parametrize("workers", (1, 2, 5))
+def test_parallel_strips_match_reference(workers):
+    # Batas strip berbeda untuk setiap jumlah worker; baris halo dibaca dari strip tetangga
+    cells = random_cells(f"strips {workers}")
+    engine = ParallelEngine(ROWS, COLS, workers=workers)
+    try:
+        for row, col in cells:
+            engine.set_cell(row, col, 1)
+        for _ in range(GENERATIONS):
+            engine.step()
+            cells = reference_step(cells)
+            assert set(engine.live_cells()) == cells
+    finally:
+        engine.close()
+
+
+@pytest.mark.parametrize("rule", ("life", "highlife", "daynight"))
+def test_hashlife_matches_reference(rule):
+    cells = random_cells(11, 8, 8, density=0.45)
+    universe = HashLife(8, 8, rule=rule)
+    for row, col in cells:
+        universe.set_cell(row, col, 1)
+    for generations in (1, 3, 4):
+        universe.step(generations)
+        for _ in range(generations):
+            cells = reference_step(cells, boundary="infinite", rule=rule)
+        assert set(universe.live_cells()) == cells
+        assert universe.get_population() == len(cells)
+    assert universe.generation == 8
+
+
+def test_hashlife_rejects_b0_rules():
+    with pytest.raises(ValueError, match="B0"):
+        HashLife(8, 8, rule="B0/S8")
+
+
+def test_hashlife_jumps_far_ahead():
+    universe = HashLife(8, 8)
+    for row, col in GLIDER:
+        universe.set_cell(row, col, 1)
+    assert universe.step(4 << 20) == 4 << 20
+    assert universe.bounding_box() == (1 << 20, 1 << 20, (1 << 20) + 2, (1 << 20) + 2)
+    assert universe.get_population() == 5
+
+
+class BudgetedHashLife(HashLife):
+    """HashLife yang mencatat jumlah simpul ditambah cache terbesar selama melangkah"""
+    
+    peak = 0
+    
+    def _join(self, nw, ne, sw, se):
+        node = super()._join(nw, ne, sw, se)
+        self.peak = max(self.peak, len(self._nodes) + len(self._cache))
+        return node
+
+
+def test_hashlife_budget_holds_within_one_jump():
+    cells = random_cells(5, 10, 10, density=0.45)
+    bounded, free = BudgetedHashLife(10, 10, max_nodes=2000), HashLife(10, 10)
+    for row, col in cells:
+        bounded.set_cell(row, col, 1)
+        free.set_cell(row, col, 1)
+    # Satu lompatan 2^7 generasi; tanpa batas simpul dan cache tumbuh jauh melebihi 2000
+    bounded.step(128)
+    free.step(128)
+    assert len(free._nodes) + len(free._cache) > 4 * 2000
+    assert bounded.peak <= 2000 + 64
+    assert set(bounded.live_cells()) == set(free.live_cells())
+
+
+def test_unknown_boundary_is_rejected():
+    with pytest.raises(ValueError, match="Mode batas tidak dikenal"):
+        GameOfLife(ROWS, COLS, boundary="mobius")
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError, match="Engine tidak dikenal"):
+        GameOfLife(ROWS, COLS, engine="fortran")
+
+
+@pytest.mark.skipif(load_numpy() is not None, reason="NumPy terpasang")
+def test_numpy_engine_requires_numpy():
+    with pytest.raises(ImportError, match="membutuhkan paket numpy"):
+        GameOfLife(ROWS, COLS, engine="numpy")
+
+
+@pytest.mark.skipif(load_numpy() is None, reason="NumPy tidak terpasang")
+def test_fresh_numpy_engine_is_empty():
+    fresh = NumpyEngine(5, 7)
+    assert fresh.is_empty() and fresh.population() == 0
@@ -0,0 +1,58 @@
+"""Pengujian ensemble papan acak: reproduksi seed dan kesamaan dengan GameOfLife"""
+
+import random
+
+import pytest
+
+from game_of_life import BOUNDARIES, GameOfLife, setup_pattern
+from game_of_life.ensemble import random_board, run_ensemble
+
+SEEDS = [0, 1, 2, 7, 42]
+
+
+def population_series(rows, cols, seed, generations, rule="B3/S23", boundary="dead"):
+    """Deret populasi satu papan pola "random" yang dijalankan dengan GameOfLife"""
+    game = GameOfLife(rows, cols, rule=rule, boundary=boundary)
+    setup_pattern(game, "random", random.Random(seed))
+    series = [game.get_population()]
+    for _ in range(generations):
+        game.next_generation()
+        series.append(game.get_population())
+    return series
+
+
+def test_random_board_matches_setup_pattern():
+    for seed in SEEDS:
+        game = setup_pattern(GameOfLife(9, 14), "random", random.Random(seed))
+        board = random_board(9, 14, seed)
+        assert [[game.get_cell(row, col) for col in range(14)] for row in range(9)] == [
+            list(line) for line in board]
+
+
+@pytest.mark.parametrize("boundary", BOUNDARIES)
+@pytest.mark.parametrize("rule", ("life", "highlife", "B0/S8"))
+def test_populations_match_game_of_life(rule, boundary):
+    result = run_ensemble(9, 14, SEEDS, 12, rule=rule, boundary=boundary)
+    assert result.seeds == SEEDS
+    assert result.populations == [population_series(9, 14, seed, 12, rule, boundary)
+                                   for seed in SEEDS]
+
+
+def test_extinction_generations():
+    # Papan 3x3 sering punah dalam beberapa generasi
+    seeds = list(range(20))
+    result = run_ensemble(3, 3, seeds, 6)
+    expected = [next((generation for generation, population in enumerate(series)
+                      if population == 0), None)
+                for series in (population_series(3, 3, seed, 6) for seed in seeds)]
+    assert result.extinction_generations == expected
+    assert any(generation is not None for generation in expected)
+    assert any(generation is None for generation in expected)
+
+
+def test_seeds_are_reproducible_across_chunks():
+    single = run_ensemble(8, 8, SEEDS, 10)
+    # chunk_size kecil: papan dibagi ke beberapa proses tetapi urutannya tetap
+    chunked = run_ensemble(8, 8, SEEDS, 10, workers=2, chunk_size=2)
+    assert chunked == single
+    assert run_ensemble(8, 8, SEEDS, 10) == single
@@ -0,0 +1,100 @@
+"""Pengujian baca/tulis file pola RLE dan plaintext"""
+
+import io
+
+import pytest
+
+from game_of_life import load_pattern_file, save_pattern_file, write_plaintext
+from game_of_life.fileio import RLEReader, iter_plaintext_cells
+from conftest import make_game, random_cells
+
+GLIDER_RLE = "#N Glider\n#C komentar\nx = 3, y = 3, rule = B3/S23\nbo$2bo$3o!\n"
+GLIDER = {(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)}
+
+
+# ==================== PEMBACA RLE ====================
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 16])
+def test_rle_reader_streams_in_chunks(chunk_size):
+    reader = RLEReader(io.StringIO(GLIDER_RLE), chunk_size=chunk_size)
+    assert reader.comments == ["#N Glider", "#C komentar"]
+    assert (reader.width, reader.height, reader.rule) == (3, 3, "B3/S23")
+    assert set(reader.cells()) == GLIDER
+
+
+def test_rle_reader_counts_span_chunks_and_lines():
+    # Angka 12 terpotong di antara dua chunk dan pola dibungkus ke baris baru
+    reader = RLEReader(io.StringIO("x = 14, y = 3\n12o\n2$b2o!"), chunk_size=1)
+    assert list(reader.runs()) == [(0, 0, 12), (2, 1, 2)]
+
+
+def test_rle_reader_without_header():
+    reader = RLEReader(io.StringIO("2o$2o!"))
+    assert reader.width is None
+    assert set(reader.cells()) == {(0, 0), (0, 1), (1, 0), (1, 1)}
+
+
+def test_rle_reader_stops_at_terminator():
+    reader = RLEReader(io.StringIO("x = 1, y = 1\no!3o"))
+    assert list(reader.cells()) == [(0, 0)]
+
+
+def test_rle_reader_rejects_unknown_characters():
+    reader = RLEReader(io.StringIO("x = 2, y = 1\no?!"))
+    with pytest.raises(ValueError, match="Format RLE tidak valid"):
+        list(reader.cells())
+
+
+def test_plaintext_skips_comment_lines():
+    stream = io.StringIO("!Name: Glider\n.O\n..O\nOOO\n")
+    assert set(iter_plaintext_cells(stream)) == GLIDER
+
+
+# ==================== MUAT & SIMPAN ====================
+def test_rle_file_is_centered_by_default(tmp_path):
+    path = tmp_path / "glider.rle"
+    path.write_text(GLIDER_RLE)
+    game = load_pattern_file(make_game(), str(path))
+    # Grid 11x13, pola 3x3: pojok kiri atas di (4, 5)
+    assert set(game.engine.live_cells()) == {(row + 4, col + 5) for row, col in GLIDER}
+
+
+def test_plaintext_file_defaults_to_origin(tmp_path):
+    path = tmp_path / "glider.cells"
+    path.write_text("!Name: Glider\n.O\n..O\nOOO\n")
+    game = load_pattern_file(make_game(), str(path), left=2)
+    assert set(game.engine.live_cells()) == {(row, col + 2) for row, col in GLIDER}
+
+
+def test_cells_outside_the_grid_are_ignored(tmp_path):
+    path = tmp_path / "glider.rle"
+    path.write_text(GLIDER_RLE)
+    game = load_pattern_file(make_game(engine="python"), str(path), top=9, left=11)
+    assert set(game.engine.live_cells()) == {(9, 12)}
+
+
+@pytest.mark.parametrize("suffix", [".rle", ".cells"])
+def test_round_trip(engine, closing, tmp_path, suffix):
+    cells = random_cells("fileio")
+    path = str(tmp_path / f"pattern{suffix}")
+    save_pattern_file(closing(make_game(engine, cells)), path)
+    # Pola disimpan relatif terhadap kotak pembatasnya
+    top = min(row for row, _ in cells)
+    left = min(col for _, col in cells)
+    loaded = load_pattern_file(closing(make_game(engine)), path, top=top, left=left)
+    assert set(loaded.engine.live_cells()) == cells
+
+
+def test_rle_lines_are_wrapped(tmp_path):
+    cells = {(row, col) for row in range(0, 11, 2) for col in range(0, 13, 2)}
+    path = tmp_path / "dots.rle"
+    save_pattern_file(make_game(cells=cells), str(path))
+    lines = path.read_text().splitlines()
+    assert lines[0].startswith("x = 13, y = 11")
+    assert all(len(line) <= 70 for line in lines[1:])
+    assert len(lines) > 2
+
+
+def test_plaintext_name_header(tmp_path):
+    path = tmp_path / "glider.cells"
+    write_plaintext(make_game(cells=GLIDER), str(path), name="Glider")
+    assert path.read_text() == "!Name: Glider\n.O\n..O\nOOO\n"
@@ -0,0 +1,80 @@
+"""Pengujian riwayat generasi (keyframe + delta XOR), goto_generation, dan step_back"""
+
+import pytest
+
+from game_of_life import GenerationHistory
+from conftest import make_game, random_cells
+
+
+def run_recorded(game, generations):
+    """Melangkahkan game dan mengembalikan sel hidup setiap generasi (indeks = generasi)"""
+    states = [set(game.engine.live_cells())]
+    for _ in range(generations):
+        game.next_generation()
+        states.append(set(game.engine.live_cells()))
+    return states
+
+
+def test_goto_every_recorded_generation(engine, closing):
+    game = closing(make_game(engine, random_cells("history")))
+    game.enable_history(capacity=64, keyframe_interval=4)
+    states = run_recorded(game, 12)
+    assert game.history.packed == hasattr(game.engine, "packed_rows")
+    for generation in (5, 0, 12, 7, 8, 3):
+        game.goto_generation(generation)
+        assert game.generation == generation
+        assert set(game.engine.live_cells()) == states[generation]
+
+
+def test_step_back_until_history_runs_out(engine, closing):
+    game = closing(make_game(engine, random_cells("history")))
+    game.enable_history(capacity=4, keyframe_interval=3)
+    states = run_recorded(game, 9)
+    for generation in (8, 7, 6):
+        assert game.step_back()
+        assert set(game.engine.live_cells()) == states[generation]
+    assert not game.step_back()
+    assert game.generation == 6
+
+
+def test_capacity_smaller_than_keyframe_interval():
+    game = make_game(cells=random_cells("history"))
+    game.enable_history(capacity=5, keyframe_interval=32)
+    states = run_recorded(game, 20)
+    history = game.history
+    assert len(history) == 5
+    assert (history.first_generation(), history.last_generation()) == (16, 20)
+    # Entri tertua dibangun ulang menjadi keyframe saat entri sebelumnya dibuang
+    assert history.entries[0].keyframe
+    for generation in range(16, 21):
+        assert history.state_at(generation) == states[generation]
+    with pytest.raises(IndexError):
+        history.state_at(15)
+
+
+def test_stepping_after_rewind_drops_the_old_branch(engine, closing):
+    game = closing(make_game(engine, random_cells("history")))
+    game.enable_history(capacity=64, keyframe_interval=4)
+    run_recorded(game, 6)
+    game.goto_generation(2)
+    game.set_cell(0, 0, 1 - game.get_cell(0, 0))
+    edited = set(game.engine.live_cells())
+    game.next_generation()
+    assert game.history.last_generation() == 3
+    game.goto_generation(2)
+    # Perubahan manual tersimpan sebagai keyframe baru generasi 2
+    assert set(game.engine.live_cells()) == edited
+
+
+def test_history_is_opt_in():
+    game = make_game(cells=random_cells("history"))
+    game.next_generation()
+    assert not game.step_back()
+    with pytest.raises(ValueError, match="Riwayat generasi belum diaktifkan"):
+        game.goto_generation(0)
+
+
+@pytest.mark.parametrize("capacity, keyframe_interval", [(0, 4), (4, 0)])
+def test_invalid_sizes_are_rejected(capacity, keyframe_interval):
+    with pytest.raises(ValueError):
+        GenerationHistory(capacity, keyframe_interval)
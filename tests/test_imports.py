@@ -0,0 +1,26 @@
+"""Pengujian jalur impor: modul mahal hanya dimuat saat benar-benar dipakai"""
+
+import os
+import sys
+import subprocess
+
+from game_of_life.bench import HEAVY_MODULES, measure_import_time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_modules(statement):
+    """Modul yang termuat setelah statement dijalankan di interpreter baru"""
+    code = f"import sys\n{statement}\nprint(' '.join(sys.modules))"
+    return set(subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True,
+                              capture_output=True, text=True).stdout.split())
+
+
+def test_engine_only_import_skips_heavy_modules():
+    assert measure_import_time(repeat=1)["heavy_modules"] == []
+
+
+def test_cli_import_skips_gui_and_benchmark():
+    modules = loaded_modules("import game_of_life.cli")
+    assert not modules & set(HEAVY_MODULES)
+    assert not modules & {"game_of_life.gui", "game_of_life.bench", "tracemalloc"}
@@ -0,0 +1,100 @@
+"""Pengujian profiler fase: pencatatan, ringkasan, dan file pstats"""
+
+import pstats
+
+import pytest
+
+from game_of_life import PROFILER, Profiler
+from conftest import make_game, random_cells
+
+
+@pytest.fixture
+def profiler():
+    """PROFILER bersama dalam keadaan bersih, dimatikan lagi setelah pengujian"""
+    PROFILER.reset()
+    yield PROFILER
+    PROFILER.disable()
+    PROFILER.reset()
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler()
+    first, second = profiler.phase("step"), profiler.phase("render")
+    assert first is second
+    with first:
+        pass
+    assert profiler.phases == {}
+    assert profiler.summary() == "Profiler belum mencatat apa pun"
+
+
+def test_record_keeps_calls_total_and_max():
+    profiler = Profiler()
+    for seconds in (0.25, 1.0, 0.5):
+        profiler.record("step", seconds)
+    assert profiler.phases == {"step": [3, 1.75, 1.0]}
+
+
+def test_toggle():
+    profiler = Profiler()
+    assert profiler.toggle() is True
+    with profiler.phase("step"):
+        pass
+    assert profiler.toggle() is False
+    with profiler.phase("step"):
+        pass
+    assert profiler.phases["step"][0] == 1
+
+
+def test_game_loop_phases(profiler):
+    game = make_game(cells=random_cells("profiler"))
+    game.enable_stats()
+    profiler.enable()
+    for _ in range(3):
+        game.next_generation()
+        game.get_population()
+    assert profiler.phases["step"][0] == 3
+    assert profiler.phases["stats"][0] == 3
+    # Populasi sudah dihitung oleh statistik sehingga tidak dihitung ulang
+    assert "population" not in profiler.phases
+    game.stats = None
+    game.next_generation()
+    game.get_population()
+    game.get_population()
+    assert profiler.phases["population"][0] == 1
+
+
+def test_summary_is_sorted_by_total():
+    profiler = Profiler()
+    profiler.record("render", 0.5)
+    profiler.record("step", 1.5)
+    lines = profiler.summary().splitlines()
+    assert lines[0].split() == ["fase", "panggilan", "total", "(s)", "rata2", "(ms)",
+                                "maks", "(ms)", "porsi"]
+    assert [line.split()[0] for line in lines[1:]] == ["step", "render"]
+    assert lines[1].split()[-1] == "75.0%"
+
+
+def test_dump_stats_is_readable_by_pstats(tmp_path):
+    profiler = Profiler()
+    profiler.record("step", 0.5)
+    profiler.record("step", 0.25)
+    path = str(tmp_path / "phases.prof")
+    profiler.dump_stats(path)
+    stats = pstats.Stats(path).stats
+    assert stats[("<fase>", 0, "step")][:4] == (2, 2, 0.75, 0.75)
+
+
+def test_dump_stats_keeps_the_trace_running(tmp_path):
+    profiler = Profiler()
+    profiler.enable(trace=True)
+    try:
+        make_game(cells=random_cells("trace")).next_generation()
+        profiler.dump_stats(str(tmp_path / "first.prof"))
+        # Trace tetap berjalan setelah dump, juga setelah reset
+        profiler.reset()
+        make_game(cells=random_cells("trace")).next_generation()
+        profiler.dump_stats(str(tmp_path / "second.prof"))
+    finally:
+        profiler.disable()
+    names = {name for _, _, name in pstats.Stats(str(tmp_path / "second.prof")).stats}
+    assert "next_generation" in names
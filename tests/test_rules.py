@@ -0,0 +1,69 @@
+"""Pengujian aturan life-like: notasi B/S, tabel lookup, dan penyimpanannya"""
+
+import pytest
+
+from game_of_life import RULES, LifeRule, load_checkpoint, parse_rule, save_checkpoint, write_rle
+from conftest import make_game
+
+
+@pytest.mark.parametrize("notation, birth, survive", [
+    ("B3/S23", {3}, {2, 3}),
+    ("b36/s23", {3, 6}, {2, 3}),
+    (" highlife ", {3, 6}, {2, 3}),
+    ("seeds", {2}, set()),
+    ("23/3", {3}, {2, 3}),
+    ("S23/B3", {3}, {2, 3}),
+    ("B0/S8", {0}, {8}),
+])
+def test_notation_is_parsed(notation, birth, survive):
+    rule = LifeRule(notation)
+    assert (rule.birth, rule.survive) == (birth, survive)
+
+
+def test_table_is_indexed_by_state_and_neighbors():
+    table = LifeRule("B36/S23").table
+    assert len(table) == 18
+    assert [n for n in range(9) if table[n]] == [3, 6]
+    assert [n for n in range(9) if table[9 + n]] == [2, 3]
+
+
+def test_presets_and_canonical_notation():
+    for name, notation in RULES.items():
+        assert LifeRule(name).notation == notation
+    rule = LifeRule("s32/b63")
+    assert str(rule) == "B36/S23"
+    assert repr(rule) == "LifeRule('B36/S23')"
+    assert rule == LifeRule("highlife") and hash(rule) == hash(LifeRule("highlife"))
+    assert rule != LifeRule("life")
+
+
+def test_parse_rule_accepts_none_names_and_rules():
+    rule = LifeRule("daynight")
+    assert parse_rule(rule) is rule
+    assert parse_rule(None) == LifeRule("B3/S23")
+    assert parse_rule("life") == LifeRule()
+
+
+@pytest.mark.parametrize("notation, message", [
+    ("B3S23", "Notasi aturan tidak valid"),
+    ("B3/S2/3", "Notasi aturan tidak valid"),
+    ("Bx/S23", "Notasi aturan tidak valid"),
+    ("conway", "Notasi aturan tidak valid"),
+    ("B9/S23", "Jumlah tetangga harus 0-8"),
+])
+def test_bad_notation_is_rejected(notation, message):
+    with pytest.raises(ValueError, match=message):
+        LifeRule(notation)
+    with pytest.raises(ValueError, match=message):
+        make_game(rule=notation)
+
+
+def test_rule_is_stored_in_checkpoints_and_rle(tmp_path):
+    game = make_game("bitset", {(1, 1), (1, 2), (1, 3)}, rule="highlife")
+    path = str(tmp_path / "board.ckpt")
+    save_checkpoint(game, path)
+    assert load_checkpoint(path).rule == LifeRule("highlife")
+    
+    write_rle(game, str(tmp_path / "board.rle"))
+    assert (tmp_path / "board.rle").read_text().splitlines()[0] == (
+        "x = 3, y = 1, rule = B36/S23")
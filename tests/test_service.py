@@ -0,0 +1,185 @@
+"""Pengujian layanan asyncio: SimulationSession, FrameStream, dan SessionServer"""
+
+import json
+import asyncio
+
+from game_of_life import GameOfLife, setup_pattern
+from game_of_life.service import SessionServer, SimulationSession
+
+
+def blinker_session(**options):
+    """Sesi dengan blinker (tidak pernah punah, tidak berhenti sendiri)"""
+    return SimulationSession(setup_pattern(GameOfLife(20, 20), "oscillator"), **options)
+
+
+def run(coroutine, timeout=10.0):
+    """Menjalankan coroutine pengujian dengan batas waktu agar deadlock menjadi kegagalan"""
+    return asyncio.run(asyncio.wait_for(coroutine, timeout))
+
+
+def test_subscriber_receives_every_frame_until_finished():
+    async def scenario():
+        session = blinker_session(max_generations=5)
+        frames = session.subscribe()
+        session.start()
+        received = [frame async for frame in frames]
+        await session.wait()
+        return session, received
+    
+    session, received = run(scenario())
+    assert [frame.generation for frame in received] == list(range(6))
+    assert received[-1].status == "Selesai setelah 5 generasi"
+    assert all(frame.population == 3 for frame in received)
+    assert session.steps == 5 and not session.running
+    # Statistik hanya dinyalakan selama sesi berjalan
+    assert session.game.stats is None
+
+
+def test_closed_subscriber_stops_receiving():
+    async def scenario():
+        session = blinker_session(max_generations=20)
+        frames = session.subscribe()
+        session.start()
+        async with frames:
+            first = await frames.__anext__()
+        await session.wait()
+        return session, frames, first
+    
+    session, frames, first = run(scenario())
+    assert first.generation == 0
+    assert frames.closed
+    assert session.steps == 20
+
+
+def test_closing_full_backpressure_stream_releases_session():
+    """Regresi: subscriber yang ditutup saat antreannya penuh tidak boleh menahan sesi"""
+    async def scenario():
+        session = blinker_session(max_generations=50)
+        frames = session.subscribe(maxsize=2)
+        watcher = session.subscribe(drop_oldest=True)
+        session.start()
+        async with frames:
+            await frames.__anext__()
+            # Sesi tertahan menunggu tempat di antrean yang penuh
+            await asyncio.sleep(0.3)
+            assert session.steps <= 3
+        await session.wait()
+        return session, [frame async for frame in watcher]
+    
+    session, watched = run(scenario(), timeout=5.0)
+    assert session.steps == 50
+    assert watched[-1].generation == 50
+
+
+def test_backpressure_limits_session_to_slowest_subscriber():
+    async def scenario():
+        session = blinker_session(max_generations=30)
+        frames = session.subscribe(maxsize=2)
+        session.start()
+        await asyncio.sleep(0.2)
+        held = session.steps
+        received = [frame async for frame in frames]
+        await session.wait()
+        return held, received
+    
+    held, received = run(scenario())
+    # Antrean 2 frame, satu frame tertahan di put, satu langkah sedang dikerjakan
+    assert held <= 4
+    assert [frame.generation for frame in received] == list(range(31))
+
+
+def test_drop_oldest_subscriber_never_blocks_session():
+    async def scenario():
+        session = blinker_session(max_generations=40)
+        frames = session.subscribe(maxsize=3, drop_oldest=True)
+        session.start()
+        await session.wait()
+        return session, frames, [frame async for frame in frames]
+    
+    session, frames, received = run(scenario())
+    assert session.steps == 40
+    assert frames.dropped == 41 - 3
+    assert [frame.generation for frame in received] == [38, 39, 40]
+
+
+def test_pause_resume_and_stop():
+    async def scenario():
+        session = blinker_session(interval=0.01)
+        frames = session.subscribe(drop_oldest=True)
+        session.start()
+        await asyncio.sleep(0.05)
+        session.pause()
+        await asyncio.sleep(0.05)
+        paused_at = session.steps
+        await asyncio.sleep(0.1)
+        still = session.steps
+        session.resume()
+        await asyncio.sleep(0.05)
+        resumed = session.steps
+        last = await session.stop()
+        return session, paused_at, still, resumed, last, [frame async for frame in frames]
+    
+    session, paused_at, still, resumed, last, received = run(scenario())
+    assert paused_at == still
+    assert resumed > still
+    assert last.status == "Simulasi dihentikan"
+    assert received[-1].status == "Simulasi dihentikan"
+    assert not session.running
+
+
+async def http_request(port, method, path):
+    """Mengirim satu request HTTP lalu membaca respons sampai koneksi ditutup"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return head.split(b"\r\n")[0].decode(), body
+
+
+def test_server_streams_frames_and_drains_on_close():
+    async def scenario():
+        session = blinker_session(interval=0.01, max_generations=10)
+        server = SessionServer(session, port=0)
+        await server.start()
+        # Klien terhubung sebelum sesi dimulai sehingga menerima semua frame
+        stream = asyncio.get_running_loop().create_task(
+            http_request(server.port, "GET", "/stream"))
+        while not server.clients:
+            await asyncio.sleep(0.01)
+        session.start()
+        status_line, status = await http_request(server.port, "GET", "/status")
+        await session.wait()
+        await server.close()
+        return server, status_line, json.loads(status), await stream
+    
+    server, status_line, status, (stream_line, body) = run(scenario())
+    assert status_line == "HTTP/1.1 200 OK"
+    assert status["clients"] == 1
+    assert stream_line == "HTTP/1.1 200 OK"
+    lines = [json.loads(line) for line in body.decode().splitlines()]
+    assert [line["generation"] for line in lines] == list(range(11))
+    assert lines[-1]["status"] == "Selesai setelah 10 generasi"
+    assert server.clients == []
+
+
+def test_server_pause_and_stop_requests():
+    async def scenario():
+        session = blinker_session(interval=0.01)
+        server = SessionServer(session, port=0)
+        await server.start()
+        session.start()
+        _, paused = await http_request(server.port, "POST", "/pause")
+        _, resumed = await http_request(server.port, "POST", "/resume")
+        _, stopped = await http_request(server.port, "POST", "/stop")
+        last = await session.wait()
+        missing, _ = await http_request(server.port, "GET", "/missing")
+        await server.close()
+        return json.loads(paused), json.loads(resumed), json.loads(stopped), last, missing
+    
+    paused, resumed, stopped, last, missing = run(scenario())
+    assert paused["paused"] and not resumed["paused"]
+    assert stopped["running"]
+    assert last.status == "Simulasi dihentikan"
+    assert missing == "HTTP/1.1 404 Not Found"
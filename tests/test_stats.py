@@ -0,0 +1,89 @@
+"""Pengujian statistik per generasi terhadap pemindaian ulang papan"""
+
+import random
+
+import pytest
+
+from game_of_life import StatsStream
+from conftest import make_game, random_cells
+
+
+def scanned_box(cells):
+    """Kotak pembatas dari daftar sel hidup (None jika kosong)"""
+    if not cells:
+        return None
+    rows = [row for row, _ in cells]
+    cols = [col for _, col in cells]
+    return min(rows), min(cols), max(rows), max(cols)
+
+
+def soup():
+    """Sel acak di bagian dalam papan 24 x 32"""
+    rng = random.Random(7)
+    return {(row, col) for row in range(4, 16) for col in range(6, 20) if rng.random() < 0.35}
+
+
+@pytest.mark.parametrize("boundary", ["dead", "torus"])
+def test_stats_match_full_rescan(engine, closing, boundary):
+    game = closing(make_game(engine, soup(), rows=24, cols=32, boundary=boundary))
+    stream = game.enable_stats()
+    published = []
+    stream.subscribe(published.append)
+    previous = set(game.engine.live_cells())
+    for generation in range(1, 61):
+        game.next_generation()
+        current = set(game.engine.live_cells())
+        stats = published[-1]
+        assert stats.generation == generation
+        assert stats.population == len(current)
+        assert (stats.births, stats.deaths) == (len(current - previous),
+                                                len(previous - current))
+        assert stats.bounding_box == scanned_box(current)
+        previous = current
+
+
+def test_step_counts_match_live_cells(engine, closing):
+    game = closing(make_game(engine, random_cells("step counts")))
+    if not hasattr(game.engine, "step_counts"):
+        pytest.skip(f"engine {engine} tidak menyediakan step_counts")
+    previous = set(game.engine.live_cells())
+    for _ in range(5):
+        game.next_generation()
+        current = set(game.engine.live_cells())
+        assert game.engine.step_counts() == (len(current - previous), len(previous - current))
+        previous = current
+
+
+def test_manual_edit_resets_running_totals():
+    game = make_game("bitset", [(4, 4), (4, 5), (4, 6)], rows=10, cols=10)
+    game.enable_stats()
+    game.next_generation()
+    game.set_cell(0, 0, 1)
+    game.next_generation()
+    assert game.stats.latest.population == 3
+    assert game.stats.latest.bounding_box == (4, 4, 4, 6)
+
+
+@pytest.mark.parametrize("engine", ["python", "sparse"])
+def test_without_bounding_box(engine):
+    game = make_game(engine, [(4, 4), (4, 5), (4, 6)], rows=10, cols=10)
+    game.stats = StatsStream(track_bounding_box=False)
+    game.next_generation()
+    assert game.stats.latest.bounding_box is None
+    assert game.stats.latest.births == 2 and game.stats.latest.deaths == 2
+
+
+@pytest.mark.parametrize("engine", ["python", "bitset", "active", "sparse"])
+def test_interior_changes_do_not_rescan_board(engine):
+    # Dua blok di pojok kotak pembatas dan blinker di bagian dalamnya
+    game = make_game(engine, [(0, 0), (0, 1), (1, 0), (1, 1), (20, 28), (20, 29), (21, 28),
+                              (21, 29), (10, 10), (10, 11), (10, 12)], rows=24, cols=32)
+    game.enable_stats()
+    game.next_generation()
+    scans = []
+    scan = game.bounding_box
+    game.bounding_box = lambda: scans.append(1) or scan()
+    for _ in range(10):
+        game.next_generation()
+    assert game.stats.latest.bounding_box == (0, 0, 21, 29)
+    assert scans == []